@@ -7,18 +7,22 @@ import re
 from getpass import getpass
 
 import sys
+import yaml
 sys.path.insert(0, "/root/netapp-dataops-toolkit/netapp_dataops_traditional/netapp_dataops")
 
 from netapp_dataops import traditional
 from netapp_dataops.traditional import (
     clone_volume,
+    clone_volumes,
     InvalidConfigError,
     InvalidVolumeParameterError,
     InvalidSnapMirrorParameterError,
     InvalidSnapshotParameterError,
     APIConnectionError,
     mount_volume,
+    mount_volumes,
     unmount_volume,
+    unmount_volumes,
     MountOperationError,
     ConnectionTypeError,
     list_volumes,
@@ -26,11 +30,14 @@ from netapp_dataops.traditional import (
     create_volume,
     delete_snapshot,
     delete_volume,
+    generate_automount_map,
     list_cloud_sync_relationships,
+    list_mount_profiles,
     list_snap_mirror_relationships,
     create_snap_mirror_relationship,
     list_snapshots,
     prepopulate_flex_cache,
+    prune_snapshots,
     pull_bucket_from_s3,
     pull_object_from_s3,
     push_directory_to_s3,
@@ -38,7 +45,9 @@ from netapp_dataops.traditional import (
     restore_snapshot,
     CloudSyncSyncOperationError,
     sync_cloud_sync_relationship,
+    sync_cloud_sync_relationships,
     sync_snap_mirror_relationship,
+    sync_snap_mirror_relationships,
     SnapMirrorSyncOperationError
 )
 
@@ -57,11 +66,16 @@ Data Volume Management Commands:
 Note: To view details regarding options/arguments for a specific command, run the command with the '-h' or '--help' option.
 
 \tclone volume\t\t\tCreate a new data volume that is an exact copy of an existing volume.
+\tclone volumes\t\t\tCreate many clone volumes concurrently, as described in a file.
 \tcreate volume\t\t\tCreate a new data volume.
 \tdelete volume\t\t\tDelete an existing data volume.
 \tlist volumes\t\t\tList all data volumes.
+\tlist mount-profiles\t\tList the NFS mount profiles that can be used when mounting data volumes.
 \tmount volume\t\t\tMount an existing data volume locally. Note: on Linux hosts - must be run as root.
+\tmount volumes\t\t\tMount many existing data volumes locally, concurrently. Note: on Linux hosts - must be run as root.
 \tunmount volume\t\t\tUnmount an existing data volume. Note: on Linux hosts - must be run as root.
+\tunmount volumes\t\t\tUnmount many data volumes, concurrently. Note: on Linux hosts - must be run as root.
+\tgenerate automount-map\t\tGenerate an autofs map (or systemd automount units) for mounting volumes on demand.
 
 Snapshot Management Commands:
 Note: To view details regarding options/arguments for a specific command, run the command with the '-h' or '--help' option.
@@ -69,6 +83,7 @@ Note: To view details regarding options/arguments for a specific command, run th
 \tcreate snapshot\t\t\tCreate a new snapshot for a data volume.
 \tdelete snapshot\t\t\tDelete an existing snapshot for a data volume.
 \tlist snapshots\t\t\tList all snapshots for a data volume.
+\tprune snapshots\t\t\tDelete snapshots exceeding a retention policy for one or more data volumes.
 \trestore snapshot\t\tRestore a snapshot for a data volume (restore the volume to its exact state at the time that the snapshot was created).
 
 Data Fabric Commands:
@@ -76,6 +91,7 @@ Note: To view details regarding options/arguments for a specific command, run th
 
 \tlist cloud-sync-relationships\tList all existing Cloud Sync relationships.
 \tsync cloud-sync-relationship\tTrigger a sync operation for an existing Cloud Sync relationship.
+\tsync cloud-sync-relationships\tTrigger sync operations for many existing Cloud Sync relationships and wait for all of them.
 \tpull-from-s3 bucket\t\tPull the contents of a bucket from S3.
 \tpull-from-s3 object\t\tPull an object from S3.
 \tpush-to-s3 directory\t\tPush the contents of a directory to S3 (multithreaded).
@@ -87,6 +103,7 @@ Note: To view details regarding options/arguments for a specific command, run th
 \tprepopulate flexcache\t\tPrepopulate specific files/directories on a FlexCache volume (ONTAP 9.8 and above ONLY).
 \tlist snapmirror-relationships\tList all existing SnapMirror relationships.
 \tsync snapmirror-relationship\tTrigger a sync operation for an existing SnapMirror relationship.
+\tsync snapmirror-relationships\tTrigger sync operations for many existing SnapMirror relationships and wait for all of them.
 \tcreate snapmirror-relationship\tCreate new SnapMirror relationship.
 '''
 helpTextCloneVolume = '''
@@ -109,6 +126,7 @@ Optional Options/Arguments:
 \t\t\t\twhen snapshot name suffixed with * the latest snapshot will be used (hourly* will use the latest snapshot prefixed with hourly )
 \t-u, --uid=\t\tUnix filesystem user id (uid) to apply when creating new volume (if not specified, uid of source volume will be retained) (Note: cannot apply uid of '0' when creating clone).
 \t-x, --readonly\t\tRead-only option for mounting volumes locally.
+\t-o, --mount-profile=\tNFS mount profile to use when mounting new volume locally (ex. 'training-read'). Run 'list mount-profiles' to view available profiles.
 \t-j, --junction\t\tSpecify a custom junction path for the volume to be exported at.
 \t-e, --export-hosts\tcolon(:) seperated hosts/cidrs to to use for export. hosts will be exported for rw and root access
 \t-e, --export-policy\texport policy name to attach to the volume, default policy will be used if export-hosts/export-policy not provided
@@ -127,6 +145,31 @@ Examples (advanced usage):
 \tnetapp_dataops_cli.py clone volume -n testvol -v gold_dataset -u 1000 -g 1000 -x -j /project1 -d snappolicy1
 \tnetapp_dataops_cli.py clone volume --name=project1 --source-volume=gold_dataset --source-svm=svm1 --target-svm=svm2 --source-snapshot=daily* --export-hosts 10.5.5.3:host1:10.6.4.0/24 --split
 '''
+helpTextCloneVolumes = '''
+Command: clone volumes
+
+Create many new data volumes that are exact copies of existing volumes, submitting clone jobs concurrently. A failed clone does not abort the batch.
+
+Required Options/Arguments:
+\t-f, --from-file=\tJSON or YAML file containing a list of clones. Each entry accepts the following keys:
+\t\t\t\tnew_volume_name, source_volume_name (required), source_snapshot_name, source_svm, target_svm, export_hosts, export_policy,
+\t\t\t\tsnapshot_policy, split, unix_uid, unix_gid, junction, svm_dr_unprotect, mountpoint, readonly, mount_profile
+
+Optional Options/Arguments:
+\t-l, --cluster-name=\tnon default hosting cluster
+\t-h, --help\t\tPrint help text.
+\t-w, --workers=\t\tMaximum number of clone jobs outstanding at a time (default: 8).
+
+Examples:
+\tnetapp_dataops_cli.py clone volumes --from-file=clones.json
+\tnetapp_dataops_cli.py clone volumes -f clones.yaml -w 16
+
+Example file (clones.json):
+\t[
+\t    {"new_volume_name": "user1_ws", "source_volume_name": "gold_dataset", "source_snapshot_name": "snap1"},
+\t    {"new_volume_name": "user2_ws", "source_volume_name": "gold_dataset", "source_snapshot_name": "snap1", "export_hosts": "10.5.5.3"}
+\t]
+'''
 helpTextConfig = '''
 Command: config
 
@@ -181,6 +224,7 @@ Optional Options/Arguments:
 \t-t, --type=\t\tVolume type to use when creating new volume (flexgroup/flexvol).
 \t-u, --uid=\t\tUnix filesystem user id (uid) to apply when creating new volume (ex. '0' for root user).
 \t-x, --readonly\t\tRead-only option for mounting volumes locally.
+\t-o, --mount-profile=\tNFS mount profile to use when mounting new volume locally (ex. 'checkpoint-write'). Run 'list mount-profiles' to view available profiles.
 \t-j, --junction\t\tSpecify a custom junction path for the volume to be exported at.
 \t-f, --tiering-policy\tSpecify tiering policy for fabric-pool enabled systems (default is 'none').
 \t-y, --dp\t\tCreate volume as DP volume (the volume will be used as snapmirror target)
@@ -194,6 +238,7 @@ Examples (basic usage):
 Examples (advanced usage):
 \tsudo -E netapp_dataops_cli.py create volume --name=project1 --size=10GB --permissions=0755 --type=flexvol --mountpoint=~/project1 --readonly --junction=/project1
 \tsudo -E netapp_dataops_cli.py create volume --name=project2_flexgroup --size=2TB --type=flexgroup --mountpoint=/mnt/project2
+\tsudo -E netapp_dataops_cli.py create volume --name=checkpoints --size=10TB --type=flexgroup --mountpoint=/mnt/checkpoints --mount-profile=checkpoint-write
 \tnetapp_dataops_cli.py create volume --name=testvol --size=10GB --type=flexvol --aggregate=n2_data
 \tnetapp_dataops_cli.py create volume -n testvol -s 10GB -t flexvol -p 0755 -u 1000 -g 1000 -j /project1
 \tsudo -E netapp_dataops_cli.py create volume -n vol1 -s 5GB -t flexvol --export-policy=team1 -m /mnt/vol1
@@ -254,11 +299,71 @@ Examples:
 \tnetapp_dataops_cli.py unmount volume -m /project2
 '''
 
+helpTextUnmountVolumes = '''
+Command: unmount volumes
+
+Unmount many data volumes that are currently mounted locally, concurrently. Nested mountpoints are unmounted before the mountpoints that
+contain them. A failed unmount does not abort the batch.
+
+Requirement: On Linux hosts, must be run as root.
+
+Required Options/Arguments:
+\t-m, --mountpoints=\tComma-separated list of mountpoints.
+
+Optional Options/Arguments:
+\t-h, --help\t\tPrint help text.
+\t-w, --workers=\t\tMaximum number of unmounts to run at a time (default: 8).
+
+Examples:
+\tsudo -E netapp_dataops_cli.py unmount volumes --mountpoints=/mnt/shard1,/mnt/shard2,/mnt/ckpt
+'''
+
+helpTextGenerateAutomountMap = '''
+Command: generate automount-map
+
+Generate an autofs indirect map (or systemd automount units) for the volumes of an SVM, so that volumes are mounted on demand when first
+accessed instead of being mounted eagerly. The map is compared with the installed one, only changed entries are rewritten, and files are
+installed atomically, so that the command can be re-run periodically (e.g. from cron or a systemd timer) to pick up created and deleted volumes.
+
+Requirement: On Linux hosts, must usually be run as root in order to write to /etc.
+
+Required Options/Arguments:
+\t-f, --map-path=\t\tautofs map file to write (ex. '/etc/auto.dataops'), or directory to write systemd units to (ex. '/etc/systemd/system').
+
+Optional Options/Arguments:
+\t-r, --mount-root=\tDirectory that volumes are mounted under, as <mount root>/<volume name>. Required for systemd units and -m/--master-map.
+\t-t, --format=\t\tMap format: 'autofs' (default) or 'systemd'.
+\t-m, --master-map=\tautofs master map file to write an entry for the map to (ex. '/etc/auto.master.d/dataops.autofs').
+\t-u, --cluster-name=\tnon default hosting cluster
+\t-v, --svm=\t\tnon default SVM name
+\t-n, --name-pattern=\tOnly include volumes with a name matching this pattern (ex. 'project1_*').
+\t-c, --comment-tag=\tOnly include volumes with this tag (word) in their comment.
+\t-s, --clone-parent=\tOnly include clones of this volume.
+\t-o, --mount-profile=\tNFS mount profile whose options to use. If not specified, the default mount profile from the config file (if any) is used.
+\t-p, --lif-selection=\tHow to choose the data LIF to mount through: 'config' or 'locality' (see 'mount volume').
+\t-x, --readonly\t\tMount volumes as read-only.
+\t-i, --timeout=\t\tNumber of idle seconds after which a volume is unmounted (default: 600).
+\t-l, --reload\t\tReload autofs, or reload systemd and enable/disable the automount units, if anything has changed.
+\t-h, --help\t\tPrint help text.
+
+Examples:
+\tsudo -E netapp_dataops_cli.py generate automount-map --map-path=/etc/auto.dataops --mount-root=/mnt/dataops --master-map=/etc/auto.master.d/dataops.autofs --reload
+\tsudo -E netapp_dataops_cli.py generate automount-map -f /etc/auto.clones -r /mnt/clones -s gold_dataset -o training-read -x -l
+\tsudo -E netapp_dataops_cli.py generate automount-map -f /etc/systemd/system -t systemd -r /mnt/dataops -c dataops -l
+'''
 helpTextListCloudSyncRelationships = '''
 Command: list cloud-sync-relationships
 
 List all existing Cloud Sync relationships.
 
+No additional options/arguments required.
+'''
+helpTextListMountProfiles = '''
+Command: list mount-profiles
+
+List the NFS mount profiles that can be used when mounting data volumes, including the built-in profiles and any profiles defined in the config file.
+Profiles that use mount options that the running kernel does not support are flagged.
+
 No additional options/arguments required.
 '''
 helpTextListSnapMirrorRelationships = '''
@@ -282,11 +387,15 @@ Required Options/Arguments:
 Optional Options/Arguments:
 \t-u, --cluster-name=\tNon default hosting cluster
 \t-s, --svm=\t\tNon default svm.
+\t-f, --filter=\t\tOnly list snapshots with a name matching this pattern (ex. 'hourly*').
+\t-o, --order-by=\t\tSort snapshots by this field (ex. 'create_time' or 'create_time desc').
+\t-d, --include-size-details\tInclude snapshot size and reclaimable space in output.
 \t-h, --help\t\tPrint help text.
 
 Examples:
 \tnetapp_dataops_cli.py list snapshots --volume=project1
 \tnetapp_dataops_cli.py list snapshots -v test1
+\tnetapp_dataops_cli.py list snapshots -v test1 --filter=hourly* --order-by=create_time --include-size-details
 '''
 helpTextListVolumes = '''
 Command: list volumes
@@ -300,10 +409,13 @@ Optional Options/Arguments:
 \t-v, --svm=\t\t\t\tlist volume on non default svm
 \t-h, --help\t\t\t\tPrint help text.
 \t-s, --include-space-usage-details\tInclude storage space usage details in output (see README for explanation).
+\t-p, --lif-selection=\t\t\tHow to choose the data LIF in the 'NFS Mount Target' column: 'config' (data LIF from config file) or 'locality'
+\t\t\t\t\t\t(LIF on the node that owns the volume). If not specified, the value from the config file (default: 'config') is used.
 
 Examples:
 \tnetapp_dataops_cli.py list volumes
 \tnetapp_dataops_cli.py list volumes --include-space-usage-details
+\tnetapp_dataops_cli.py list volumes --lif-selection=locality
 '''
 helpTextMountVolume = '''
 Command: mount volume
@@ -319,13 +431,54 @@ Required Options/Arguments:
 Optional Options/Arguments:
 \t-v, --svm \t\tnon default SVM name
 \t-l, --lif \t\tnon default lif (nfs server ip/name)
+\t-p, --lif-selection=\tHow to choose the data LIF to mount through when -l/--lif is not specified: 'config' (data LIF from config file) or
+\t\t\t\t'locality' (LIF on the node that owns the volume; FlexGroup clients are spread across the LIFs of the nodes that host it).
+\t\t\t\tIf not specified, the value from the config file (default: 'config') is used.
 \t-h, --help\t\tPrint help text.
 \t-x, --readonly\t\tMount volume locally as read-only.
+\t-o, --mount-profile=\tNFS mount profile to mount volume with (ex. 'training-read'). If not specified, the default mount profile from the config file (if any) is used.
+\t\t\t\tRun 'list mount-profiles' to view available profiles.
 
 Examples:
 \tsudo -E netapp_dataops_cli.py mount volume --name=project1 --mountpoint=/mnt/project1
 \tsudo -E netapp_dataops_cli.py mount volume -m ~/testvol -n testvol -x
 \tsudo -E netapp_dataops_cli.py mount volume --name=project1 --mountpoint=/mnt/project1 --readonly
+\tsudo -E netapp_dataops_cli.py mount volume --name=imagenet --mountpoint=/mnt/imagenet --readonly --mount-profile=training-read
+\tsudo -E netapp_dataops_cli.py mount volume --name=project1 --mountpoint=/mnt/project1 --lif-selection=locality
+'''
+helpTextMountVolumes = '''
+Command: mount volumes
+
+Mount many existing data volumes locally, concurrently. All NFS mount targets are resolved with a single volume listing. If any mount fails,
+no further mounts are started and the volumes that were mounted are unmounted again, so that either all volumes are mounted or none.
+
+Requirement: On Linux hosts, must be run as root.
+
+Required Options/Arguments (one of):
+\t-m, --mounts=\t\tComma-separated list of volume:mountpoint pairs (ex. 'shard1:/mnt/shard1,shard2:/mnt/shard2').
+\t-f, --from-file=\tJSON or YAML file containing a list of mounts. Each entry accepts the following keys:
+\t\t\t\tvolume_name, mountpoint (required), svm_name, lif_name, readonly, mount_profile
+
+Optional Options/Arguments:
+\t-u, --cluster-name=\tnon default hosting cluster
+\t-v, --svm=\t\tnon default SVM name
+\t-h, --help\t\tPrint help text.
+\t-w, --workers=\t\tMaximum number of mounts to run at a time (default: 8).
+\t-x, --readonly\t\tMount volumes locally as read-only (unless overridden per mount in the file).
+\t-o, --mount-profile=\tNFS mount profile to mount volumes with (unless overridden per mount in the file).
+\t-p, --lif-selection=\tHow to choose the data LIF to mount through: 'config' or 'locality' (see 'mount volume').
+\t-k, --no-rollback\tKeep the volumes that were mounted successfully if another mount fails.
+
+Examples:
+\tsudo -E netapp_dataops_cli.py mount volumes --mounts=shard1:/mnt/shard1,shard2:/mnt/shard2,ckpt:/mnt/ckpt
+\tsudo -E netapp_dataops_cli.py mount volumes -f mounts.yaml -w 16 --mount-profile=training-read --readonly
+
+Example file (mounts.json):
+\t[
+\t    {"volume_name": "shard1", "mountpoint": "/mnt/shard1"},
+\t    {"volume_name": "shard2", "mountpoint": "/mnt/shard2"},
+\t    {"volume_name": "checkpoints", "mountpoint": "/mnt/checkpoints", "readonly": false, "mount_profile": "checkpoint-write"}
+\t]
 '''
 helpTextPullFromS3Bucket = '''
 Command: pull-from-s3 bucket
@@ -343,10 +496,33 @@ Required Options/Arguments:
 Optional Options/Arguments:
 \t-h, --help\t\tPrint help text.
 \t-p, --key-prefix=\tObject key prefix (pull will be limited to objects with key that starts with this prefix).
+\t-w, --workers=\t\tNumber of objects to download concurrently (default: number of CPUs + 4, up to 32).
+\t-q, --queue-depth=\tMaximum number of listed objects waiting to be downloaded (default: 1000).
+\t-s, --partitions=\tList the bucket in parallel, one partition per comma-separated key prefix (appended to the key prefix).
+\t\t\t\t'hex:N' denotes all N-digit lowercase hex prefixes. The partitions must cover all keys that are to be pulled.
+\t-a, --discover-partitions\tList the bucket in parallel, one partition per '/'-delimited prefix found under the key prefix (or partitions).
+\t-l, --list-workers=\tNumber of partitions to list concurrently (default: 8).
+\t-y, --sync\t\tOnly download objects that are new or have changed since the local copy (compares size and modification time).
+\t-c, --checksum\t\tIn sync mode, compare content checksums (MD5/ETag) instead of modification times where possible.
+\t-r, --delete\t\tIn sync mode, delete local files that do not exist in the bucket (within the key prefix).
+\t-z, --part-size=\tSize of the parts in which large objects are downloaded (e.g. '64MB'; default: config file or 8MB).
+\t-n, --concurrency=\tNumber of parts of an object to download concurrently (default: config file or 10).
+\t-t, --multipart-threshold=\tObject size from which objects are downloaded in parts (e.g. '256MB'; default: config file or 8MB).
+\t-x, --unpack-shards\tDownload the tar shards created by 'push-to-s3 directory --shard-size' (in parallel) and unpack them into the directory.
+\t-u, --resume\t\tMake the pull resumable by recording its progress in a journal in the state directory. If a resumable pull
+\t\t\t\twas interrupted, it is resumed; objects that it downloaded are skipped.
+\t-o, --report=\t\tWrite a JSON report of the objects downloaded, skipped and failed, and the bytes downloaded, to this file.
+\t-j, --state-directory=\tDirectory in which the sync manifest and journal are kept (default: 's3_state' directory next to the config file).
 
 Examples:
 \tnetapp_dataops_cli.py pull-from-s3 bucket --bucket=project1 --directory=/mnt/project1
 \tnetapp_dataops_cli.py pull-from-s3 bucket -b project1 -p project1/ -d ./project1/
+\tnetapp_dataops_cli.py pull-from-s3 bucket -b project1 -d /mnt/project1 -w 64 -q 5000
+\tnetapp_dataops_cli.py pull-from-s3 bucket -b project1 -d /mnt/project1 --discover-partitions --list-workers=16
+\tnetapp_dataops_cli.py pull-from-s3 bucket -b project1 -p shards/ -d /mnt/project1 -s hex:2
+\tnetapp_dataops_cli.py pull-from-s3 bucket -b project1 -d /mnt/project1 --sync --delete
+\tnetapp_dataops_cli.py pull-from-s3 bucket -b project1 -d /mnt/project1 --resume --report=/tmp/pull-report.json
+\tnetapp_dataops_cli.py pull-from-s3 bucket -b datasets -p imagenet/ -d /mnt/imagenet --unpack-shards -w 16
 '''
 helpTextPullFromS3Object = '''
 Command: pull-from-s3 object
@@ -362,10 +538,14 @@ Required Options/Arguments:
 Optional Options/Arguments:
 \t-f, --file=\t\tLocal filepath (including filename) to save object to (if not specified, value of -k/--key argument will be used)
 \t-h, --help\t\tPrint help text.
+\t-z, --part-size=\tSize of the parts in which large objects are downloaded (e.g. '64MB'; default: config file or 8MB).
+\t-n, --concurrency=\tNumber of parts of an object to download concurrently (default: config file or 10).
+\t-t, --multipart-threshold=\tObject size from which objects are downloaded in parts (e.g. '256MB'; default: config file or 8MB).
 
 Examples:
 \tnetapp_dataops_cli.py pull-from-s3 object --bucket=project1 --key=data.csv --file=./project1/data.csv
 \tnetapp_dataops_cli.py pull-from-s3 object -b project1 -k data.csv
+\tnetapp_dataops_cli.py pull-from-s3 object -b models -k checkpoint.pt -f /mnt/models/checkpoint.pt -z 128MB -n 32
 '''
 helpTextPushToS3Directory = '''
 Command: push-to-s3 directory
@@ -384,10 +564,28 @@ Optional Options/Arguments:
 \t-e, --extra-args=\tExtra args to apply to newly-pushed S3 objects (For details on this field, refer to https://boto3.amazonaws.com/v1/documentation/api/latest/guide/s3-uploading-files.html#the-extraargs-parameter).
 \t-h, --help\t\tPrint help text.
 \t-p, --key-prefix=\tPrefix to add to key for newly-pushed S3 objects (Note: by default, key will be local filepath relative to directory being pushed).
+\t-w, --workers=\t\tNumber of files to upload concurrently (default: number of CPUs + 4, up to 32).
+\t-q, --queue-depth=\tMaximum number of files waiting to be uploaded (default: 1000).
+\t-y, --sync\t\tOnly upload files that are new or have changed since they were last pushed (compares size and modification time).
+\t-c, --checksum\t\tIn sync mode, compare content checksums (MD5/ETag) instead of modification times where possible.
+\t-r, --delete\t\tIn sync mode, delete objects (within the key prefix) that do not exist in the local directory.
+\t-z, --part-size=\tSize of the parts in which large files are uploaded (e.g. '64MB'; default: config file or 8MB).
+\t-n, --concurrency=\tNumber of parts of a file to upload concurrently (default: config file or 10).
+\t-t, --multipart-threshold=\tFile size from which files are uploaded in parts (e.g. '256MB'; default: config file or 8MB).
+\t-k, --shard-size=\tPack the files into tar shards of this size (e.g. '1GB') with an index each, and upload the shards
+\t\t\t\tinstead of the individual files. Cannot be combined with sync mode. Workers default to 4 in this mode.
+\t-g, --staging-directory=\tDirectory in which shards are built before they are uploaded (default: system temporary directory).
+\t-u, --resume\t\tMake the push resumable by recording its progress in a journal in the state directory. If a resumable push
+\t\t\t\twas interrupted, it is resumed; files that it uploaded are skipped and multipart uploads that it started are continued.
+\t-o, --report=\t\tWrite a JSON report of the files uploaded, skipped and failed, and the bytes uploaded, to this file.
+\t-j, --state-directory=\tDirectory in which the sync manifest and journal are kept (default: 's3_state' directory next to the config file).
 
 Examples:
 \tnetapp_dataops_cli.py push-to-s3 directory --bucket=project1 --directory=/mnt/project1
 \tnetapp_dataops_cli.py push-to-s3 directory -b project1 -d /mnt/project1 -p project1/ -e '{"Metadata": {"mykey": "myvalue"}}'
+\tnetapp_dataops_cli.py push-to-s3 directory -b project1 -d /mnt/project1 -p project1/ --sync --checksum
+\tnetapp_dataops_cli.py push-to-s3 directory -b project1 -d /mnt/project1 -p project1/ --resume --report=/tmp/push-report.json
+\tnetapp_dataops_cli.py push-to-s3 directory -b datasets -d /mnt/imagenet -p imagenet/ --shard-size=1GB --staging-directory=/scratch
 '''
 helpTextPushToS3File = '''
 Command: push-to-s3 file
@@ -404,6 +602,9 @@ Optional Options/Arguments:
 \t-e, --extra-args=\tExtra args to apply to newly-pushed S3 object (For details on this field, refer to https://boto3.amazonaws.com/v1/documentation/api/latest/guide/s3-uploading-files.html#the-extraargs-parameter).
 \t-h, --help\t\tPrint help text.
 \t-k, --key=\t\tKey to assign to newly-pushed S3 object (if not specified, key will be set to value of -f/--file argument).
+\t-z, --part-size=\tSize of the parts in which large files are uploaded (e.g. '64MB'; default: config file or 8MB).
+\t-n, --concurrency=\tNumber of parts of a file to upload concurrently (default: config file or 10).
+\t-t, --multipart-threshold=\tFile size from which files are uploaded in parts (e.g. '256MB'; default: config file or 8MB).
 
 Examples:
 \tnetapp_dataops_cli.py push-to-s3 file --bucket=project1 --file=data.csv
@@ -427,6 +628,26 @@ Examples:
 \tnetapp_dataops_cli.py prepopulate flexcache --name=project1 --paths=/datasets/project1,/datasets/project2
 \tnetapp_dataops_cli.py prepopulate flexcache -n test1 -p /datasets/project1,/datasets/project2
 '''
+helpTextPruneSnapshots = '''
+Command: prune snapshots
+
+Delete snapshots exceeding a retention policy for one or more data volumes. Only snapshots named '<name>.<timestamp>' (as created by 'create snapshot --retention') are considered.
+
+Required Options/Arguments:
+\t-v, --volumes=\t\tComma-separated list of volume names.
+\t-n, --name=\t\tSnapshot name prefix.
+\t-r, --retention=\tCount of snapshots to keep when int (ex. 10) or days when suffixed by d (ex. 10d).
+
+Optional Options/Arguments:
+\t-u, --cluster-name=\tNon default hosting cluster
+\t-s, --svm=\t\tNon default svm.
+\t-w, --workers=\t\tMaximum number of concurrent snapshot deletes (default is 8).
+\t-h, --help\t\tPrint help text.
+
+Examples:
+\tnetapp_dataops_cli.py prune snapshots --volumes=project1,project2 --name=daily --retention=7
+\tnetapp_dataops_cli.py prune snapshots -v project1 -n hourly -r 2d -w 16
+'''
 helpTextRestoreSnapshot = '''
 Command: restore snapshot
 
@@ -464,6 +685,30 @@ Examples:
 \tnetapp_dataops_cli.py sync cloud-sync-relationship --id=5ed00996ca85650009a83db2
 \tnetapp_dataops_cli.py sync cloud-sync-relationship -i 5ed00996ca85650009a83db2 -w
 '''
+
+helpTextSyncCloudSyncRelationships = '''
+Command: sync cloud-sync-relationships
+
+Trigger sync operations for many existing Cloud Sync relationships at once, and optionally wait until all of them are complete.
+The status of all sync operations is retrieved with a single API call per check. Checks are repeated quickly while operations
+are changing state, and back off up to the maximum interval while all of them are still running.
+
+Tip: Run `netapp_dataops_cli.py list cloud-sync-relationships` to obtain relationship IDs.
+
+Required Options/Arguments:
+\t-i, --ids=\t\tComma-separated list of IDs of the relationships for which sync operations are to be triggered.
+
+Optional Options/Arguments:
+\t-h, --help\t\tPrint help text.
+\t-w, --wait\t\tWait for all sync operations to complete before exiting.
+\t-p, --interval=\t\tMinimum number of seconds between status checks (default: 10).
+\t-m, --max-interval=\tMaximum number of seconds between status checks (default: 60).
+\t-t, --timeout=\t\tMaximum number of seconds to wait for the sync operations to complete (default: no limit).
+
+Examples:
+\tnetapp_dataops_cli.py sync cloud-sync-relationships --ids=5ed00996ca85650009a83db2,5ed00996ca85650009a83db3 --wait
+\tnetapp_dataops_cli.py sync cloud-sync-relationships -i 5ed00996ca85650009a83db2,5ed00996ca85650009a83db3 -w -p 5 -m 120 -t 7200
+'''
 helpTextSyncSnapMirrorRelationship = '''
 Command: sync snapmirror-relationship
 
@@ -488,6 +733,29 @@ Examples:
 \tnetapp_dataops_cli.py sync snapmirror-relationship -u cluster1 -v svm1 -n vol1 -w
 '''
 
+helpTextSyncSnapMirrorRelationships = '''
+Command: sync snapmirror-relationships
+
+Trigger sync operations for many existing SnapMirror relationships at once, and optionally wait until all of them are complete.
+The progress of all transfers is retrieved with a single API call per check.
+
+Required Options/Arguments:
+\t-i, --uuids=\t\tComma-separated list of UUIDs of the relationships for which sync operations are to be triggered.
+and/or
+\t-n, --names=\t\tComma-separated list of names of target volumes to be synced.
+
+Optional Options/Arguments:
+\t-u, --cluster-name=\tnon default hosting cluster
+\t-v, --svm=\t\tnon default target SVM name
+\t-h, --help\t\tPrint help text.
+\t-w, --wait\t\tWait for all sync operations to complete before exiting.
+\t-t, --timeout=\t\tMaximum number of seconds to wait for the sync operations to complete (default: no limit).
+
+Examples:
+\tnetapp_dataops_cli.py sync snapmirror-relationships --names=vol1,vol2,vol3 --wait
+\tnetapp_dataops_cli.py sync snapmirror-relationships -u cluster1 -v svm1 -n vol1,vol2 -i 132aab2c-4557-11eb-b542-005056932373 -w -t 7200
+'''
+
 helpTextCreateSnapMirrorRelationship = '''
 Command: create snapmirror-relationship
 
@@ -639,6 +907,19 @@ def createConfig(configDirPath: str = "~/.netapp_dataops", configFilename: str =
             refreshTokenBase64Bytes = base64.b64encode(refreshTokenBytes)
             config["cloudCentralRefreshToken"] = refreshTokenBase64Bytes.decode("ascii")
 
+            # Prompt user to enter value denoting whether or not to cache Cloud Sync access tokens between runs
+            # Verify value entered; prompt user to re-enter if invalid
+            while True:
+                cacheToken = input("Cache Cloud Sync access tokens between runs (stored in config directory, readable by current user only) (true/false) [false]: ")
+                if cacheToken in ("true", "True") :
+                    config["cloudSyncTokenCache"] = True
+                    break
+                elif cacheToken in ("", "false", "False") :
+                    config["cloudSyncTokenCache"] = False
+                    break
+                else:
+                    print("Invalid value. Must enter 'true' or 'false'.")
+
             break
 
         elif useCloudSync in ("no", "No", "NO"):
@@ -753,10 +1034,11 @@ if __name__ == '__main__':
             snapshotPolicy = None
             exportHosts = None
             svmDrUnprotect = False
+            mountProfile = None
 
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hl:c:t:n:v:s:m:u:g:j:xe:p:i:srd", ["help", "cluster-name=", "source-svm=","target-svm=","name=", "source-volume=", "source-snapshot=", "mountpoint=", "uid=", "gid=", "junction=", "readonly","export-hosts=","export-policy=","snapshot-policy=","split","refresh","svm-dr-unprotect"])
+                opts, args = getopt.getopt(sys.argv[3:], "hl:c:t:n:v:s:m:u:g:j:xe:p:i:srdo:", ["help", "cluster-name=", "source-svm=","target-svm=","name=", "source-volume=", "source-snapshot=", "mountpoint=", "uid=", "gid=", "junction=", "readonly","export-hosts=","export-policy=","snapshot-policy=","split","refresh","svm-dr-unprotect","mount-profile="])
             except Exception as err:                
                 print(err)
                 handleInvalidCommand(helpText=helpTextCloneVolume, invalidOptArg=True)
@@ -800,6 +1082,8 @@ if __name__ == '__main__':
                     snapshotPolicy = arg                     
                 elif opt in ("-e", "--export-hosts"):
                     exportHosts = arg                                                        
+                elif opt in ("-o", "--mount-profile"):
+                    mountProfile = arg
 
             # Check for required options
             if not newVolumeName or not sourceVolumeName:
@@ -816,11 +1100,61 @@ if __name__ == '__main__':
                 clone_volume(new_volume_name=newVolumeName, source_volume_name=sourceVolumeName, source_snapshot_name=sourceSnapshotName, 
                              cluster_name=clusterName, source_svm=sourceSVM, target_svm=targetSVM, export_policy=exportPolicy, export_hosts=exportHosts, 
                              snapshot_policy=snapshotPolicy, split=split, refresh=refresh, mountpoint=mountpoint, unix_uid=unixUID, unix_gid=unixGID, 
-                             junction=junction, svm_dr_unprotect=svmDrUnprotect, readonly=readonly, print_output=True)
+                             junction=junction, svm_dr_unprotect=svmDrUnprotect, readonly=readonly, mount_profile=mountProfile, print_output=True)
             except (InvalidConfigError, APIConnectionError, InvalidSnapshotParameterError, InvalidVolumeParameterError,
                     MountOperationError):
                 sys.exit(1)
 
+        elif target in ("volumes", "vols"):
+            specsFile = None
+            clusterName = None
+            maxWorkers = 8
+
+            # Get command line options
+            try:
+                opts, args = getopt.getopt(sys.argv[3:], "hf:l:w:", ["help", "from-file=", "cluster-name=", "workers="])
+            except Exception as err:
+                print(err)
+                handleInvalidCommand(helpText=helpTextCloneVolumes, invalidOptArg=True)
+
+            # Parse command line options
+            for opt, arg in opts:
+                if opt in ("-h", "--help"):
+                    print(helpTextCloneVolumes)
+                    sys.exit(0)
+                elif opt in ("-f", "--from-file"):
+                    specsFile = arg
+                elif opt in ("-l", "--cluster-name"):
+                    clusterName = arg
+                elif opt in ("-w", "--workers"):
+                    try:
+                        maxWorkers = int(arg)
+                    except ValueError:
+                        handleInvalidCommand(helpText=helpTextCloneVolumes, invalidOptArg=True)
+
+            # Check for required options
+            if not specsFile:
+                handleInvalidCommand(helpText=helpTextCloneVolumes, invalidOptArg=True)
+
+            # Read clone specs from file (YAML is a superset of JSON)
+            try:
+                with open(os.path.expanduser(specsFile)) as specsFileHandle:
+                    specs = yaml.safe_load(specsFileHandle)
+                if not isinstance(specs, list):
+                    raise ValueError("file must contain a list of clones")
+            except (OSError, ValueError, yaml.YAMLError) as err:
+                print("Error: could not read clone specs from file '" + specsFile + "': " + str(err))
+                sys.exit(1)
+
+            # Clone volumes
+            try:
+                cloneResults = clone_volumes(specs=specs, cluster_name=clusterName, max_workers=maxWorkers, print_output=True)
+            except (InvalidConfigError, APIConnectionError, InvalidVolumeParameterError):
+                sys.exit(1)
+
+            if [cloneResult for cloneResult in cloneResults if cloneResult["Status"] != "created"]:
+                sys.exit(1)
+
         else:
             handleInvalidCommand()
 
@@ -914,10 +1248,11 @@ if __name__ == '__main__':
             readonly = False
             tieringPolicy = None 
             volDP = False
+            mountProfile = None
 
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "l:hv:t:n:s:rt:p:u:g:e:d:m:a:j:xu:y", ["cluster-name=","help", "svm=", "name=", "size=", "guarantee-space", "type=", "permissions=", "uid=", "gid=", "export-policy=", "snapshot-policy=", "mountpoint=", "aggregate=", "junction=" ,"readonly","tiering-policy=","dp"])
+                opts, args = getopt.getopt(sys.argv[3:], "l:hv:t:n:s:rt:p:u:g:e:d:m:a:j:xu:yo:", ["cluster-name=","help", "svm=", "name=", "size=", "guarantee-space", "type=", "permissions=", "uid=", "gid=", "export-policy=", "snapshot-policy=", "mountpoint=", "aggregate=", "junction=" ,"readonly","tiering-policy=","dp","mount-profile="])
             except Exception as err:                
                 print(err)
                 handleInvalidCommand(helpText=helpTextCreateVolume, invalidOptArg=True)
@@ -961,6 +1296,8 @@ if __name__ == '__main__':
                     tieringPolicy = arg
                 elif opt in ("-y", "--dp"):
                     volDP = True
+                elif opt in ("-o", "--mount-profile"):
+                    mountProfile = arg
 
             # Check for required options
             if not volumeName or not volumeSize:
@@ -975,7 +1312,7 @@ if __name__ == '__main__':
             try:
                 create_volume(svm_name=svmName, volume_name=volumeName,  cluster_name=clusterName, volume_size=volumeSize, guarantee_space=guaranteeSpace, volume_type=volumeType, unix_permissions=unixPermissions, unix_uid=unixUID,
                               unix_gid=unixGID, export_policy=exportPolicy, snapshot_policy=snapshotPolicy, aggregate=aggregate, mountpoint=mountpoint, junction=junction, readonly=readonly, 
-                              print_output=True, tiering_policy=tieringPolicy, vol_dp=volDP)
+                              print_output=True, tiering_policy=tieringPolicy, vol_dp=volDP, mount_profile=mountProfile)
             except (InvalidConfigError, APIConnectionError, InvalidVolumeParameterError, MountOperationError):
                 sys.exit(1)
 
@@ -1136,6 +1473,87 @@ if __name__ == '__main__':
         else:
             handleInvalidCommand()
 
+    elif action == "generate":
+        # Get desired target from command line args
+        target = getTarget(sys.argv)
+
+        # Invoke desired action based on target
+        if target in ("automount-map", "automount", "autofs-map"):
+            mapPath = None
+            mountRoot = None
+            mapFormat = "autofs"
+            masterMapFile = None
+            clusterName = None
+            svmName = None
+            namePattern = None
+            commentTag = None
+            cloneParent = None
+            mountProfile = None
+            lifSelection = None
+            readonly = False
+            timeout = 600
+            reload = False
+
+            # Get command line options
+            try:
+                opts, args = getopt.getopt(sys.argv[3:], "hf:r:t:m:u:v:n:c:s:o:p:xi:l", ["help", "map-path=", "mount-root=", "format=", "master-map=",
+                                                                                        "cluster-name=", "svm=", "name-pattern=", "comment-tag=",
+                                                                                        "clone-parent=", "mount-profile=", "lif-selection=",
+                                                                                        "readonly", "timeout=", "reload"])
+            except Exception as err:
+                print(err)
+                handleInvalidCommand(helpText=helpTextGenerateAutomountMap, invalidOptArg=True)
+
+            # Parse command line options
+            for opt, arg in opts:
+                if opt in ("-h", "--help"):
+                    print(helpTextGenerateAutomountMap)
+                    sys.exit(0)
+                elif opt in ("-f", "--map-path"):
+                    mapPath = arg
+                elif opt in ("-r", "--mount-root"):
+                    mountRoot = arg
+                elif opt in ("-t", "--format"):
+                    mapFormat = arg
+                elif opt in ("-m", "--master-map"):
+                    masterMapFile = arg
+                elif opt in ("-u", "--cluster-name"):
+                    clusterName = arg
+                elif opt in ("-v", "--svm"):
+                    svmName = arg
+                elif opt in ("-n", "--name-pattern"):
+                    namePattern = arg
+                elif opt in ("-c", "--comment-tag"):
+                    commentTag = arg
+                elif opt in ("-s", "--clone-parent"):
+                    cloneParent = arg
+                elif opt in ("-o", "--mount-profile"):
+                    mountProfile = arg
+                elif opt in ("-p", "--lif-selection"):
+                    lifSelection = arg
+                elif opt in ("-x", "--readonly"):
+                    readonly = True
+                elif opt in ("-i", "--timeout"):
+                    timeout = arg
+                elif opt in ("-l", "--reload"):
+                    reload = True
+
+            # Check for required options
+            if not mapPath:
+                handleInvalidCommand(helpText=helpTextGenerateAutomountMap, invalidOptArg=True)
+
+            # Generate automount map
+            try:
+                generate_automount_map(map_path=mapPath, mount_root=mountRoot, map_format=mapFormat, cluster_name=clusterName, svm_name=svmName,
+                                       name_pattern=namePattern, comment_tag=commentTag, clone_parent=cloneParent, mount_profile=mountProfile,
+                                       lif_selection=lifSelection, readonly=readonly, timeout=timeout, master_map_file=masterMapFile,
+                                       reload=reload, print_output=True)
+            except (InvalidConfigError, APIConnectionError, InvalidVolumeParameterError, MountOperationError):
+                sys.exit(1)
+
+        else:
+            handleInvalidCommand()
+
     elif action in ("help", "h", "-h", "--help"):
         print(helpTextStandard)
 
@@ -1159,6 +1577,21 @@ if __name__ == '__main__':
             except (InvalidConfigError, APIConnectionError):
                 sys.exit(1)
 
+        elif target in ("mount-profile", "mount-profiles"):
+            # Check command line options
+            if len(sys.argv) > 3:
+                if sys.argv[3] in ("-h", "--help"):
+                    print(helpTextListMountProfiles)
+                    sys.exit(0)
+                else:
+                    handleInvalidCommand(helpTextListMountProfiles, invalidOptArg=True)
+
+            # List mount profiles
+            try:
+                list_mount_profiles(print_output=True)
+            except InvalidConfigError:
+                sys.exit(1)
+
         elif target in ("snapmirror-relationship", "snapmirror", "snapmirror-relationships", "snapmirrors","sm"):
             svmName = None
             clusterName = None             
@@ -1190,10 +1623,13 @@ if __name__ == '__main__':
             volumeName = None
             clusterName = None             
             svmName = None 
+            namePattern = None
+            orderBy = None
+            includeSizeDetails = False
 
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hv:s:u:", ["cluster-name=","help", "volume=","svm="])
+                opts, args = getopt.getopt(sys.argv[3:], "hv:s:u:f:o:d", ["cluster-name=","help", "volume=","svm=", "filter=", "order-by=", "include-size-details"])
             except Exception as err:                
                 print(err)
                 handleInvalidCommand(helpText=helpTextListSnapshots, invalidOptArg=True)
@@ -1209,6 +1645,12 @@ if __name__ == '__main__':
                     svmName = arg
                 elif opt in ("-u", "--cluster-name"):
                     clusterName = arg                     
+                elif opt in ("-f", "--filter"):
+                    namePattern = arg
+                elif opt in ("-o", "--order-by"):
+                    orderBy = arg
+                elif opt in ("-d", "--include-size-details"):
+                    includeSizeDetails = True
 
             # Check for required options
             if not volumeName:
@@ -1216,7 +1658,8 @@ if __name__ == '__main__':
 
             # List snapsots
             try:
-                list_snapshots(volume_name=volumeName, cluster_name=clusterName, svm_name=svmName, print_output=True)
+                list_snapshots(volume_name=volumeName, cluster_name=clusterName, svm_name=svmName, name_pattern=namePattern, order_by=orderBy,
+                               include_size_details=includeSizeDetails, print_output=True)
             except (InvalidConfigError, APIConnectionError, InvalidVolumeParameterError):
                 sys.exit(1)
 
@@ -1224,10 +1667,11 @@ if __name__ == '__main__':
             includeSpaceUsageDetails = False
             svmName = None
             clusterName = None        
+            lifSelection = None
 
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hsv:u:", ["cluster-name=","help", "include-space-usage-details","svm="])
+                opts, args = getopt.getopt(sys.argv[3:], "hsv:u:p:", ["cluster-name=","help", "include-space-usage-details","svm=","lif-selection="])
             except Exception as err:                
                 print(err)
                 handleInvalidCommand(helpText=helpTextListVolumes, invalidOptArg=True)
@@ -1243,11 +1687,14 @@ if __name__ == '__main__':
                     includeSpaceUsageDetails = True
                 elif opt in ("-u", "--cluster-name"):
                     clusterName = arg                     
+                elif opt in ("-p", "--lif-selection"):
+                    lifSelection = arg
 
             # List volumes
             try:
-                list_volumes(check_local_mounts=True, include_space_usage_details=includeSpaceUsageDetails, print_output=True, svm_name=svmName, cluster_name=clusterName)
-            except (InvalidConfigError, APIConnectionError) :
+                list_volumes(check_local_mounts=True, include_space_usage_details=includeSpaceUsageDetails, print_output=True, svm_name=svmName, cluster_name=clusterName,
+                             lif_selection=lifSelection)
+            except (InvalidConfigError, APIConnectionError, InvalidVolumeParameterError) :
                 sys.exit(1)
 
         else:
@@ -1265,9 +1712,11 @@ if __name__ == '__main__':
             lifName = None 
             mountpoint = None
             readonly = False
+            mountProfile = None
+            lifSelection = None
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hv:n:l:m:u:", ["cluster-name=","help", "lif=","svm=", "name=", "mountpoint=", "readonly"])
+                opts, args = getopt.getopt(sys.argv[3:], "hv:n:l:m:u:xo:p:", ["cluster-name=","help", "lif=","svm=", "name=", "mountpoint=", "readonly", "mount-profile=", "lif-selection="])
             except Exception as err:                
                 print(err)
                 handleInvalidCommand(helpText=helpTextMountVolume, invalidOptArg=True)
@@ -1289,10 +1738,91 @@ if __name__ == '__main__':
                     mountpoint = arg
                 elif opt in ("-x", "--readonly"):
                     readonly = True
+                elif opt in ("-o", "--mount-profile"):
+                    mountProfile = arg
+                elif opt in ("-p", "--lif-selection"):
+                    lifSelection = arg
 
             # Mount volume
             try:
-                mount_volume(svm_name = svmName, cluster_name=clusterName, lif_name = lifName, volume_name=volumeName, mountpoint=mountpoint, readonly=readonly, print_output=True)
+                mount_volume(svm_name = svmName, cluster_name=clusterName, lif_name = lifName, volume_name=volumeName, mountpoint=mountpoint, readonly=readonly,
+                             mount_profile=mountProfile, lif_selection=lifSelection, print_output=True)
+            except (InvalidConfigError, APIConnectionError, InvalidVolumeParameterError, MountOperationError):
+                sys.exit(1)
+
+        elif target in ("volumes", "vols"):
+            mountsList = None
+            mountsFile = None
+            svmName = None
+            clusterName = None
+            maxWorkers = 8
+            readonly = False
+            mountProfile = None
+            lifSelection = None
+            rollback = True
+
+            # Get command line options
+            try:
+                opts, args = getopt.getopt(sys.argv[3:], "hm:f:v:u:w:xo:p:k", ["help", "mounts=", "from-file=", "svm=", "cluster-name=", "workers=", "readonly",
+                                                                               "mount-profile=", "lif-selection=", "no-rollback"])
+            except Exception as err:
+                print(err)
+                handleInvalidCommand(helpText=helpTextMountVolumes, invalidOptArg=True)
+
+            # Parse command line options
+            for opt, arg in opts:
+                if opt in ("-h", "--help"):
+                    print(helpTextMountVolumes)
+                    sys.exit(0)
+                elif opt in ("-m", "--mounts"):
+                    mountsList = arg
+                elif opt in ("-f", "--from-file"):
+                    mountsFile = arg
+                elif opt in ("-v", "--svm"):
+                    svmName = arg
+                elif opt in ("-u", "--cluster-name"):
+                    clusterName = arg
+                elif opt in ("-w", "--workers"):
+                    try:
+                        maxWorkers = int(arg)
+                    except ValueError:
+                        handleInvalidCommand(helpText=helpTextMountVolumes, invalidOptArg=True)
+                elif opt in ("-x", "--readonly"):
+                    readonly = True
+                elif opt in ("-o", "--mount-profile"):
+                    mountProfile = arg
+                elif opt in ("-p", "--lif-selection"):
+                    lifSelection = arg
+                elif opt in ("-k", "--no-rollback"):
+                    rollback = False
+
+            # Check for required options
+            if bool(mountsList) == bool(mountsFile):
+                handleInvalidCommand(helpText=helpTextMountVolumes, invalidOptArg=True)
+
+            # Read mounts from command line or from file (YAML is a superset of JSON)
+            if mountsList:
+                mounts = list()
+                for mountPair in mountsList.split(","):
+                    volumeName, separator, mountpoint = mountPair.partition(":")
+                    if not separator or not volumeName or not mountpoint:
+                        print("Error: invalid mount '" + mountPair + "'. Format: 'volume:mountpoint'.")
+                        handleInvalidCommand(helpText=helpTextMountVolumes, invalidOptArg=True)
+                    mounts.append({"volume_name": volumeName, "mountpoint": mountpoint})
+            else:
+                try:
+                    with open(os.path.expanduser(mountsFile)) as mountsFileHandle:
+                        mounts = yaml.safe_load(mountsFileHandle)
+                    if not isinstance(mounts, list):
+                        raise ValueError("file must contain a list of mounts")
+                except (OSError, ValueError, yaml.YAMLError) as err:
+                    print("Error: could not read mounts from file '" + mountsFile + "': " + str(err))
+                    sys.exit(1)
+
+            # Mount volumes
+            try:
+                mount_volumes(mounts=mounts, cluster_name=clusterName, svm_name=svmName, max_workers=maxWorkers, readonly=readonly,
+                              mount_profile=mountProfile, lif_selection=lifSelection, rollback=rollback, print_output=True)
             except (InvalidConfigError, APIConnectionError, InvalidVolumeParameterError, MountOperationError):
                 sys.exit(1)
 
@@ -1330,6 +1860,40 @@ if __name__ == '__main__':
                 unmount_volume(mountpoint=mountpoint, print_output= True)
             except (MountOperationError):
                 sys.exit(1)
+
+        elif target in ("volumes", "vols"):
+            mountpoints = None
+            maxWorkers = 8
+
+            # Get command line options
+            try:
+                opts, args = getopt.getopt(sys.argv[3:], "hm:w:", ["help", "mountpoints=", "workers="])
+            except Exception as err:
+                print(err)
+                handleInvalidCommand(helpText=helpTextUnmountVolumes, invalidOptArg=True)
+
+            # Parse command line options
+            for opt, arg in opts:
+                if opt in ("-h", "--help"):
+                    print(helpTextUnmountVolumes)
+                    sys.exit(0)
+                elif opt in ("-m", "--mountpoints"):
+                    mountpoints = [mountpoint for mountpoint in arg.split(",") if mountpoint]
+                elif opt in ("-w", "--workers"):
+                    try:
+                        maxWorkers = int(arg)
+                    except ValueError:
+                        handleInvalidCommand(helpText=helpTextUnmountVolumes, invalidOptArg=True)
+
+            # Check for required options
+            if not mountpoints:
+                handleInvalidCommand(helpText=helpTextUnmountVolumes, invalidOptArg=True)
+
+            # Unmount volumes
+            try:
+                unmount_volumes(mountpoints=mountpoints, max_workers=maxWorkers, print_output=True)
+            except (InvalidVolumeParameterError, MountOperationError):
+                sys.exit(1)
         else:
             handleInvalidCommand()
 
@@ -1375,6 +1939,70 @@ if __name__ == '__main__':
         else:
             handleInvalidCommand()
 
+    elif action == "prune":
+        # Get desired target from command line args
+        target = getTarget(sys.argv)
+
+        # Invoke desired action based on target
+        if target in ("snapshots", "snapshot", "snaps", "snap"):
+            volumeNames = None
+            snapshotName = None
+            clusterName = None
+            svmName = None
+            retentionCount = None
+            retentionDays = False
+            maxWorkers = 8
+
+            # Get command line options
+            try:
+                opts, args = getopt.getopt(sys.argv[3:], "hv:n:r:u:s:w:", ["cluster-name=","help", "svm=", "volumes=", "name=", "retention=", "workers="])
+            except Exception as err:
+                print(err)
+                handleInvalidCommand(helpText=helpTextPruneSnapshots, invalidOptArg=True)
+
+            # Parse command line options
+            for opt, arg in opts:
+                if opt in ("-h", "--help"):
+                    print(helpTextPruneSnapshots)
+                    sys.exit(0)
+                elif opt in ("-v", "--volumes"):
+                    volumeNames = arg.split(",")
+                elif opt in ("-n", "--name"):
+                    snapshotName = arg
+                elif opt in ("-r", "--retention"):
+                    retentionCount = arg
+                elif opt in ("-u", "--cluster-name"):
+                    clusterName = arg
+                elif opt in ("-s", "--svm"):
+                    svmName = arg
+                elif opt in ("-w", "--workers"):
+                    try:
+                        maxWorkers = int(arg)
+                    except ValueError:
+                        handleInvalidCommand(helpText=helpTextPruneSnapshots, invalidOptArg=True)
+
+            # Check for required options
+            if not volumeNames or not snapshotName or not retentionCount:
+                handleInvalidCommand(helpText=helpTextPruneSnapshots, invalidOptArg=True)
+
+            if not retentionCount.isnumeric():
+                matchObj = re.match("^(\d+)d$",retentionCount)
+                if not matchObj:
+                    handleInvalidCommand(helpText=helpTextPruneSnapshots, invalidOptArg=True)
+                else:
+                    retentionCount = matchObj.group(1)
+                    retentionDays = True
+
+            # Prune snapshots
+            try:
+                prune_snapshots(volume_names=volumeNames, snapshot_name=snapshotName, retention_count=retentionCount, retention_days=retentionDays,
+                                cluster_name=clusterName, svm_name=svmName, max_workers=maxWorkers, print_output=True)
+            except (InvalidConfigError, APIConnectionError, InvalidSnapshotParameterError, InvalidVolumeParameterError):
+                sys.exit(1)
+
+        else:
+            handleInvalidCommand()
+
     elif action in ("pull-from-s3", "pull-s3", "s3-pull"):
         # Get desired target from command line args
         target = getTarget(sys.argv)
@@ -1384,10 +2012,28 @@ if __name__ == '__main__':
             s3Bucket = None
             s3ObjectKeyPrefix = ""
             localDirectory = None
+            maxWorkers = None
+            queueDepth = 1000
+            partitionPrefixes = None
+            discoverPartitions = False
+            listWorkers = 8
+            sync = False
+            delete = False
+            compareChecksums = False
+            partSize = None
+            maxConcurrency = None
+            multipartThreshold = None
+            unpackShards = False
+            resume = False
+            reportFile = None
+            stateDirectory = None
 
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hb:p:d:e:", ["help", "bucket=", "key-prefix=", "directory="])
+                opts, args = getopt.getopt(sys.argv[3:], "hb:p:d:e:w:q:s:al:ycrz:n:t:xuo:j:", ["help", "bucket=", "key-prefix=", "directory=", "workers=", "queue-depth=",
+                                                                                      "partitions=", "discover-partitions", "list-workers=", "sync", "checksum", "delete",
+                                                                                      "part-size=", "concurrency=", "multipart-threshold=", "unpack-shards", "resume",
+                                                                                      "report=", "state-directory="])
             except Exception as err:                
                 print(err)
                 handleInvalidCommand(helpText=helpTextPullFromS3Bucket, invalidOptArg=True)
@@ -1403,14 +2049,74 @@ if __name__ == '__main__':
                     s3ObjectKeyPrefix = arg
                 elif opt in ("-d", "--directory"):
                     localDirectory = arg
+                elif opt in ("-w", "--workers", "-q", "--queue-depth", "-l", "--list-workers"):
+                    try:
+                        value = int(arg)
+                    except ValueError:
+                        handleInvalidCommand(helpText=helpTextPullFromS3Bucket, invalidOptArg=True)
+                    if value < 1:
+                        handleInvalidCommand(helpText=helpTextPullFromS3Bucket, invalidOptArg=True)
+                    if opt in ("-w", "--workers"):
+                        maxWorkers = value
+                    elif opt in ("-q", "--queue-depth"):
+                        queueDepth = value
+                    else:
+                        listWorkers = value
+                elif opt in ("-s", "--partitions"):
+                    if arg.startswith("hex:"):
+                        try:
+                            numDigits = int(arg[len("hex:"):])
+                        except ValueError:
+                            handleInvalidCommand(helpText=helpTextPullFromS3Bucket, invalidOptArg=True)
+                        if numDigits not in (1, 2, 3):
+                            handleInvalidCommand(helpText=helpTextPullFromS3Bucket, invalidOptArg=True)
+                        partitionPrefixes = ["%0*x" % (numDigits, i) for i in range(16 ** numDigits)]
+                    else:
+                        partitionPrefixes = [partitionPrefix for partitionPrefix in arg.split(",") if partitionPrefix]
+                elif opt in ("-a", "--discover-partitions"):
+                    discoverPartitions = True
+                elif opt in ("-y", "--sync"):
+                    sync = True
+                elif opt in ("-c", "--checksum"):
+                    compareChecksums = True
+                elif opt in ("-r", "--delete"):
+                    delete = True
+                elif opt in ("-z", "--part-size"):
+                    partSize = arg
+                elif opt in ("-n", "--concurrency"):
+                    try:
+                        maxConcurrency = int(arg)
+                    except ValueError:
+                        handleInvalidCommand(helpText=helpTextPullFromS3Bucket, invalidOptArg=True)
+                elif opt in ("-t", "--multipart-threshold"):
+                    multipartThreshold = arg
+                elif opt in ("-x", "--unpack-shards"):
+                    unpackShards = True
+                elif opt in ("-u", "--resume"):
+                    resume = True
+                elif opt in ("-o", "--report"):
+                    reportFile = arg
+                elif opt in ("-j", "--state-directory"):
+                    stateDirectory = arg
 
             # Check for required options
             if not s3Bucket or not localDirectory:
                 handleInvalidCommand(helpText=helpTextPullFromS3Bucket, invalidOptArg=True)
 
+            if (delete or compareChecksums) and not sync:
+                handleInvalidCommand(helpText=helpTextPullFromS3Bucket, invalidOptArg=True)
+
+            if unpackShards and sync:
+                handleInvalidCommand(helpText=helpTextPullFromS3Bucket, invalidOptArg=True)
+
             # Push file to S3
             try:
-                pull_bucket_from_s3(s3_bucket=s3Bucket, local_directory=localDirectory, s3_object_key_prefix=s3ObjectKeyPrefix, print_output=True)
+                pull_bucket_from_s3(s3_bucket=s3Bucket, local_directory=localDirectory, s3_object_key_prefix=s3ObjectKeyPrefix,
+                                    max_workers=maxWorkers, queue_depth=queueDepth, partition_prefixes=partitionPrefixes,
+                                    discover_partitions=discoverPartitions, list_workers=listWorkers, sync=sync, delete=delete,
+                                    compare_checksums=compareChecksums, multipart_chunksize=partSize, max_concurrency=maxConcurrency, multipart_threshold=multipartThreshold,
+                                    unpack_shards=unpackShards, resume=resume, report_file=reportFile, state_directory=stateDirectory,
+                                    print_output=True)
             except (InvalidConfigError, APIConnectionError):
                 sys.exit(1)
 
@@ -1418,10 +2124,13 @@ if __name__ == '__main__':
             s3Bucket = None
             s3ObjectKey = None
             localFile = None
+            partSize = None
+            maxConcurrency = None
+            multipartThreshold = None
 
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hb:k:f:", ["help", "bucket=", "key=", "file=", "extra-args="])
+                opts, args = getopt.getopt(sys.argv[3:], "hb:k:f:z:n:t:", ["help", "bucket=", "key=", "file=", "extra-args=", "part-size=", "concurrency=", "multipart-threshold="])
             except Exception as err:                
                 print(err)
                 handleInvalidCommand(helpText=helpTextPullFromS3Object, invalidOptArg=True)
@@ -1437,6 +2146,15 @@ if __name__ == '__main__':
                     s3ObjectKey = arg
                 elif opt in ("-f", "--file"):
                     localFile = arg
+                elif opt in ("-z", "--part-size"):
+                    partSize = arg
+                elif opt in ("-n", "--concurrency"):
+                    try:
+                        maxConcurrency = int(arg)
+                    except ValueError:
+                        handleInvalidCommand(helpText=helpTextPullFromS3Object, invalidOptArg=True)
+                elif opt in ("-t", "--multipart-threshold"):
+                    multipartThreshold = arg
 
             # Check for required options
             if not s3Bucket or not s3ObjectKey:
@@ -1444,7 +2162,8 @@ if __name__ == '__main__':
 
             # Push file to S3
             try:
-                pull_object_from_s3(s3_bucket=s3Bucket, s3_object_key=s3ObjectKey, local_file=localFile, print_output=True)
+                pull_object_from_s3(s3_bucket=s3Bucket, s3_object_key=s3ObjectKey, local_file=localFile, multipart_chunksize=partSize, max_concurrency=maxConcurrency, multipart_threshold=multipartThreshold,
+                                    print_output=True)
             except (InvalidConfigError, APIConnectionError):
                 sys.exit(1)
 
@@ -1461,10 +2180,26 @@ if __name__ == '__main__':
             s3ObjectKeyPrefix = ""
             localDirectory = None
             s3ExtraArgs = None
+            maxWorkers = None
+            queueDepth = 1000
+            sync = False
+            delete = False
+            compareChecksums = False
+            partSize = None
+            maxConcurrency = None
+            multipartThreshold = None
+            shardSize = None
+            stagingDirectory = None
+            resume = False
+            reportFile = None
+            stateDirectory = None
 
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hb:p:d:e:", ["help", "bucket=", "key-prefix=", "directory=", "extra-args="])
+                opts, args = getopt.getopt(sys.argv[3:], "hb:p:d:e:w:q:ycrz:n:t:k:g:uo:j:", ["help", "bucket=", "key-prefix=", "directory=", "extra-args=", "workers=",
+                                                                                "queue-depth=", "sync", "checksum", "delete", "part-size=", "concurrency=",
+                                                                                "multipart-threshold=", "shard-size=", "staging-directory=", "resume", "report=",
+                                                                                "state-directory="])
             except Exception as err:                
                 print(err)
                 handleInvalidCommand(helpText=helpTextPushToS3Directory, invalidOptArg=True)
@@ -1482,14 +2217,60 @@ if __name__ == '__main__':
                     localDirectory = arg
                 elif opt in ("-e", "--extra-args"):
                     s3ExtraArgs = arg
+                elif opt in ("-w", "--workers", "-q", "--queue-depth"):
+                    try:
+                        value = int(arg)
+                    except ValueError:
+                        handleInvalidCommand(helpText=helpTextPushToS3Directory, invalidOptArg=True)
+                    if value < 1:
+                        handleInvalidCommand(helpText=helpTextPushToS3Directory, invalidOptArg=True)
+                    if opt in ("-w", "--workers"):
+                        maxWorkers = value
+                    else:
+                        queueDepth = value
+                elif opt in ("-y", "--sync"):
+                    sync = True
+                elif opt in ("-c", "--checksum"):
+                    compareChecksums = True
+                elif opt in ("-r", "--delete"):
+                    delete = True
+                elif opt in ("-z", "--part-size"):
+                    partSize = arg
+                elif opt in ("-n", "--concurrency"):
+                    try:
+                        maxConcurrency = int(arg)
+                    except ValueError:
+                        handleInvalidCommand(helpText=helpTextPushToS3Directory, invalidOptArg=True)
+                elif opt in ("-t", "--multipart-threshold"):
+                    multipartThreshold = arg
+                elif opt in ("-k", "--shard-size"):
+                    shardSize = arg
+                elif opt in ("-g", "--staging-directory"):
+                    stagingDirectory = arg
+                elif opt in ("-u", "--resume"):
+                    resume = True
+                elif opt in ("-o", "--report"):
+                    reportFile = arg
+                elif opt in ("-j", "--state-directory"):
+                    stateDirectory = arg
 
             # Check for required options
             if not s3Bucket or not localDirectory:
                 handleInvalidCommand(helpText=helpTextPushToS3Directory, invalidOptArg=True)
 
+            if (delete or compareChecksums) and not sync:
+                handleInvalidCommand(helpText=helpTextPushToS3Directory, invalidOptArg=True)
+
+            if shardSize and sync:
+                handleInvalidCommand(helpText=helpTextPushToS3Directory, invalidOptArg=True)
+
             # Push file to S3
             try:
-                push_directory_to_s3(s3_bucket=s3Bucket, local_directory=localDirectory, s3_object_key_prefix=s3ObjectKeyPrefix, s3_extra_args=s3ExtraArgs, print_output=True)
+                push_directory_to_s3(s3_bucket=s3Bucket, local_directory=localDirectory, s3_object_key_prefix=s3ObjectKeyPrefix, s3_extra_args=s3ExtraArgs,
+                                     max_workers=maxWorkers, queue_depth=queueDepth, sync=sync, delete=delete, compare_checksums=compareChecksums,
+                                     multipart_chunksize=partSize, max_concurrency=maxConcurrency, multipart_threshold=multipartThreshold, shard_size=shardSize,
+                                     staging_directory=stagingDirectory, resume=resume, report_file=reportFile, state_directory=stateDirectory,
+                                     print_output=True)
             except (InvalidConfigError, APIConnectionError):
                 sys.exit(1)
 
@@ -1498,10 +2279,13 @@ if __name__ == '__main__':
             s3ObjectKey = None
             localFile = None
             s3ExtraArgs = None
+            partSize = None
+            maxConcurrency = None
+            multipartThreshold = None
 
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hb:k:f:e:", ["help", "bucket=", "key=", "file=", "extra-args="])
+                opts, args = getopt.getopt(sys.argv[3:], "hb:k:f:e:z:n:t:", ["help", "bucket=", "key=", "file=", "extra-args=", "part-size=", "concurrency=", "multipart-threshold="])
             except Exception as err:                
                 print(err)
                 handleInvalidCommand(helpText=helpTextPushToS3File, invalidOptArg=True)
@@ -1519,6 +2303,15 @@ if __name__ == '__main__':
                     localFile = arg
                 elif opt in ("-e", "--extra-args"):
                     s3ExtraArgs = arg
+                elif opt in ("-z", "--part-size"):
+                    partSize = arg
+                elif opt in ("-n", "--concurrency"):
+                    try:
+                        maxConcurrency = int(arg)
+                    except ValueError:
+                        handleInvalidCommand(helpText=helpTextPushToS3File, invalidOptArg=True)
+                elif opt in ("-t", "--multipart-threshold"):
+                    multipartThreshold = arg
 
             # Check for required options
             if not s3Bucket or not localFile:
@@ -1526,7 +2319,8 @@ if __name__ == '__main__':
 
             # Push file to S3
             try:
-                push_file_to_s3(s3_bucket=s3Bucket, s3_object_key=s3ObjectKey, local_file=localFile, s3_extra_args=s3ExtraArgs, print_output=True)
+                push_file_to_s3(s3_bucket=s3Bucket, s3_object_key=s3ObjectKey, local_file=localFile, s3_extra_args=s3ExtraArgs,
+                                multipart_chunksize=partSize, max_concurrency=maxConcurrency, multipart_threshold=multipartThreshold, print_output=True)
             except (InvalidConfigError, APIConnectionError):
                 sys.exit(1)
 
@@ -1629,6 +2423,55 @@ if __name__ == '__main__':
             except (InvalidConfigError, APIConnectionError, CloudSyncSyncOperationError):
                 sys.exit(1)
 
+        elif target in ("cloud-sync-relationships", "cloud-syncs"):
+            relationshipIDs = None
+            waitUntilComplete = False
+            minInterval = 10
+            maxInterval = 60
+            timeout = None
+
+            # Get command line options
+            try:
+                opts, args = getopt.getopt(sys.argv[3:], "hi:wp:m:t:", ["help", "ids=", "wait", "interval=", "max-interval=", "timeout="])
+            except Exception as err:
+                print(err)
+                handleInvalidCommand(helpText=helpTextSyncCloudSyncRelationships, invalidOptArg=True)
+
+            # Parse command line options
+            for opt, arg in opts:
+                if opt in ("-h", "--help"):
+                    print(helpTextSyncCloudSyncRelationships)
+                    sys.exit(0)
+                elif opt in ("-i", "--ids"):
+                    relationshipIDs = [relationshipID for relationshipID in arg.split(",") if relationshipID]
+                elif opt in ("-w", "--wait"):
+                    waitUntilComplete = True
+                elif opt in ("-p", "--interval", "-m", "--max-interval", "-t", "--timeout"):
+                    try:
+                        value = float(arg)
+                    except ValueError:
+                        handleInvalidCommand(helpText=helpTextSyncCloudSyncRelationships, invalidOptArg=True)
+                    if opt in ("-p", "--interval"):
+                        minInterval = value
+                    elif opt in ("-m", "--max-interval"):
+                        maxInterval = value
+                    else:
+                        timeout = value
+
+            # Check for required options
+            if not relationshipIDs or minInterval <= 0 or maxInterval < minInterval:
+                handleInvalidCommand(helpText=helpTextSyncCloudSyncRelationships, invalidOptArg=True)
+
+            # Update cloud sync relationships
+            try:
+                syncResults = sync_cloud_sync_relationships(relationship_ids=relationshipIDs, wait_until_complete=waitUntilComplete, min_interval=minInterval,
+                                                            max_interval=maxInterval, timeout=timeout, print_output=True)
+            except (InvalidConfigError, APIConnectionError):
+                sys.exit(1)
+
+            if [syncResult for syncResult in syncResults if syncResult["Status"] == "failed"]:
+                sys.exit(1)
+
         elif target in ("snapmirror-relationship", "snapmirror"):
             uuid = None
             volumeName = None
@@ -1674,6 +2517,58 @@ if __name__ == '__main__':
                     SnapMirrorSyncOperationError) :
                 sys.exit(1)
 
+        elif target in ("snapmirror-relationships", "snapmirrors"):
+            uuids = None
+            volumeNames = None
+            svmName = None
+            clusterName = None
+            waitUntilComplete = False
+            timeout = None
+
+            # Get command line options
+            try:
+                opts, args = getopt.getopt(sys.argv[3:], "hi:n:u:v:wt:", ["help", "uuids=", "names=", "cluster-name=", "svm=", "wait", "timeout="])
+            except Exception as err:
+                print(err)
+                handleInvalidCommand(helpText=helpTextSyncSnapMirrorRelationships, invalidOptArg=True)
+
+            # Parse command line options
+            for opt, arg in opts:
+                if opt in ("-h", "--help"):
+                    print(helpTextSyncSnapMirrorRelationships)
+                    sys.exit(0)
+                elif opt in ("-i", "--uuids"):
+                    uuids = [uuid for uuid in arg.split(",") if uuid]
+                elif opt in ("-n", "--names"):
+                    volumeNames = [volumeName for volumeName in arg.split(",") if volumeName]
+                elif opt in ("-u", "--cluster-name"):
+                    clusterName = arg
+                elif opt in ("-v", "--svm"):
+                    svmName = arg
+                elif opt in ("-w", "--wait"):
+                    waitUntilComplete = True
+                elif opt in ("-t", "--timeout"):
+                    try:
+                        timeout = int(arg)
+                    except ValueError:
+                        handleInvalidCommand(helpText=helpTextSyncSnapMirrorRelationships, invalidOptArg=True)
+
+            # Check for required options
+            if not uuids and not volumeNames:
+                handleInvalidCommand(helpText=helpTextSyncSnapMirrorRelationships, invalidOptArg=True)
+
+            # Update SnapMirror relationships
+            try:
+                syncResults = sync_snap_mirror_relationships(uuids=uuids, volume_names=volumeNames, svm_name=svmName, cluster_name=clusterName,
+                                                             wait_until_complete=waitUntilComplete, timeout=timeout, print_output=True)
+            except (
+                    InvalidConfigError, APIConnectionError, InvalidSnapMirrorParameterError,
+                    SnapMirrorSyncOperationError) :
+                sys.exit(1)
+
+            if [syncResult for syncResult in syncResults if syncResult["Status"] == "failed"]:
+                sys.exit(1)
+
         else:
             handleInvalidCommand()
 
@@ -5,22 +5,38 @@ by applications using the import method of utilizing the toolkit.
 """
 
 import base64
+import collections
+import copy
 import functools
+import hashlib
 import json
 import os
+import queue
 import re
+import shutil
+import socket
 import subprocess
 import sys
+import tarfile
+import tempfile
+import threading
 import time
 import warnings
 import datetime
-from concurrent.futures import ThreadPoolExecutor
+import zlib
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, as_completed
 import boto3
+from boto3.s3.transfer import TransferConfig as S3TransferConfig
 from botocore.client import Config as BotoConfig
+from botocore.exceptions import ClientError as BotoClientError
+from s3transfer.utils import ReadFileChunk
 from netapp_ontap import config as netappConfig
+from netapp_ontap import host_connection as netappHostConnection
 from netapp_ontap.error import NetAppRestError
 from netapp_ontap.host_connection import HostConnection as NetAppHostConnection
+from netapp_ontap.resources import Aggregate as NetAppAggregate
 from netapp_ontap.resources import Flexcache as NetAppFlexCache
+from netapp_ontap.resources import IpInterface as NetAppIpInterface
 from netapp_ontap.resources import SnapmirrorRelationship as NetAppSnapmirrorRelationship
 from netapp_ontap.resources import SnapmirrorTransfer as NetAppSnapmirrorTransfer
 from netapp_ontap.resources import Snapshot as NetAppSnapshot
@@ -28,15 +44,24 @@ from netapp_ontap.resources import Volume as NetAppVolume
 from netapp_ontap.resources import ExportPolicy as NetAppExportPolicy
 from netapp_ontap.resources import SnapshotPolicy as NetAppSnapshotPolicy
 from netapp_ontap.resources import CLI as NetAppCLI
+from netapp_ontap.resources import Job as NetAppJob
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from tabulate import tabulate
+from urllib3.util.retry import Retry
 import yaml
 
 
 __version__ = "2.3.0"
 
 
+# Client bound to the current thread by DataOpsClient, and the lazily-created client used by the module-level functions
+_clientContext = threading.local()
+_defaultClient = None
+_defaultClientLock = threading.Lock()
+
+
 # Using this decorator in lieu of using a dependency to manage deprecation
 def deprecated(func):
     @functools.wraps(func)
@@ -93,6 +118,99 @@ class APIConnectionError(Exception) :
     pass
 
 
+class _LookupCache:
+    """Thread-safe, size-bounded LRU cache whose entries expire after a fixed number of seconds"""
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 300, enabled: bool = True):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.enabled = enabled
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key, value):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, predicate):
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# Volume/snapshot name to UUID mappings, keyed by ("volume", cluster, svm, volume name) and ("snapshot", volume uuid, snapshot name)
+_uuidCache = _LookupCache(max_entries=1024, ttl=300)
+
+# Latest snapshot matching a prefix, keyed by (volume uuid, prefix)
+_latestSnapshotCache = _LookupCache(max_entries=256, ttl=60)
+
+# NFS data LIFs of an SVM and the nodes that own the cluster's aggregates, keyed by (cluster, svm); used for locality-aware LIF selection
+_svmDataLifCache = _LookupCache(max_entries=64, ttl=300)
+
+# Clusters that rejected the export/snapshot policies in a clone creation request
+_clonePolicyPostUnsupportedClusters = set()
+
+# Cloud Sync access tokens and account IDs, keyed by a hash of the Cloud Central refresh token
+_cloudSyncAccessCache = dict()
+_cloudSyncLock = threading.RLock()
+_cloudSyncSession = None
+
+# Access tokens are refreshed this many seconds before they expire
+_cloudSyncTokenRefreshMargin = 300
+
+# Name of the manifest that records the state of files synced to/from S3; stored in the S3 state directory, keyed by the transfer's scope
+_s3SyncManifestNameFormat = "sync-%s.json"
+
+# Name of the journal that records the progress of a resumable bulk S3 transfer; stored in the S3 state directory, keyed by the transfer's scope
+_s3TransferJournalNameFormat = "journal-%s.ndjson"
+
+# Names of the tar shards that files are packed into when pushing a directory to S3 in packing mode
+_s3ShardNameFormat = "shard-%06d.tar"
+_s3ShardNameRegex = re.compile(r"shard-[0-9]+\.tar$")
+
+# Named NFS mount profiles; profiles of the same name in the config file ("mountProfiles") take precedence. With NFS 4.1, pNFS is used
+# automatically where the SVM supports it, so that I/O goes directly to the node that owns the data.
+_nfsMountProfiles = {
+    # Read-mostly datasets: parallel connections, large transfers, long attribute caching and no close-to-open consistency checks
+    "training-read": {"vers": "4.1", "nconnect": 16, "rsize": 1048576, "wsize": 1048576, "hard": True, "actimeo": 600, "nocto": True},
+    # Checkpoints and other output: parallel connections and large transfers; close-to-open consistency is retained so that readers
+    # on other nodes see complete files
+    "checkpoint-write": {"vers": "4.1", "nconnect": 8, "rsize": 1048576, "wsize": 1048576, "hard": True}
+}
+
+# NFS mount options that are accepted in mount profiles (see nfs(5)), and the Linux kernel versions that introduced the newer ones
+_nfsMountOptionNames = {"vers", "nfsvers", "minorversion", "proto", "port", "mountport", "nconnect", "max_connect", "rsize", "wsize", "timeo",
+                        "retrans", "hard", "soft", "softerr", "intr", "nointr", "ac", "noac", "actimeo", "acregmin", "acregmax", "acdirmin",
+                        "acdirmax", "cto", "nocto", "lookupcache", "local_lock", "lock", "nolock", "sec", "atime", "noatime", "diratime",
+                        "nodiratime", "sync", "async", "fsc", "nofsc", "sharecache", "nosharecache", "resvport", "noresvport", "xprtsec"}
+_nfsMountOptionMinKernelVersions = {"nconnect": (5, 3), "softerr": (5, 1), "max_connect": (5, 15), "xprtsec": (6, 5)}
+
+# First line of the automount maps and unit files that are generated by the toolkit; used to recognize them when regenerating
+_automountMapHeader = "# Generated by the NetApp DataOps Toolkit; changes will be overwritten when the automount map is regenerated."
+
+
 def _print_api_response(response: requests.Response):
     print("API Response:")
     print("Status Code: ", response.status_code)
@@ -101,39 +219,91 @@ def _print_api_response(response: requests.Response):
         print("Body: ", response.text)
 
 
-def _download_from_s3(s3Endpoint: str, s3AccessKeyId: str, s3SecretAccessKey: str, s3VerifySSLCert: bool,
-                   s3CACertBundle: str, s3Bucket: str, s3ObjectKey: str, localFile: str, print_output: bool = False):
-    # Instantiate S3 session
-    try:
-        s3 = _instantiate_s3_session(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId,
-                                  s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert,
-                                  s3CACertBundle=s3CACertBundle, print_output=print_output)
-    except Exception as err:
-        if print_output:
-            print("Error: S3 API error: ", err)
-        raise APIConnectionError(err)
-
+def _download_from_s3(s3Client, s3Bucket: str, s3ObjectKey: str, localFile: str, transferConfig: S3TransferConfig = None,
+                      objectSize: int = None, etag: str = None, print_output: bool = False):
     if print_output:
         print(
             "Downloading object '" + s3ObjectKey + "' from bucket '" + s3Bucket + "' and saving as '" + localFile + "'.")
 
-    # Create directories that don't exist
+    # Create directories that don't exist; other workers may be creating the same directories concurrently
     if localFile.find(os.sep) != -1:
         dirs = localFile.split(os.sep)
         dirpath = os.sep.join(dirs[:len(dirs) - 1])
-        if not os.path.exists(dirpath):
-            os.makedirs(dirpath)
+        if dirpath:
+            os.makedirs(dirpath, exist_ok=True)
 
-    # Download the file
+    # Download the file; large objects are downloaded with parallel ranged requests where positional writes are supported
     try:
-        s3.Object(s3Bucket, s3ObjectKey).download_file(localFile)
+        if transferConfig and objectSize is not None and objectSize >= transferConfig.multipart_threshold and objectSize > 0 \
+                and transferConfig.use_threads and transferConfig.max_concurrency > 1 and hasattr(os, "pwrite"):
+            _download_from_s3_ranged(s3Client, s3Bucket=s3Bucket, s3ObjectKey=s3ObjectKey, localFile=localFile, objectSize=objectSize,
+                                     etag=etag, transferConfig=transferConfig)
+        else:
+            s3Client.download_file(s3Bucket, s3ObjectKey, localFile, Config=transferConfig)
     except Exception as err:
         if print_output:
             print("Error: S3 API error: ", err)
         raise APIConnectionError(err)
 
 
-def _get_cloud_central_access_token(refreshToken: str, print_output: bool = False) -> str:
+def _download_from_s3_ranged(s3Client, s3Bucket: str, s3ObjectKey: str, localFile: str, objectSize: int, etag: str,
+                             transferConfig: S3TransferConfig):
+    # Download parts concurrently into a preallocated temporary file, each part being written at its own offset, then move the
+    # complete file into place. All requests are conditional on the ETag, so that parts of different versions are never mixed.
+    partSize = transferConfig.multipart_chunksize
+    temporaryFile = localFile + ".netapp_dataops_download"
+    fileDescriptor = os.open(temporaryFile, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        try:
+            os.posix_fallocate(fileDescriptor, 0, objectSize)
+        except (AttributeError, OSError):
+            # Not supported on all platforms and filesystems (e.g. some NFS mounts)
+            os.ftruncate(fileDescriptor, objectSize)
+
+        def download_range(offset: int):
+            end = min(offset + partSize, objectSize) - 1
+            conditions = {"IfMatch": etag} if etag else dict()
+            body = s3Client.get_object(Bucket=s3Bucket, Key=s3ObjectKey, Range="bytes=%d-%d" % (offset, end), **conditions)["Body"]
+            try:
+                while offset <= end:
+                    chunk = body.read(min(transferConfig.io_chunksize * 4, end + 1 - offset))
+                    if not chunk:
+                        raise IOError("Incomplete response for byte range ending at " + str(end) + " of object '" + s3ObjectKey + "'")
+                    chunkView = memoryview(chunk)
+                    while chunkView:
+                        numWritten = os.pwrite(fileDescriptor, chunkView, offset)
+                        chunkView = chunkView[numWritten:]
+                        offset += numWritten
+            finally:
+                body.close()
+
+        with ThreadPoolExecutor(max_workers=transferConfig.max_concurrency) as executor:
+            for _ in executor.map(download_range, range(0, objectSize, partSize)):
+                pass
+    except:
+        os.close(fileDescriptor)
+        os.remove(temporaryFile)
+        raise
+
+    os.close(fileDescriptor)
+    os.replace(temporaryFile, localFile)
+
+
+def _get_cloud_sync_session() -> requests.Session:
+    # Shared keep-alive session for Cloud Central/Cloud Sync API calls; rate-limited and failed requests are retried with backoff.
+    # PUT requests (e.g. triggering a sync) are not retried, as retrying them is not safe.
+    global _cloudSyncSession
+    with _cloudSyncLock:
+        if not _cloudSyncSession:
+            retries = Retry(total=5, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                            allowed_methods=frozenset(["GET", "POST"]), respect_retry_after_header=True, raise_on_status=False)
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(max_retries=retries, pool_connections=4, pool_maxsize=32))
+            _cloudSyncSession = session
+        return _cloudSyncSession
+
+
+def _get_cloud_central_access_token(refreshToken: str, print_output: bool = False) -> (str, int):
     # Define parameters for API call
     url = "https://netapp-cloud-account.auth0.com/oauth/token"
     headers = {
@@ -146,12 +316,13 @@ def _get_cloud_central_access_token(refreshToken: str, print_output: bool = Fals
     }
 
     # Call API to optain access token
-    response = requests.post(url=url, headers=headers, data=json.dumps(data))
+    response = _get_cloud_sync_session().post(url=url, headers=headers, data=json.dumps(data))
 
-    # Parse response to retrieve access token
+    # Parse response to retrieve access token and its lifetime
     try:
         responseBody = json.loads(response.text)
         accessToken = responseBody["access_token"]
+        expiresIn = int(responseBody.get("expires_in", 0))
     except:
         errorMessage = "Error obtaining access token from Cloud Sync API"
         if print_output:
@@ -159,83 +330,952 @@ def _get_cloud_central_access_token(refreshToken: str, print_output: bool = Fals
             _print_api_response(response)
         raise APIConnectionError(errorMessage, response)
 
-    return accessToken
+    return accessToken, expiresIn
+
+
+def _get_cloud_sync_token_cache_path() -> str:
+    # Persisted access tokens are stored next to the config file
+    return os.path.join(os.path.dirname(_get_client()._configFilePath), "cloud_sync_token.json")
+
+
+def _get_s3_state_path(nameFormat: str, scope: str, localDirectory: str, stateDirectory: str = None) -> str:
+    # State that is kept between S3 transfers is stored outside of the local directory, which may be read-only (e.g. a snapshot or a
+    # read-only clone), in a directory next to the config file by default. Each file is named after a hash of the transfer's scope.
+    # The directory is created when a file is first written to it.
+    if not stateDirectory:
+        stateDirectory = os.path.join(os.path.dirname(_get_client()._configFilePath), "s3_state")
+    stateDirectory = os.path.expanduser(stateDirectory)
+    scopeHash = hashlib.sha256((scope + "|" + os.path.abspath(localDirectory)).encode()).hexdigest()[:16]
+    return os.path.join(stateDirectory, nameFormat % scopeHash)
 
-def _get_cloud_sync_access_parameters(refreshToken: str, print_output: bool = False) -> (str, str):
+
+def _load_persisted_cloud_sync_access(cacheKey: str) -> dict:
+    tokenCachePath = _get_cloud_sync_token_cache_path()
     try:
-        accessToken = _get_cloud_central_access_token(refreshToken=refreshToken, print_output=print_output)
-    except APIConnectionError:
-        raise
+        # Ignore the file unless it is owned by the current user and not accessible by anyone else
+        fileStat = os.stat(tokenCachePath)
+        if fileStat.st_mode & 0o077 or (hasattr(os, "getuid") and fileStat.st_uid != os.getuid()):
+            return None
+        with open(tokenCachePath) as tokenCacheFile:
+            return json.load(tokenCacheFile).get(cacheKey)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _persist_cloud_sync_access(cacheKey: str, cloudSyncAccess: dict):
+    tokenCachePath = _get_cloud_sync_token_cache_path()
+    temporaryPath = tokenCachePath + ".tmp"
+    try:
+        # Create file with owner-only permissions, then atomically replace the existing file
+        fileDescriptor = os.open(temporaryPath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fileDescriptor, "w") as tokenCacheFile:
+            json.dump({cacheKey: cloudSyncAccess}, tokenCacheFile)
+        os.replace(temporaryPath, tokenCachePath)
+    except OSError:
+        pass
 
-    # Define parameters for API call
-    url = "https://cloudsync.netapp.com/api/accounts"
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": "Bearer " + accessToken
-    }
 
-    # Call API to obtain account ID
-    response = requests.get(url=url, headers=headers)
+def _get_cloud_sync_access_parameters(refreshToken: str, print_output: bool = False, force_refresh: bool = False) -> (str, str):
+    try:
+        persistToken = bool(_get_client(print_output=print_output).get_config().get("cloudSyncTokenCache", False))
+    except InvalidConfigError:
+        persistToken = False
+    cacheKey = hashlib.sha256(refreshToken.encode("ascii")).hexdigest()
+
+    # Concurrent callers wait for a single token refresh
+    with _cloudSyncLock:
+        cloudSyncAccess = _cloudSyncAccessCache.get(cacheKey)
+        if not cloudSyncAccess and persistToken:
+            cloudSyncAccess = _load_persisted_cloud_sync_access(cacheKey)
+
+        if cloudSyncAccess and not force_refresh and time.time() < cloudSyncAccess["expiresAt"] - _cloudSyncTokenRefreshMargin:
+            _cloudSyncAccessCache[cacheKey] = cloudSyncAccess
+            return cloudSyncAccess["accessToken"], cloudSyncAccess["accountId"]
+
+        try:
+            accessToken, expiresIn = _get_cloud_central_access_token(refreshToken=refreshToken, print_output=print_output)
+        except APIConnectionError:
+            raise
+
+        # The account ID does not change when the access token is refreshed
+        accountId = cloudSyncAccess["accountId"] if cloudSyncAccess else None
+        if not accountId:
+            # Define parameters for API call
+            url = "https://cloudsync.netapp.com/api/accounts"
+            headers = {
+                "Content-Type": "application/json",
+                "Authorization": "Bearer " + accessToken
+            }
+
+            # Call API to obtain account ID
+            response = _get_cloud_sync_session().get(url=url, headers=headers)
+
+            # Parse response to retrieve account ID
+            try:
+                responseBody = json.loads(response.text)
+                accountId = responseBody[0]["accountId"]
+            except:
+                errorMessage = "Error obtaining account ID from Cloud Sync API"
+                if print_output:
+                    print("Error:", errorMessage)
+                    _print_api_response(response)
+                raise APIConnectionError(errorMessage, response)
+
+        cloudSyncAccess = {"accessToken": accessToken, "accountId": accountId, "expiresAt": time.time() + expiresIn}
+        _cloudSyncAccessCache[cacheKey] = cloudSyncAccess
+        if persistToken:
+            _persist_cloud_sync_access(cacheKey, cloudSyncAccess)
+
+    # Return access token and account ID
+    return accessToken, accountId
+
 
-    # Parse response to retrieve account ID
+def _call_cloud_sync_api(method: str, url: str, refreshToken: str, headers: dict = None, print_output: bool = False) -> requests.Response:
+    # Call Cloud Sync API using the cached access token; if the token has been revoked or has expired, refresh it and try once more
+    for forceRefresh in (False, True):
+        try:
+            accessToken, accountId = _get_cloud_sync_access_parameters(refreshToken=refreshToken, print_output=print_output, force_refresh=forceRefresh)
+        except APIConnectionError:
+            raise
+        requestHeaders = {
+            "Accept": "application/json",
+            "x-account-id": accountId,
+            "Authorization": "Bearer " + accessToken
+        }
+        if headers:
+            requestHeaders.update(headers)
+        response = _get_cloud_sync_session().request(method, url=url, headers=requestHeaders)
+        if response.status_code != 401:
+            break
+    return response
+
+
+def _get_cloud_sync_activities(refreshToken: str, print_output: bool = False) -> dict:
+    # Retrieve the latest activity of every relationship with a single relationships-v2 listing
+    url = "https://cloudsync.netapp.com/api/relationships-v2"
     try:
-        responseBody = json.loads(response.text)
-        accountId = responseBody[0]["accountId"]
+        response = _call_cloud_sync_api("GET", url=url, refreshToken=refreshToken, print_output=print_output)
+    except APIConnectionError:
+        raise
+
+    try:
+        if response.status_code != 200:
+            raise ValueError()
+        return {relationship["id"]: relationship.get("activity") or dict() for relationship in json.loads(response.text)}
     except:
-        errorMessage = "Error obtaining account ID from Cloud Sync API"
+        errorMessage = "Error calling Cloud Sync API to retrieve list of relationships."
         if print_output:
             print("Error:", errorMessage)
             _print_api_response(response)
         raise APIConnectionError(errorMessage, response)
 
-    # Return access token and account ID
-    return accessToken, accountId
 
+def _new_cloud_sync_sync_result(relationship_id: str) -> dict:
+    return {"Relationship ID": relationship_id, "Status": "running", "Seconds": None, "Error": None}
+
+
+def _watch_cloud_sync_operations(syncResults: dict, previousActivities: dict, refreshToken: str, min_interval: float = 10, max_interval: float = 60,
+                                 timeout: int = None, print_output: bool = False):
+    # Watch all triggered sync operations with one relationships-v2 listing per tick until the last one has finished
+    startTime = time.monotonic()
+    interval = min_interval
+    runningIds = set()
+    while True:
+        activeIds = [relationshipId for relationshipId, syncResult in syncResults.items() if syncResult["Status"] == "running"]
+        if not activeIds:
+            return
+
+        elapsed = time.monotonic() - startTime
+        if timeout is not None and elapsed >= timeout:
+            for relationshipId in activeIds:
+                syncResults[relationshipId]["Status"] = "failed"
+                syncResults[relationshipId]["Error"] = "timed out"
+            return
+        time.sleep(interval if timeout is None else min(interval, timeout - elapsed))
 
-def _instantiate_connection(config: dict, connectionType: str = "ONTAP", print_output: bool = False):
-    if connectionType == "ONTAP":
-        ## Connection details for ONTAP cluster
         try:
-            ontapClusterMgmtHostname = config["hostname"]
-            ontapClusterAdminUsername = config["username"]
-            ontapClusterAdminPasswordBase64 = config["password"]
-            verifySSLCert = config["verifySSLCert"]
-        except:
+            activities = _get_cloud_sync_activities(refreshToken=refreshToken, print_output=print_output)
+        except APIConnectionError:
+            raise
+        seconds = round(time.monotonic() - startTime, 1)
+        stateChanged = False
+        for relationshipId in activeIds:
+            syncResult = syncResults[relationshipId]
+            if relationshipId not in activities:
+                stateChanged = True
+                syncResult["Status"] = "failed"
+                syncResult["Error"] = "relationship not found"
+                continue
+
+            activity = activities[relationshipId]
+            activityStatus = activity.get("status")
+            if activity.get("type") != "Sync":
+                continue
+            if activityStatus == "RUNNING":
+                if relationshipId not in runningIds:
+                    runningIds.add(relationshipId)
+                    stateChanged = True
+                continue
+
+            # The listing may still report the previous sync operation until the triggered one has started
+            if relationshipId not in runningIds and activity == previousActivities.get(relationshipId):
+                continue
+
+            stateChanged = True
+            syncResult["Seconds"] = seconds
+            if activityStatus == "DONE":
+                syncResult["Status"] = "success"
+            elif activityStatus == "FAILED":
+                syncResult["Status"] = "failed"
+                syncResult["Error"] = activity.get("failureMessage")
+            else:
+                syncResult["Status"] = "failed"
+                syncResult["Error"] = "unknown sync operation status (" + str(activityStatus) + ")"
             if print_output:
-                _print_invalid_config_error()
-            raise InvalidConfigError()
+                print("Cloud Sync relationship " + relationshipId + ": " + syncResult["Status"] + " after " + str(seconds) + " seconds.")
 
-        # Decode base64-encoded password
-        ontapClusterAdminPasswordBase64Bytes = ontapClusterAdminPasswordBase64.encode("ascii")
-        ontapClusterAdminPasswordBytes = base64.b64decode(ontapClusterAdminPasswordBase64Bytes)
-        ontapClusterAdminPassword = ontapClusterAdminPasswordBytes.decode("ascii")
+        # Check again quickly after an operation changes state, and back off while all operations are still running
+        interval = min_interval if stateChanged else min(interval * 1.5, max_interval)
 
-        # Instantiate connection to ONTAP cluster
-        netappConfig.CONNECTION = NetAppHostConnection(
-            host=ontapClusterMgmtHostname,
-            username=ontapClusterAdminUsername,
-            password=ontapClusterAdminPassword,
-            verify=verifySSLCert
-        )
+
+def _create_ontap_connection(config: dict, pool_size: int = 10, print_output: bool = False) -> NetAppHostConnection:
+    ## Connection details for ONTAP cluster
+    try:
+        ontapClusterMgmtHostname = config["hostname"]
+        ontapClusterAdminUsername = config["username"]
+        ontapClusterAdminPasswordBase64 = config["password"]
+        verifySSLCert = config["verifySSLCert"]
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    # Decode base64-encoded password
+    ontapClusterAdminPasswordBase64Bytes = ontapClusterAdminPasswordBase64.encode("ascii")
+    ontapClusterAdminPasswordBytes = base64.b64decode(ontapClusterAdminPasswordBase64Bytes)
+    ontapClusterAdminPassword = ontapClusterAdminPasswordBytes.decode("ascii")
+
+    # Instantiate connection to ONTAP cluster
+    connection = NetAppHostConnection(
+        host=ontapClusterMgmtHostname,
+        username=ontapClusterAdminUsername,
+        password=ontapClusterAdminPassword,
+        verify=verifySSLCert
+    )
+
+    # Size the keep-alive HTTP connection pool that is shared by all calls made through this connection
+    adapter = connection.session.get_adapter(connection.origin)
+    adapter.init_poolmanager(pool_size, pool_size)
+
+    return connection
+
+
+def _get_client(print_output: bool = False):
+    # Return the client that is active for the current thread, falling back to the process-wide default client
+    client = getattr(_clientContext, "client", None)
+    if client:
+        return client
+
+    global _defaultClient
+    with _defaultClientLock:
+        if not _defaultClient:
+            _defaultClient = DataOpsClient(print_output=print_output)
+        return _defaultClient
+
+
+def _bind_to_current_context(func):
+    # Wrap a function so that it runs against the calling thread's client and ONTAP connection when invoked from a worker thread
+    client = _get_client()
+    connection = NetAppHostConnection.get_host_context() or netappConfig.CONNECTION
+
+    @functools.wraps(func)
+    def bound_function(*args, **kwargs):
+        # The worker thread's previous connection is restored when the client context is exited
+        with client:
+            if connection:
+                _set_host_context(connection)
+            return func(*args, **kwargs)
+    return bound_function
+
+
+def _set_host_context(connection: NetAppHostConnection) -> NetAppHostConnection:
+    # Bind an ONTAP connection (or None) to the current thread, returning the connection that was bound before. HostConnection's own
+    # context manager saves the previous connection on the connection object, which is shared by all threads that use the same client,
+    # so the previous connection is kept per thread by the caller instead.
+    previousConnection = NetAppHostConnection.get_host_context()
+    netappHostConnection.LOCAL_DATA.host_context = connection
+    return previousConnection
+
+
+def _instantiate_connection(config: dict, connectionType: str = "ONTAP", print_output: bool = False) -> NetAppHostConnection:
+    if connectionType == "ONTAP":
+        # Reuse the active client's keep-alive connection to the ONTAP cluster. The connection is bound to the current thread instead of
+        # being set as the global netapp_ontap connection, so that calls that run concurrently on other threads (e.g. against other
+        # clusters) are not affected. Bindings made within a client context are undone when the context is exited.
+        connection = _get_client(print_output=print_output).get_connection(config=config, print_output=print_output)
+        _set_host_context(connection)
+        return connection
 
     else:
         raise ConnectionTypeError()
 
 
-def _instantiate_s3_session(s3Endpoint: str, s3AccessKeyId: str, s3SecretAccessKey: str, s3VerifySSLCert: bool, s3CACertBundle: str, print_output: bool = False):
-    # Instantiate session
+def _s3_default_max_workers() -> int:
+    # Same default as ThreadPoolExecutor
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def _run_bounded_pipeline(items, worker_func, max_workers: int, queue_depth: int) -> (int, int, Exception):
+    # Feed items from a (lazy) iterable through a bounded queue to a fixed pool of workers, so that memory use does not
+    # depend on the number of items; the producer blocks while the queue is full
+    workQueue = queue.Queue(maxsize=queue_depth)
+    endOfQueue = object()
+    counts = {"processed": 0, "failed": 0}
+    firstError = list()
+    countsLock = threading.Lock()
+
+    def consume():
+        while True:
+            item = workQueue.get()
+            if item is endOfQueue:
+                return
+            try:
+                worker_func(item)
+                failed = False
+            except Exception as err:
+                failed = True
+                with countsLock:
+                    if not firstError:
+                        firstError.append(err)
+            with countsLock:
+                counts["processed"] += 1
+                if failed:
+                    counts["failed"] += 1
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        consumers = [executor.submit(consume) for _ in range(max_workers)]
+        try:
+            for item in items:
+                workQueue.put(item)
+        finally:
+            # Let the workers drain the queue and exit, also if the producer failed
+            for _ in consumers:
+                workQueue.put(endOfQueue)
+
+    return counts["processed"], counts["failed"], (firstError[0] if firstError else None)
+
+
+def _list_s3_objects(s3Client, s3Bucket: str, s3ObjectKeyPrefix: str = "", partition_prefixes: list = None, discover_partitions: bool = False,
+                         list_workers: int = 8, queue_depth: int = 1000, print_output: bool = False):
+    # Without partitioning, list the bucket with a single sequential cursor
+    if not partition_prefixes and not discover_partitions:
+        paginator = s3Client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=s3Bucket, Prefix=s3ObjectKeyPrefix):
+            for obj in page.get("Contents", list()):
+                yield obj
+        return
+
+    # Otherwise, list partitions concurrently and yield objects in the order in which they arrive. When discovering partitions, each
+    # partition is listed one level deep with a delimiter, and every common prefix that is found is listed as a partition of its own.
+    keyQueue = queue.Queue(maxsize=queue_depth)
+    stopEvent = threading.Event()
+    paginator = s3Client.get_paginator("list_objects_v2")
+
+    def put(item) -> bool:
+        # Give up once the consumer has stopped, instead of blocking on a full queue forever
+        while not stopEvent.is_set():
+            try:
+                keyQueue.put(item, timeout=1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def list_partition(partitionPrefix: str, discover: bool):
+        numKeys = 0
+        try:
+            if discover:
+                pages = paginator.paginate(Bucket=s3Bucket, Prefix=partitionPrefix, Delimiter="/")
+            else:
+                pages = paginator.paginate(Bucket=s3Bucket, Prefix=partitionPrefix)
+            for page in pages:
+                for commonPrefix in page.get("CommonPrefixes", list()):
+                    # Registered before this partition is reported as finished, so the consumer never sees zero pending partitions early
+                    if not put(("partition", commonPrefix["Prefix"])):
+                        return
+                    executor.submit(list_partition, commonPrefix["Prefix"], True)
+                for obj in page.get("Contents", list()):
+                    if not put(("object", obj)):
+                        return
+                    numKeys += 1
+            put(("done", partitionPrefix, numKeys, None))
+        except Exception as err:
+            put(("done", partitionPrefix, numKeys, err))
+
+    executor = ThreadPoolExecutor(max_workers=list_workers)
+    try:
+        partitions = [s3ObjectKeyPrefix + partitionPrefix for partitionPrefix in (partition_prefixes or [""])]
+        for partitionPrefix in partitions:
+            executor.submit(list_partition, partitionPrefix, discover_partitions)
+        numPending = len(partitions)
+        numListed = 0
+        while numPending:
+            item = keyQueue.get()
+            if item[0] == "object":
+                yield item[1]
+            elif item[0] == "partition":
+                numPending += 1
+            else:
+                numPending -= 1
+                _, partitionPrefix, numKeys, err = item
+                if err:
+                    if print_output:
+                        print("Error: Listing of partition '" + partitionPrefix + "' failed: ", err)
+                    raise err
+                numListed += 1
+                if print_output:
+                    print("Listed partition '" + partitionPrefix + "': " + str(numKeys) + " object(s) (" + str(numListed) +
+                          " partition(s) listed, " + str(numPending) + " pending).")
+    finally:
+        stopEvent.set()
+        executor.shutdown(wait=False)
+
+
+def _iter_s3_objects(s3Client, s3Bucket: str, s3ObjectKeyPrefix: str, max_workers: int, maxBufferSize: int, ordered: bool = False,
+                     print_output: bool = False):
+    # Download objects concurrently into memory and yield them as (key, bytes). An object is only requested once its size fits within
+    # the buffer budget (an object that is larger than the whole budget is requested on its own), and its share of the budget is released
+    # when the caller asks for the next object. The number of objects that are downloading or waiting to be yielded is also capped.
+    maxBufferedObjects = 2 * max_workers
+    budget = threading.Condition()
+    state = {"bufferedBytes": 0, "bufferedObjects": 0, "stopped": False}
+    results = queue.Queue()
+
+    def reserve(size: int) -> bool:
+        size = min(size, maxBufferSize)
+        with budget:
+            while not state["stopped"] and (state["bufferedObjects"] >= maxBufferedObjects or
+                                            (state["bufferedObjects"] and state["bufferedBytes"] + size > maxBufferSize)):
+                budget.wait()
+            if state["stopped"]:
+                return False
+            state["bufferedBytes"] += size
+            state["bufferedObjects"] += 1
+            return True
+
+    def release(size: int):
+        with budget:
+            state["bufferedBytes"] -= min(size, maxBufferSize)
+            state["bufferedObjects"] -= 1
+            budget.notify_all()
+
+    def download_object(sequenceNumber: int, obj: dict):
+        try:
+            body = s3Client.get_object(Bucket=s3Bucket, Key=obj["Key"])["Body"]
+            try:
+                data = body.read()
+            finally:
+                body.close()
+            results.put(("object", sequenceNumber, obj, data, None))
+        except Exception as err:
+            results.put(("object", sequenceNumber, obj, None, err))
+
+    def dispatch_downloads():
+        # List the prefix and start downloading each object as soon as it fits within the budget
+        numListed = 0
+        try:
+            for obj in _list_s3_objects(s3Client, s3Bucket=s3Bucket, s3ObjectKeyPrefix=s3ObjectKeyPrefix):
+                if not reserve(obj["Size"]):
+                    return
+                executor.submit(download_object, numListed, obj)
+                numListed += 1
+            results.put(("listed", numListed, None))
+        except Exception as err:
+            results.put(("listed", numListed, err))
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    dispatcher = threading.Thread(target=dispatch_downloads, daemon=True)
+    dispatcher.start()
+    try:
+        numListed = None
+        numYielded = 0
+        pending = dict()
+        nextSequenceNumber = 0
+        while numListed is None or numYielded < numListed:
+            item = results.get()
+            if item[0] == "listed":
+                _, numListed, err = item
+                if err:
+                    if print_output:
+                        print("Error: S3 API error: ", err)
+                    raise APIConnectionError(err)
+                continue
+
+            _, sequenceNumber, obj, data, err = item
+            if err:
+                if print_output:
+                    print("Error: Object '" + obj["Key"] + "' could not be downloaded: ", err)
+                raise APIConnectionError(err)
+
+            # In ordered mode, objects are held back until all objects that were listed before them have been yielded
+            pending[sequenceNumber] = (obj, data)
+            while pending and (not ordered or nextSequenceNumber in pending):
+                if ordered:
+                    obj, data = pending.pop(nextSequenceNumber)
+                    nextSequenceNumber += 1
+                else:
+                    obj, data = pending.pop(sequenceNumber)
+                yield obj["Key"], data
+                del data
+                release(obj["Size"])
+                numYielded += 1
+    finally:
+        # Also reached if the caller stops iterating early; downloads that are in progress are abandoned
+        with budget:
+            state["stopped"] = True
+            budget.notify_all()
+        executor.shutdown(wait=False)
+
+
+class _S3SyncManifest:
+    """Record of the state of files at the time that they were last synced to/from S3"""
+
+    def __init__(self, path: str, scope: str, print_output: bool = False):
+        self._path = path
+        self._scope = scope
+        self._print_output = print_output
+        self._lock = threading.Lock()
+        try:
+            with open(self._path) as manifestFile:
+                self._manifest = json.load(manifestFile)
+        except (OSError, ValueError):
+            self._manifest = {"scopes": dict()}
+        self._entries = self._manifest["scopes"].setdefault(scope, dict())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, s3ObjectKey: str) -> dict:
+        with self._lock:
+            return self._entries.get(s3ObjectKey)
+
+    def set(self, s3ObjectKey: str, localStat: os.stat_result, etag: str = None, md5: str = None):
+        with self._lock:
+            self._entries[s3ObjectKey] = {"size": localStat.st_size, "mtime": localStat.st_mtime_ns, "etag": etag, "md5": md5}
+
+    def remove(self, s3ObjectKey: str):
+        with self._lock:
+            self._entries.pop(s3ObjectKey, None)
+
+    def save(self):
+        # Write to a temporary file and atomically replace the manifest, so that an interrupted run never corrupts it. The transfer itself
+        # is not affected if the manifest cannot be written; the next sync compares every file to the bucket instead.
+        with self._lock:
+            temporaryPath = self._path + ".tmp"
+            try:
+                os.makedirs(os.path.dirname(self._path), mode=0o700, exist_ok=True)
+                with open(temporaryPath, "w") as manifestFile:
+                    json.dump(self._manifest, manifestFile)
+                os.replace(temporaryPath, self._path)
+            except OSError as err:
+                if self._print_output:
+                    print("Warning: Unable to save sync manifest '" + self._path + "': ", err)
+
+
+class _S3TransferJournal:
+    """Append-only record of the objects transferred to/from S3 by a resumable run, from which it can be resumed if it is interrupted"""
+
+    def __init__(self, path: str, scope: str, resume: bool = False, s3Client=None, s3Bucket: str = None, print_output: bool = False):
+        self._path = path
+        self._journalFile = None
+        self._lock = threading.Lock()
+        self._completed = dict()
+        self._multipartUploads = dict()
+
+        # Replay the journal of the previous run. A partially written last line (e.g. if the process was killed) is ignored.
+        previousScope = None
+        try:
+            with open(self._path) as journalFile:
+                for line in journalFile:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    op = entry.get("op")
+                    if op == "start":
+                        previousScope = entry.get("scope")
+                    elif op == "done":
+                        self._completed[entry["key"]] = entry
+                        self._multipartUploads.pop(entry["key"], None)
+                    elif op == "multipart":
+                        self._multipartUploads[entry["key"]] = entry
+        except OSError:
+            pass
+
+        if previousScope != scope:
+            if resume and print_output and previousScope:
+                print("Warning: Journal '" + self._path + "' belongs to a different transfer; starting from the beginning.")
+            self._completed = dict()
+            self._multipartUploads = dict()
+            previousScope = None
+
+        if resume:
+            if print_output and previousScope:
+                print("Resuming transfer: " + str(len(self._completed)) + " object(s) already transferred, " +
+                      str(len(self._multipartUploads)) + " multipart upload(s) in progress.")
+            try:
+                os.makedirs(os.path.dirname(self._path), mode=0o700, exist_ok=True)
+                self._journalFile = open(self._path, "a" if previousScope else "w")
+            except OSError as err:
+                if print_output:
+                    print("Error: Unable to open transfer journal '" + self._path + "': ", err)
+                raise InvalidConfigError()
+            if not previousScope:
+                self._write({"op": "start", "scope": scope, "time": datetime.datetime.now().isoformat()})
+        else:
+            # A run that is not resumable is not journaled. Multipart uploads that were left behind by an interrupted resumable run would
+            # otherwise linger (and be billed) until they expire.
+            if previousScope and s3Client:
+                for entry in self._multipartUploads.values():
+                    try:
+                        s3Client.abort_multipart_upload(Bucket=s3Bucket, Key=entry["key"], UploadId=entry["uploadId"])
+                    except Exception:
+                        pass
+            if previousScope:
+                try:
+                    os.remove(self._path)
+                except OSError:
+                    pass
+            self._completed = dict()
+            self._multipartUploads = dict()
+
+    def _write(self, entry: dict):
+        # Each entry is flushed immediately, so that it survives the process being killed
+        with self._lock:
+            if not self._journalFile:
+                return
+            self._journalFile.write(json.dumps(entry) + "\n")
+            self._journalFile.flush()
+
+    def completed(self, s3ObjectKey: str) -> dict:
+        return self._completed.get(s3ObjectKey)
+
+    def multipart_upload(self, s3ObjectKey: str) -> dict:
+        return self._multipartUploads.get(s3ObjectKey)
+
+    def record_done(self, s3ObjectKey: str, size: int, mtime: int = None, etag: str = None, fingerprint: str = None):
+        entry = {"op": "done", "key": s3ObjectKey, "size": size, "mtime": mtime, "etag": etag}
+        if fingerprint:
+            entry["fingerprint"] = fingerprint
+        self._write(entry)
+
+    def record_failed(self, s3ObjectKey: str, error: Exception):
+        self._write({"op": "failed", "key": s3ObjectKey, "error": str(error)})
+
+    def record_multipart_upload(self, s3ObjectKey: str, uploadId: str, size: int, mtime: int, partSize: int):
+        self._write({"op": "multipart", "key": s3ObjectKey, "uploadId": uploadId, "size": size, "mtime": mtime, "partSize": partSize})
+
+    def close(self):
+        with self._lock:
+            if self._journalFile:
+                self._journalFile.close()
+
+
+def _upload_to_s3_multipart(s3Client, s3Bucket: str, localFile: str, s3ObjectKey: str, localStat: os.stat_result, s3ExtraArgs: str = None,
+                            transferConfig: S3TransferConfig = None, journal: _S3TransferJournal = None, print_output: bool = False) -> int:
+    # Upload a large file in parts, recording the upload ID in the journal so that an interrupted upload can be continued.
+    # Returns the number of bytes that were uploaded by this call.
+    transferConfig = transferConfig or S3TransferConfig()
+    size = localStat.st_size
+    partSize = max(transferConfig.multipart_chunksize, -(-size // 10000))  # S3 allows at most 10000 parts per upload
+    numParts = -(-size // partSize)
+    uploadId = None
+    uploadedParts = dict()
+
+    # Continue the upload that was started by the previous run, if the file has not changed since; S3 is asked which parts it holds
+    previousUpload = journal.multipart_upload(s3ObjectKey) if journal else None
+    if previousUpload and previousUpload["size"] == size and previousUpload["mtime"] == localStat.st_mtime_ns and previousUpload["partSize"] == partSize:
+        try:
+            for page in s3Client.get_paginator("list_parts").paginate(Bucket=s3Bucket, Key=s3ObjectKey, UploadId=previousUpload["uploadId"]):
+                for part in page.get("Parts", list()):
+                    if part["Size"] == min(partSize, size - (part["PartNumber"] - 1) * partSize):
+                        uploadedParts[part["PartNumber"]] = part["ETag"]
+            uploadId = previousUpload["uploadId"]
+        except BotoClientError as err:
+            # The upload has been completed, aborted or has expired in the meantime
+            if err.response.get("Error", dict()).get("Code") != "NoSuchUpload":
+                raise
+            uploadedParts = dict()
+    elif previousUpload:
+        # The file has changed since the upload was started; abort it so that its parts do not linger (and are not billed) until it expires
+        try:
+            s3Client.abort_multipart_upload(Bucket=s3Bucket, Key=s3ObjectKey, UploadId=previousUpload["uploadId"])
+        except BotoClientError:
+            pass
+
+    try:
+        if uploadId:
+            if print_output:
+                print("Resuming upload of file '" + localFile + "' to bucket '" + s3Bucket + "' with key '" + s3ObjectKey + "' (" +
+                      str(len(uploadedParts)) + " of " + str(numParts) + " part(s) already uploaded).")
+        else:
+            if print_output:
+                print("Uploading file '" + localFile + "' to bucket '" + s3Bucket + "' and applying key '" + s3ObjectKey + "'.")
+            extraArgs = json.loads(s3ExtraArgs) if s3ExtraArgs else dict()
+            uploadId = s3Client.create_multipart_upload(Bucket=s3Bucket, Key=s3ObjectKey, **extraArgs)["UploadId"]
+            if journal:
+                journal.record_multipart_upload(s3ObjectKey, uploadId, size=size, mtime=localStat.st_mtime_ns, partSize=partSize)
+
+        def upload_part(partNumber: int) -> int:
+            start = (partNumber - 1) * partSize
+            length = min(partSize, size - start)
+            # Stream the part from the file instead of reading it into memory
+            with ReadFileChunk.from_filename(localFile, start, length) as body:
+                response = s3Client.upload_part(Bucket=s3Bucket, Key=s3ObjectKey, UploadId=uploadId, PartNumber=partNumber, Body=body)
+            uploadedParts[partNumber] = response["ETag"]
+            return length
+
+        missingParts = [partNumber for partNumber in range(1, numParts + 1) if partNumber not in uploadedParts]
+        bytesUploaded = 0
+        with ThreadPoolExecutor(max_workers=transferConfig.max_concurrency) as executor:
+            futures = [executor.submit(upload_part, partNumber) for partNumber in missingParts]
+            try:
+                for future in as_completed(futures):
+                    bytesUploaded += future.result()
+            except:
+                # Do not start uploading the remaining parts once one has failed
+                for future in futures:
+                    future.cancel()
+                raise
+
+        s3Client.complete_multipart_upload(Bucket=s3Bucket, Key=s3ObjectKey, UploadId=uploadId,
+                                           MultipartUpload={"Parts": [{"PartNumber": partNumber, "ETag": uploadedParts[partNumber]}
+                                                                      for partNumber in sorted(uploadedParts)]})
+    except Exception as err:
+        # Parts that were uploaded are kept, so that the upload can be resumed
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+
+    return bytesUploaded
+
+
+def _new_s3_transfer_report(direction: str, s3Bucket: str, s3ObjectKeyPrefix: str, localDirectory: str) -> dict:
+    return {
+        "Direction": direction,
+        "Bucket": s3Bucket,
+        "Prefix": s3ObjectKeyPrefix,
+        "Local Directory": localDirectory,
+        "Succeeded": 0,
+        "Skipped": 0,
+        "Failed": 0,
+        "Deleted": 0,
+        "Bytes Transferred": 0,
+        "Seconds": 0,
+        "Failures": list()
+    }
+
+
+def _finish_s3_transfer_report(report: dict, startTime: float, reportFile: str = None, print_output: bool = False):
+    report["Seconds"] = round(time.time() - startTime, 1)
+    if reportFile:
+        temporaryPath = reportFile + ".tmp"
+        with open(temporaryPath, "w") as reportFileObj:
+            json.dump(report, reportFileObj, indent=2)
+        os.replace(temporaryPath, reportFile)
+    if print_output:
+        print("Transfer report: " + str(report["Succeeded"]) + " object(s) transferred (" + _convert_bytes_to_pretty_size(report["Bytes Transferred"]) +
+              "), " + str(report["Skipped"]) + " skipped, " + str(report["Failed"]) + " failed, " + str(report["Deleted"]) + " deleted.")
+
+
+def _list_local_files_sorted(localDirectory: str):
+    # Walk a directory in a stable order, excluding hidden files and directories; yields (local path, relative path, stat)
+    for dirpath, dirnames, filenames in os.walk(localDirectory):
+        dirnames[:] = sorted(dirname for dirname in dirnames if not dirname[0] == '.')
+        for filename in sorted(filename for filename in filenames if not filename[0] == '.'):
+            localFile = os.path.join(dirpath, filename)
+            yield localFile, os.path.relpath(localFile, localDirectory), os.stat(localFile)
+
+
+def _plan_s3_shards(localDirectory: str, shardSize: int):
+    # Group files into shards of (approximately) the given size, in a stable order. The grouping only depends on the files' paths and
+    # sizes, so that a resumed run recreates the same shards. Yields (shard number, [(local path, relative path, stat), ...]).
+    shardNumber = 0
+    members = list()
+    tarSize = 0
+    for localFile, relativePath, localStat in _list_local_files_sorted(localDirectory):
+        members.append((localFile, relativePath, localStat))
+        tarSize += 512 + -(-localStat.st_size // 512) * 512  # Header and data blocks
+        if tarSize >= shardSize:
+            yield shardNumber, members
+            shardNumber += 1
+            members = list()
+            tarSize = 0
+    if members:
+        yield shardNumber, members
+
+
+def _compute_s3_shard_fingerprint(members: list) -> str:
+    fingerprint = hashlib.sha256()
+    for localFile, relativePath, localStat in members:
+        fingerprint.update((relativePath + "|" + str(localStat.st_size) + "|" + str(localStat.st_mtime_ns) + "\n").encode("utf-8"))
+    return fingerprint.hexdigest()
+
+
+def _build_s3_shard(members: list, shardFile: str) -> list:
+    # Write the files to a tar archive, reading each file sequentially. Returns the index of the shard, i.e. the name, offset and size of
+    # each member's data within the archive, so that single files can be retrieved with ranged requests.
+    index = list()
+    with tarfile.open(shardFile, "w") as tar:
+        for localFile, relativePath, localStat in members:
+            tarInfo = tar.gettarinfo(localFile, arcname=relativePath.replace(os.sep, "/"))
+            with open(localFile, "rb") as fileObj:
+                tar.addfile(tarInfo, fileObj)
+            # The data is followed by padding to the next 512-byte block
+            index.append({"name": tarInfo.name, "offset": tar.offset - -(-tarInfo.size // 512) * 512, "size": tarInfo.size})
+    return index
+
+
+def _unpack_s3_shard(s3Client, s3Bucket: str, s3ObjectKey: str, localDirectory: str, print_output: bool = False) -> int:
+    # Stream the shard from S3 and extract its files on the fly, without staging the shard on disk. Returns the number of files extracted.
+    if print_output:
+        print("Unpacking shard '" + s3ObjectKey + "' from bucket '" + s3Bucket + "' into '" + localDirectory + "'.")
+
+    numFiles = 0
+    try:
+        body = s3Client.get_object(Bucket=s3Bucket, Key=s3ObjectKey)["Body"]
+        try:
+            with tarfile.open(fileobj=body, mode="r|") as tar:
+                for member in tar:
+                    if not member.isfile():
+                        continue
+                    # Never write outside of the local directory
+                    relativePath = os.path.normpath(member.name)
+                    if os.path.isabs(relativePath) or relativePath == ".." or relativePath.startswith(".." + os.sep):
+                        raise ValueError("Shard '" + s3ObjectKey + "' contains unsafe path '" + member.name + "'")
+                    localFile = os.path.join(localDirectory, relativePath)
+                    os.makedirs(os.path.dirname(localFile), exist_ok=True)
+                    with tar.extractfile(member) as src, open(localFile, "wb") as dst:
+                        shutil.copyfileobj(src, dst, 1024 * 1024)
+                    os.utime(localFile, (member.mtime, member.mtime))
+                    numFiles += 1
+        finally:
+            body.close()
+    except Exception as err:
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+
+    return numFiles
+
+
+def _push_directory_to_s3_as_shards(s3Client, s3Bucket: str, localDirectory: str, s3ObjectKeyPrefix: str, shardSize: int, s3ExtraArgs: str,
+                                    transferConfig: S3TransferConfig, journal: _S3TransferJournal, report: dict, reportLock: threading.Lock,
+                                    max_workers: int, stagingDirectory: str = None, print_output: bool = False) -> (int, int, Exception):
+    # Pack the files into tar shards in a staging directory and upload each shard, with its index, while the next shard is being built.
+    # At most max_workers shards are being uploaded, one is waiting and one is being built at any time, which limits the space used in
+    # the staging directory.
+    stagingDirectory = tempfile.mkdtemp(prefix="netapp_dataops_shards_", dir=stagingDirectory)
+
+    def build_shards():
+        for shardNumber, members in _plan_s3_shards(localDirectory, shardSize):
+            s3ObjectKey = s3ObjectKeyPrefix + _s3ShardNameFormat % shardNumber
+            fingerprint = _compute_s3_shard_fingerprint(members)
+
+            # When resuming, shards that were uploaded by the previous run and whose files have not changed since are skipped
+            journalEntry = journal.completed(s3ObjectKey)
+            if journalEntry and journalEntry.get("fingerprint") == fingerprint:
+                with reportLock:
+                    report["Skipped"] += 1
+                continue
+
+            if print_output:
+                print("Packing " + str(len(members)) + " file(s) into shard '" + s3ObjectKey + "'.")
+            shardFile = os.path.join(stagingDirectory, _s3ShardNameFormat % shardNumber)
+            index = _build_s3_shard(members, shardFile)
+            yield shardFile, s3ObjectKey, index, fingerprint
+
+    def upload_shard(item: tuple):
+        shardFile, s3ObjectKey, index, fingerprint = item
+        try:
+            shardSize = os.path.getsize(shardFile)
+            _upload_to_s3(s3Client=s3Client, s3Bucket=s3Bucket, localFile=shardFile, s3ObjectKey=s3ObjectKey, s3ExtraArgs=s3ExtraArgs,
+                          transferConfig=transferConfig, print_output=print_output)
+            s3Client.put_object(Bucket=s3Bucket, Key=s3ObjectKey[:-len(".tar")] + ".index.json", Body=json.dumps(index).encode("utf-8"),
+                                ContentType="application/json")
+        except Exception as err:
+            journal.record_failed(s3ObjectKey, err)
+            with reportLock:
+                if len(report["Failures"]) < 1000:
+                    report["Failures"].append({"Key": s3ObjectKey, "Error": str(err)})
+            raise
+        finally:
+            os.remove(shardFile)
+
+        journal.record_done(s3ObjectKey, size=shardSize, fingerprint=fingerprint)
+        with reportLock:
+            report["Succeeded"] += 1
+            report["Bytes Transferred"] += shardSize
+
+    try:
+        return _run_bounded_pipeline(build_shards(), upload_shard, max_workers=max_workers, queue_depth=1)
+    finally:
+        shutil.rmtree(stagingDirectory, ignore_errors=True)
+
+
+def _compute_file_md5(localFile: str) -> str:
+    md5 = hashlib.md5()
+    with open(localFile, "rb") as fileObj:
+        for chunk in iter(lambda: fileObj.read(8 * 1024 * 1024), b""):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def _head_s3_object(s3Client, s3Bucket: str, s3ObjectKey: str) -> dict:
+    # Return the same fields as a listing does, or None if the object does not exist
+    try:
+        response = s3Client.head_object(Bucket=s3Bucket, Key=s3ObjectKey)
+    except BotoClientError as err:
+        if err.response.get("Error", dict()).get("Code") in ("404", "NoSuchKey", "NotFound"):
+            return None
+        raise
+    return {"Key": s3ObjectKey, "Size": response["ContentLength"], "ETag": response["ETag"], "LastModified": response["LastModified"]}
+
+
+def _s3_object_unchanged(localFile: str, localStat: os.stat_result, remoteObject: dict, localIsSource: bool, compare_checksums: bool = False) -> (bool, str):
+    # Compare a local file to an S3 object. Returns whether they are considered identical, and the local MD5 digest if it was computed.
+    if not remoteObject or not localStat or localStat.st_size != remoteObject["Size"]:
+        return False, None
+
+    # The ETag of an object that was not uploaded in multiple parts is the MD5 digest of its content
+    etag = remoteObject["ETag"].strip('"')
+    if compare_checksums and "-" not in etag:
+        md5 = _compute_file_md5(localFile)
+        return md5 == etag, md5
+
+    # Otherwise, fall back to comparing modification times; the copy must not be older than the source
+    remoteMtime = remoteObject["LastModified"].timestamp()
+    if localIsSource:
+        return localStat.st_mtime <= remoteMtime, None
+    return localStat.st_mtime >= remoteMtime, None
+
+
+def _instantiate_s3_client(s3Endpoint: str, s3AccessKeyId: str, s3SecretAccessKey: str, s3VerifySSLCert: bool, s3CACertBundle: str,
+                           max_workers: int = 1, transferConfig: S3TransferConfig = None, print_output: bool = False):
+    # Instantiate a low-level client; unlike sessions and resources, clients can be shared by all worker threads.
+    # Each worker's transfer may itself use several connections, so size the connection pool accordingly.
     session = boto3.session.Session(aws_access_key_id=s3AccessKeyId, aws_secret_access_key=s3SecretAccessKey)
-    config = BotoConfig(signature_version='s3v4')
+    config = BotoConfig(signature_version='s3v4', max_pool_connections=max(max_workers * (transferConfig or S3TransferConfig()).max_concurrency, 10))
 
     if s3VerifySSLCert:
         if s3CACertBundle:
-            s3 = session.resource(service_name='s3', endpoint_url=s3Endpoint, verify=s3CACertBundle, config=config)
+            s3Client = session.client(service_name='s3', endpoint_url=s3Endpoint, verify=s3CACertBundle, config=config)
         else:
-            s3 = session.resource(service_name='s3', endpoint_url=s3Endpoint, config=config)
+            s3Client = session.client(service_name='s3', endpoint_url=s3Endpoint, config=config)
     else:
-        s3 = session.resource(service_name='s3', endpoint_url=s3Endpoint, verify=False, config=config)
+        s3Client = session.client(service_name='s3', endpoint_url=s3Endpoint, verify=False, config=config)
 
-    return s3
+    return s3Client
 
 
 def _print_invalid_config_error() :
@@ -260,7 +1300,7 @@ def _retrieve_config(configDirPath: str = "~/.netapp_dataops", configFilename: s
 def _retrieve_cloud_central_refresh_token(print_output: bool = False) -> str:
     # Retrieve refresh token from config file
     try:
-        config = _retrieve_config(print_output=print_output)
+        config = _get_client(print_output=print_output).get_config()
     except InvalidConfigError:
         raise
     try:
@@ -281,7 +1321,7 @@ def _retrieve_cloud_central_refresh_token(print_output: bool = False) -> str:
 def _retrieve_s3_access_details(print_output: bool = False) -> (str, str, str, bool, str):
     # Retrieve refresh token from config file
     try:
-        config = _retrieve_config(print_output=print_output)
+        config = _get_client(print_output=print_output).get_config()
     except InvalidConfigError:
         raise
     try:
@@ -303,27 +1343,49 @@ def _retrieve_s3_access_details(print_output: bool = False) -> (str, str, str, b
     return s3Endpoint, s3AccessKeyId, s3SecretAccessKey, s3VerifySSLCert, s3CACertBundle
 
 
-def _upload_to_s3(s3Endpoint: str, s3AccessKeyId: str, s3SecretAccessKey: str, s3VerifySSLCert: bool, s3CACertBundle: str,
-               s3Bucket: str, localFile: str, s3ObjectKey: str, s3ExtraArgs: str = None, print_output: bool = False):
-    # Instantiate S3 session
+def _retrieve_s3_transfer_config(multipart_chunksize=None, max_concurrency: int = None, multipart_threshold=None,
+                                 print_output: bool = False) -> S3TransferConfig:
+    # Values specified by the caller take precedence over the (optional) values in the config file, which take precedence over boto3's defaults
     try:
-        s3 = _instantiate_s3_session(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId,
-                                  s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert,
-                                  s3CACertBundle=s3CACertBundle, print_output=print_output)
-    except Exception as err:
-        if print_output:
-            print("Error: S3 API error: ", err)
-        raise APIConnectionError(err)
+        config = _get_client(print_output=print_output).get_config()
+    except InvalidConfigError:
+        raise
+
+    transferSettings = {
+        "multipart_chunksize": (multipart_chunksize, "s3MultipartChunkSize", True),
+        "max_concurrency": (max_concurrency, "s3MaxConcurrency", False),
+        "multipart_threshold": (multipart_threshold, "s3MultipartThreshold", True)
+    }
+    transferConfigArgs = dict()
+    for transferSetting, (value, configKey, isSize) in transferSettings.items():
+        if value is None:
+            value = config.get(configKey)
+        if value is None:
+            continue
+        try:
+            value = _convert_pretty_size_to_bytes(value) if isSize else int(value)
+            if value < 1:
+                raise ValueError()
+        except (ValueError, TypeError):
+            if print_output:
+                print("Error: Invalid value for " + transferSetting + " (" + configKey + "): " + str(value))
+            raise InvalidConfigError()
+        transferConfigArgs[transferSetting] = value
+
+    return S3TransferConfig(**transferConfigArgs)
 
+
+def _upload_to_s3(s3Client, s3Bucket: str, localFile: str, s3ObjectKey: str, s3ExtraArgs: str = None, transferConfig: S3TransferConfig = None,
+                  print_output: bool = False):
     # Upload file
     if print_output:
         print("Uploading file '" + localFile + "' to bucket '" + s3Bucket + "' and applying key '" + s3ObjectKey + "'.")
 
     try:
         if s3ExtraArgs:
-            s3.Object(s3Bucket, s3ObjectKey).upload_file(localFile, ExtraArgs=json.loads(s3ExtraArgs))
+            s3Client.upload_file(localFile, s3Bucket, s3ObjectKey, ExtraArgs=json.loads(s3ExtraArgs), Config=transferConfig)
         else:
-            s3.Object(s3Bucket, s3ObjectKey).upload_file(localFile)
+            s3Client.upload_file(localFile, s3Bucket, s3ObjectKey, Config=transferConfig)
     except Exception as err:
         if print_output:
             print("Error: S3 API error: ", err)
@@ -354,6 +1416,593 @@ def _convert_bytes_to_pretty_size(size_in_bytes: str, num_decimal_points: int =
     return prettySize
 
 
+def _convert_pretty_size_to_bytes(size) -> int:
+    # Convert "pretty" size (e.g. "64MB", "8MiB", "1G") or number of bytes to number of bytes
+    if isinstance(size, int):
+        return size
+    matchObj = re.match(r'^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:i?B)?\s*$', str(size), re.IGNORECASE)
+    if not matchObj:
+        raise ValueError("Invalid size: " + str(size))
+    multiplier = 1024 ** "_KMGT".index(matchObj.group(2).upper() or "_")
+    return int(float(matchObj.group(1)) * multiplier)
+
+
+def _get_snapshot_collection(volume_uuid: str, fields: str = "name,create_time", name_pattern: str = None, order_by: str = None,
+                             max_records: int = None):
+    # Retrieve snapshots and their details in a single collection query; filtering and sorting are performed by ONTAP
+    query = {"fields": fields}
+    if name_pattern:
+        query["name"] = name_pattern
+    if order_by:
+        query["order_by"] = order_by
+    return NetAppSnapshot.get_collection(volume_uuid, max_records=max_records, **query)
+
+
+def _invalidate_latest_snapshot_cache(volume_uuid: str):
+    _latestSnapshotCache.invalidate(lambda cacheKey: cacheKey[0] == volume_uuid)
+
+
+def _resolve_latest_snapshot(volume_uuid: str, prefix: str):
+    cacheKey = (volume_uuid, prefix)
+    latestSnapshot = _latestSnapshotCache.get(cacheKey)
+    if latestSnapshot:
+        return latestSnapshot
+
+    # Ask ONTAP for only the newest snapshot matching the prefix
+    for snapshot in _get_snapshot_collection(volume_uuid, name_pattern=prefix+"*", order_by="create_time desc", max_records=1):
+        latestSnapshot = snapshot
+        break
+
+    if latestSnapshot:
+        _latestSnapshotCache.put(cacheKey, latestSnapshot)
+
+    return latestSnapshot
+
+
+def _current_cluster() -> str:
+    connection = NetAppHostConnection.get_host_context() or netappConfig.CONNECTION
+    return connection.host if connection else None
+
+
+def _find_volume(volume_name: str, svm: str) -> NetAppVolume:
+    # Return a volume object containing only name and uuid; use NetAppVolume.find() when other fields are needed
+    cacheKey = ("volume", _current_cluster(), svm, volume_name)
+    volumeUuid = _uuidCache.get(cacheKey)
+    if not volumeUuid:
+        volume = NetAppVolume.find(name=volume_name, svm=svm, fields="uuid")
+        if not volume:
+            return None
+        volumeUuid = volume.uuid
+        _uuidCache.put(cacheKey, volumeUuid)
+    return NetAppVolume.from_dict({"name": volume_name, "uuid": volumeUuid})
+
+
+def _get_nfs_mount_target(config: dict, svmName: str, exportPath: str, dataLifAddress: str = None) -> str:
+    # Mount through the selected data LIF if any, else through the data LIF from the config file, or through the SVM's name for volumes
+    # of other SVMs
+    if not exportPath:
+        return None
+    if dataLifAddress:
+        if ":" in dataLifAddress:
+            dataLifAddress = "[" + dataLifAddress + "]"
+        return dataLifAddress + ":" + exportPath
+    if svmName != config["svm"]:
+        return svmName + ":" + exportPath
+    return config["dataLif"] + ":" + exportPath
+
+
+def _mount_nfs_export(nfsMountTarget: str, mountpoint: str, mountOptions: list = None) -> bool:
+    # Create mountpoint if it doesn't already exist, then mount; returns whether the mountpoint was created
+    mountpointCreated = False
+    try:
+        os.mkdir(mountpoint)
+        mountpointCreated = True
+    except FileExistsError:
+        pass
+
+    mountCommand = ['mount']
+    if mountOptions:
+        mountCommand += ['-o', ",".join(mountOptions)]
+    try:
+        subprocess.check_call(mountCommand + [nfsMountTarget, mountpoint])
+    except subprocess.CalledProcessError:
+        if mountpointCreated:
+            os.rmdir(mountpoint)
+        raise
+    return mountpointCreated
+
+
+def _group_mountpoints_by_depth(mountpoints: dict) -> list:
+    # Group mountpoints (index -> path) into waves by directory depth, so that a volume mounted inside another volume's mountpoint is only
+    # mounted once the enclosing volume has been mounted (and unmounted before it, when the waves are processed in reverse order)
+    waves = collections.defaultdict(list)
+    for index, mountpoint in mountpoints.items():
+        waves[os.path.normpath(mountpoint).count(os.sep)].append(index)
+    return [waves[depth] for depth in sorted(waves)]
+
+
+def _install_file_atomically(path: str, content: str):
+    # Write to a temporary file next to the destination, then rename it over the destination, so that readers (e.g. automount or
+    # systemd) never see a partially written file
+    temporaryPath = path + ".tmp"
+    with open(temporaryPath, "w") as fileObj:
+        fileObj.write(content)
+        fileObj.flush()
+        os.fsync(fileObj.fileno())
+    os.chmod(temporaryPath, 0o644)
+    os.replace(temporaryPath, path)
+
+
+def _escape_systemd_path(path: str) -> str:
+    # Escape a path for use as a systemd unit name (equivalent to 'systemd-escape --path')
+    path = os.path.normpath(path).strip("/")
+    if not path:
+        return "-"
+    escapedPath = ""
+    for index, character in enumerate(path):
+        if character == "/":
+            escapedPath += "-"
+        elif character.isascii() and (character.isalnum() or character in ":_" or (character == "." and index > 0)):
+            escapedPath += character
+        else:
+            escapedPath += "".join("\\x%02x" % byte for byte in character.encode())
+    return escapedPath
+
+
+def _read_autofs_map(mapPath: str) -> dict:
+    # Parse an autofs file map into {key: entry line}; comments and blank lines are ignored
+    entries = dict()
+    try:
+        with open(mapPath) as mapFile:
+            for line in mapFile:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    entries[line.split(None, 1)[0]] = line
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+def _read_systemd_automount_units(unitDirectory: str, mountRoot: str) -> dict:
+    # Find the unit files that were generated by the toolkit for mountpoints under the mount root; returns {key: {unit filename: content}}
+    units = collections.defaultdict(dict)
+    try:
+        unitFilenames = sorted(os.listdir(unitDirectory))
+    except FileNotFoundError:
+        return units
+    for unitFilename in unitFilenames:
+        if not unitFilename.endswith((".mount", ".automount")):
+            continue
+        try:
+            with open(os.path.join(unitDirectory, unitFilename)) as unitFile:
+                content = unitFile.read()
+        except OSError:
+            continue
+        matchObj = re.search(r"^Where=(.*)$", content, re.MULTILINE)
+        if content.startswith(_automountMapHeader) and matchObj and os.path.dirname(matchObj.group(1)) == mountRoot:
+            units[os.path.basename(matchObj.group(1))][unitFilename] = content
+    return units
+
+
+def _get_lif_selection(config: dict, lifSelection: str = None, print_output: bool = False) -> str:
+    if lifSelection:
+        if lifSelection not in ("config", "locality"):
+            if print_output:
+                print("Error: Invalid LIF selection mode '" + str(lifSelection) + "'. Must be 'config' or 'locality'.")
+            raise InvalidVolumeParameterError("lif_selection")
+        return lifSelection
+    lifSelection = config.get("lifSelection", "config")
+    if lifSelection not in ("config", "locality"):
+        if print_output:
+            print("Error: Invalid value for 'lifSelection' in config file. Must be 'config' or 'locality'.")
+        raise InvalidConfigError()
+    return lifSelection
+
+
+def _get_svm_data_lifs(svmName: str, print_output: bool = False) -> (list, dict):
+    # Retrieve the SVM's NFS data LIFs that are up, with the node that currently hosts each of them, and the node that owns each aggregate.
+    # Accounts that cannot read these (e.g. SVM-scoped accounts cannot list aggregates) get empty results, and mounts go through the
+    # data LIF from the config file.
+    cacheKey = (_current_cluster(), svmName)
+    svmDataLifs = _svmDataLifCache.get(cacheKey)
+    if svmDataLifs is None:
+        try:
+            lifs = list()
+            for interface in NetAppIpInterface.get_collection(**{"svm.name": svmName, "services": "data_nfs", "state": "up",
+                                                                 "fields": "ip.address,location.node.name"}):
+                lifs.append((interface.ip.address, interface.location.node.name))
+            aggregateNodes = dict()
+            for aggregate in NetAppAggregate.get_collection(fields="node.name"):
+                aggregateNodes[aggregate.name] = aggregate.node.name
+            svmDataLifs = (sorted(lifs), aggregateNodes)
+        except NetAppRestError as err:
+            if print_output:
+                print("Warning: Unable to retrieve data LIFs for SVM '" + svmName + "'; using data LIF from config file: ", err)
+            svmDataLifs = (list(), dict())
+        _svmDataLifCache.put(cacheKey, svmDataLifs)
+    return svmDataLifs
+
+
+def _select_data_lif(lifs: list, aggregateNodes: dict, volume: NetAppVolume) -> (str, str):
+    # Select a data LIF on a node that owns the volume's aggregate, so that I/O does not take an indirect hop over the cluster interconnect.
+    # FlexGroup constituents span several nodes, so clients are spread across the LIFs of those nodes. The LIF is picked by a hash of the
+    # host and volume names rather than a counter, so that each client keeps using the same LIF across mounts. Returns (address, node),
+    # or (None, None) if no data LIF is local to the volume.
+    volumeNodes = set()
+    for aggregate in getattr(volume, "aggregates", None) or list():
+        aggregateName = aggregate["name"] if isinstance(aggregate, dict) else getattr(aggregate, "name", None)
+        if aggregateName in aggregateNodes:
+            volumeNodes.add(aggregateNodes[aggregateName])
+    candidates = [(address, node) for address, node in lifs if node in volumeNodes]
+    if not candidates:
+        return None, None
+    if len(candidates) == 1:
+        return candidates[0]
+    return candidates[zlib.crc32((socket.gethostname() + ":" + volume.name).encode()) % len(candidates)]
+
+
+def _get_local_mounts() -> (dict, dict):
+    # Read the local mount table once and index it by source (e.g. "10.61.188.40:/test_vol") and by mountpoint. The table is read from
+    # /proc/self/mountinfo where available (Linux), and from the output of the mount command otherwise.
+    mountpointsBySource = dict()
+    sourcesByMountpoint = dict()
+    try:
+        with open("/proc/self/mountinfo") as mountinfoFile:
+            mountinfo = mountinfoFile.read()
+    except OSError:
+        mountinfo = None
+
+    if mountinfo is not None:
+        # Fields: mount ID, parent ID, major:minor, root, mountpoint, options, [optional fields...], "-", filesystem type, source, ...
+        # Spaces and other special characters in paths are escaped as octal sequences (e.g. "\040")
+        def unescape(field: str) -> str:
+            return re.sub(r"\\([0-7]{3})", lambda matchObj: chr(int(matchObj.group(1), 8)), field)
+
+        for line in mountinfo.split("\n"):
+            fields = line.split(" ")
+            try:
+                separatorIndex = fields.index("-", 6)
+                mountpoint = unescape(fields[4])
+                source = unescape(fields[separatorIndex + 2])
+            except (ValueError, IndexError):
+                continue
+            mountpointsBySource[source] = mountpoint
+            sourcesByMountpoint[mountpoint] = source
+    else:
+        for mount in subprocess.check_output(['mount']).decode().split("\n"):
+            mountDetails = mount.split(" ")
+            if len(mountDetails) > 2:
+                mountpointsBySource[mountDetails[0]] = mountDetails[2]
+                sourcesByMountpoint[mountDetails[2]] = mountDetails[0]
+
+    return mountpointsBySource, sourcesByMountpoint
+
+
+def _get_nfs_mount_profiles(config: dict) -> dict:
+    profiles = copy.deepcopy(_nfsMountProfiles)
+    profiles.update(config.get("mountProfiles") or dict())
+    return profiles
+
+
+def _validate_nfs_mount_options(options: dict) -> list:
+    # Check the options of a mount profile, including whether the running kernel supports them; returns a list of problems
+    errors = list()
+    kernelVersion = None
+    if sys.platform.startswith("linux"):
+        matchObj = re.match(r"(\d+)\.(\d+)", os.uname().release)
+        if matchObj:
+            kernelVersion = (int(matchObj.group(1)), int(matchObj.group(2)))
+
+    for option, value in options.items():
+        if option not in _nfsMountOptionNames:
+            errors.append("unknown NFS mount option '" + option + "'")
+            continue
+        if value is True or value is False or value is None:
+            continue
+        if option in ("vers", "nfsvers") and str(value) not in ("3", "4", "4.0", "4.1", "4.2"):
+            errors.append("unsupported NFS version '" + str(value) + "'")
+        elif option in ("nconnect", "max_connect", "rsize", "wsize", "timeo", "retrans", "actimeo", "acregmin", "acregmax", "acdirmin", "acdirmax"):
+            try:
+                value = int(value)
+            except (ValueError, TypeError):
+                errors.append("value of '" + option + "' must be an integer")
+                continue
+            if option == "nconnect" and not 1 <= value <= 16:
+                errors.append("value of 'nconnect' must be between 1 and 16")
+            elif option in ("rsize", "wsize") and not 4096 <= value <= 1048576:
+                errors.append("value of '" + option + "' must be between 4096 and 1048576")
+            elif value < 0:
+                errors.append("value of '" + option + "' must not be negative")
+
+    if kernelVersion:
+        for option, minKernelVersion in _nfsMountOptionMinKernelVersions.items():
+            if options.get(option) not in (None, False) and kernelVersion < minKernelVersion:
+                errors.append("option '" + option + "' requires Linux " + "%d.%d" % minKernelVersion + " or later (running " + "%d.%d" % kernelVersion + ")")
+
+    return errors
+
+
+def _get_nfs_mount_options(profileName: str, config: dict, print_output: bool = False) -> list:
+    # Convert a mount profile into a list of mount options, e.g. ["vers=4.1", "nconnect=16", "nocto"]
+    profiles = _get_nfs_mount_profiles(config)
+    try:
+        options = profiles[profileName]
+        if not isinstance(options, dict):
+            raise TypeError()
+    except (KeyError, TypeError):
+        if print_output:
+            print("Error: Invalid mount profile '" + profileName + "'. Available mount profiles: " + ", ".join(sorted(profiles)))
+        raise InvalidConfigError()
+
+    errors = _validate_nfs_mount_options(options)
+    if errors:
+        if print_output:
+            for error in errors:
+                print("Error: Mount profile '" + profileName + "': " + error + ".")
+        raise MountOperationError("Mount profile '" + profileName + "' is not supported: " + "; ".join(errors))
+
+    mountOptions = list()
+    for option, value in options.items():
+        if value is True:
+            mountOptions.append(option)
+        elif value is not False and value is not None:
+            mountOptions.append(option + "=" + str(value))
+    return mountOptions
+
+
+def _find_snapshot(volume_uuid: str, snapshot_name: str) -> NetAppSnapshot:
+    # Return a snapshot object containing only name and uuid; use NetAppSnapshot.find() when other fields are needed
+    cacheKey = ("snapshot", volume_uuid, snapshot_name)
+    snapshotUuid = _uuidCache.get(cacheKey)
+    if not snapshotUuid:
+        snapshot = NetAppSnapshot.find(volume_uuid, name=snapshot_name, fields="uuid")
+        if not snapshot:
+            return None
+        snapshotUuid = snapshot.uuid
+        _uuidCache.put(cacheKey, snapshotUuid)
+    return NetAppSnapshot.from_dict({"name": snapshot_name, "uuid": snapshotUuid}, volume_uuid)
+
+
+def _invalidate_volume_cache(volume_name: str, svm: str, volume_uuid: str = None):
+    _uuidCache.invalidate(lambda cacheKey: cacheKey[0] == "volume" and cacheKey[2:] == (svm, volume_name))
+    if volume_uuid:
+        _uuidCache.invalidate(lambda cacheKey: cacheKey[0] == "snapshot" and cacheKey[1] == volume_uuid)
+        _invalidate_latest_snapshot_cache(volume_uuid)
+
+
+def _invalidate_snapshot_cache(volume_uuid: str, snapshot_name: str = None):
+    # Invalidate a single snapshot, or all snapshots for the volume if no name is given
+    _uuidCache.invalidate(lambda cacheKey: cacheKey[0] == "snapshot" and cacheKey[1] == volume_uuid and snapshot_name in (None, cacheKey[2]))
+    _invalidate_latest_snapshot_cache(volume_uuid)
+
+
+def _snapshot_policy_exists(snapshot_policy: str, svm: str) -> bool:
+    # A snapshot policy can be used if it is defined either at the cluster level or on the svm
+    for snapshotPolicyDetails in NetAppSnapshotPolicy.get_collection(**{"name": snapshot_policy}):
+        if str(snapshotPolicyDetails.name) == snapshot_policy:
+            try:
+                if str(snapshotPolicyDetails.svm.name) == svm:
+                    return True
+            except:
+                return True
+    return False
+
+
+def _create_host_export_policy(export_policy: str, svm: str, export_hosts: str):
+    # Construct dict representing new export policy; hosts are exported for rw and root access
+    newExportPolicyDict = {
+        "name" : export_policy,
+        "svm": {"name": svm},
+        "rules": []
+    }
+    for client in export_hosts.split(":"):
+        newExportPolicyDict['rules'].append({ "clients": [{"match": client }], "ro_rule": ["sys"], "rw_rule": ["sys"], "superuser": ["sys"]})
+
+    # Create new export policy
+    newExportPolicy = NetAppExportPolicy.from_dict(newExportPolicyDict)
+    newExportPolicy.post(poll=True, poll_timeout=120)
+
+
+def _is_clone_policy_rejection(err: NetAppRestError) -> bool:
+    # Whether a clone creation request was rejected because of the export/snapshot policy that was set in it (as opposed to e.g. an
+    # invalid volume name), in which case the policies are set after the clone is created instead
+    if err.status_code != 400:
+        return False
+    try:
+        errorTarget = err.response_body["error"].get("target") or ""
+    except (TypeError, KeyError, AttributeError):
+        return False
+    return errorTarget.startswith(("nas.export_policy", "snapshot_policy"))
+
+
+def _build_clone_volume_dict(new_volume_name: str, target_svm: str, source_svm: str, source_volume: NetAppVolume,
+                             source_snapshot: NetAppSnapshot = None, junction: str = None, unix_uid: int = 0, unix_gid: int = 0) -> dict:
+    # Construct dict representing new volume
+    newVolumeDict = {
+        "name": new_volume_name,
+        "svm": {"name": target_svm},
+        "nas": {
+            "path": junction if junction else "/"+new_volume_name
+        },
+        "clone": {
+            "is_flexclone": True,
+            "parent_svm": {
+                "name": source_svm,
+            },
+            "parent_volume": {
+                "name": source_volume.name,
+                "uuid": source_volume.uuid
+            }
+        }
+    }
+
+    # uid/gid of '0' cannot be applied when creating a clone; uid/gid of source volume will be retained
+    if unix_uid != 0:
+        newVolumeDict["nas"]["uid"] = unix_uid
+    if unix_gid != 0:
+        newVolumeDict["nas"]["gid"] = unix_gid
+
+    # Append source snapshot details to volume dict if specified
+    if source_snapshot:
+        newVolumeDict["clone"]["parent_snapshot"] = {
+            "name": source_snapshot.name,
+            "uuid": source_snapshot.uuid
+        }
+
+    # set clone volume comment parameter
+    comment = 'PARENTSVM:'+source_svm+',PARENTVOL:'+source_volume.name+',CLONESVM:'+target_svm+',CLONENAME:'+new_volume_name
+    if source_snapshot: comment += ' SNAP:'+source_snapshot.name
+    comment += " netapp-dataops"
+    newVolumeDict["comment"] = comment
+
+    return newVolumeDict
+
+
+def _get_job_id(response) -> str:
+    # Return the uuid of the ONTAP job referenced by an asynchronous (202) API response, if any
+    try:
+        return response.http_response.json()["job"]["uuid"]
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _get_finished_jobs(job_ids: list, connection: NetAppHostConnection = None) -> dict:
+    # Retrieve the state of all outstanding jobs in a single collection query; only jobs that have finished are returned
+    finishedJobs = dict()
+    for job in NetAppJob.get_collection(uuid="|".join(job_ids), fields="state,message,code", connection=connection):
+        if job.state in ("success", "failure"):
+            finishedJobs[job.uuid] = job
+    return finishedJobs
+
+
+def _new_snap_mirror_sync_result(uuid: str, destination_path: str = None) -> dict:
+    return {"Destination Path": destination_path, "UUID": uuid, "Status": "transferring", "Bytes Transferred": 0,
+            "Throughput": None, "Seconds": None, "Error": None}
+
+
+def _watch_snap_mirror_transfers(syncResults: dict, min_interval: float = 2, max_interval: float = 30, timeout: int = None,
+                                 print_output: bool = False):
+    # Watch all triggered transfers with one fielded collection query per tick until the last one has finished
+    startTime = time.monotonic()
+    interval = min_interval
+    while True:
+        activeUuids = [uuid for uuid, syncResult in syncResults.items() if syncResult["Status"] == "transferring"]
+        if not activeUuids:
+            return
+
+        elapsed = time.monotonic() - startTime
+        if timeout is not None and elapsed >= timeout:
+            for uuid in activeUuids:
+                syncResults[uuid]["Status"] = "failed"
+                syncResults[uuid]["Error"] = "timed out"
+            return
+        time.sleep(interval if timeout is None else min(interval, timeout - elapsed))
+
+        relationships = NetAppSnapmirrorRelationship.get_collection(uuid="|".join(activeUuids), fields="destination.path,healthy,transfer.state,transfer.bytes_transferred")
+        seconds = time.monotonic() - startTime
+        reportedUuids = set()
+        stateChanged = False
+        for relationship in relationships:
+            reportedUuids.add(relationship.uuid)
+            syncResult = syncResults[relationship.uuid]
+            syncResult["Destination Path"] = relationship.destination.path
+            syncResult["Seconds"] = round(seconds, 1)
+
+            transferState = None
+            if hasattr(relationship, "transfer"):
+                transferState = getattr(relationship.transfer, "state", None)
+                syncResult["Bytes Transferred"] = int(getattr(relationship.transfer, "bytes_transferred", syncResult["Bytes Transferred"]))
+            syncResult["Throughput"] = _convert_bytes_to_pretty_size(str(syncResult["Bytes Transferred"] / seconds)) + "/s"
+
+            if (not transferState) or (transferState == "success"):
+                stateChanged = True
+                if relationship.healthy:
+                    syncResult["Status"] = "success"
+                else:
+                    syncResult["Status"] = "failed"
+                    syncResult["Error"] = "not healthy"
+            elif transferState == "finalizing":
+                # The transfer is close to completion; check again soon
+                stateChanged = True
+            elif transferState not in ("transferring", "queued", "preparing"):
+                stateChanged = True
+                syncResult["Status"] = "failed"
+                syncResult["Error"] = transferState
+
+            if print_output:
+                print(syncResult["Destination Path"] + ": " + (transferState or "idle") + ", " +
+                      _convert_bytes_to_pretty_size(str(syncResult["Bytes Transferred"])) + " transferred (" + syncResult["Throughput"] + ")")
+
+        for uuid in set(activeUuids) - reportedUuids:
+            syncResults[uuid]["Status"] = "failed"
+            syncResults[uuid]["Error"] = "relationship not found"
+
+        # Check again quickly after a transfer changes state, and back off while all transfers are still running
+        interval = min_interval if stateChanged else min(interval * 1.5, max_interval)
+
+
+def _delete_snapshots_concurrently(snapshots: list, max_workers: int = 8, print_output: bool = False) -> (list, dict):
+    deletedSnapshots = list()
+    failedSnapshots = dict()
+
+    # Issue deletes concurrently; each worker polls its own delete job
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(snapshot.delete, poll=True): snapshot for snapshot in snapshots}
+        for future in as_completed(futures):
+            snapshotName = futures[future].name
+            try:
+                future.result()
+                deletedSnapshots.append(snapshotName)
+                if print_output:
+                    print("Snapshot '" + snapshotName + "' deleted successfully.")
+            except NetAppRestError as err:
+                failedSnapshots[snapshotName] = str(err)
+                if print_output:
+                    print("Error: Snapshot '" + snapshotName + "' could not be deleted: ", err)
+
+    return deletedSnapshots, failedSnapshots
+
+
+def _apply_snapshot_retention(volume: NetAppVolume, snapshot_name_prefix: str, retention_count: int, retention_days: bool = False,
+                              max_workers: int = 8, print_output: bool = False) -> dict:
+    # Retrieve all snapshots created with the prefix, including their owners, in a single collection query
+    snapshots = [snapshot for snapshot in _get_snapshot_collection(volume.uuid, fields="name,create_time,owners",
+                                                                   name_pattern=snapshot_name_prefix+".*", order_by="create_time")
+                 if snapshot.name.startswith(snapshot_name_prefix+".")]
+
+    # Determine which snapshots fall outside of the retention window
+    if retention_days:
+        retentionDate = datetime.datetime.today() - datetime.timedelta(days=retention_count)
+        expiredSnapshots = list()
+        for snapshot in snapshots:
+            matchObj = re.match(r'^{0}\.(\d{{4}}-\d{{2}}-\d{{2}}_\d{{6}})$'.format(re.escape(snapshot_name_prefix)), snapshot.name)
+            if matchObj and datetime.datetime.strptime(matchObj.group(1), "%Y-%m-%d_%H%M%S") < retentionDate:
+                expiredSnapshots.append(snapshot)
+    else:
+        expiredSnapshots = snapshots[:max(len(snapshots) - retention_count, 0)]
+
+    # Snapshots with owners (e.g. clone parents) cannot be deleted
+    ownedSnapshots = [snapshot for snapshot in expiredSnapshots if getattr(snapshot, "owners", None)]
+    for snapshot in ownedSnapshots:
+        if print_output:
+            print("Warning: Snapshot '" + snapshot.name + "' cannot be deleted since it has owners:" + ",".join(snapshot.owners))
+    expiredSnapshots = [snapshot for snapshot in expiredSnapshots if snapshot not in ownedSnapshots]
+
+    if print_output:
+        print("Volume '" + volume.name + "': " + str(len(expiredSnapshots)) + " snapshot(s) exceed retention and will be deleted.")
+    deletedSnapshots, failedSnapshots = _delete_snapshots_concurrently(expiredSnapshots, max_workers=max_workers, print_output=print_output)
+    if deletedSnapshots:
+        _invalidate_snapshot_cache(volume.uuid)
+
+    return {
+        "Volume Name": volume.name,
+        "Kept": len(snapshots) - len(deletedSnapshots),
+        "Deleted": deletedSnapshots,
+        "Skipped (Owned)": [snapshot.name for snapshot in ownedSnapshots],
+        "Failed": failedSnapshots
+    }
+
+
 #
 # Public importable functions specific to the traditional package
 #
@@ -362,10 +2011,14 @@ def _convert_bytes_to_pretty_size(size_in_bytes: str, num_decimal_points: int =
 def clone_volume(new_volume_name: str, source_volume_name: str, cluster_name: str = None, source_snapshot_name: str = None,
                  source_svm: str = None, target_svm: str = None, export_hosts: str = None, export_policy: str = None, split: bool = False, 
                  unix_uid: str = None, unix_gid: str = None, mountpoint: str = None, junction: str= None, readonly: bool = False,
-                 snapshot_policy: str = None, refresh: bool = False, svm_dr_unprotect: bool = False, print_output: bool = False):
+                 snapshot_policy: str = None, refresh: bool = False, svm_dr_unprotect: bool = False, mount_profile: str = None,
+                 print_output: bool = False) -> dict:
+    cloneStartTime = time.perf_counter()
+    phaseTimings = dict()
+
     # Retrieve config details from config file
     try:
-        config = _retrieve_config(print_output=print_output)
+        config = _get_client(print_output=print_output).get_config()
     except InvalidConfigError:
         raise
     try:
@@ -424,7 +2077,7 @@ def clone_volume(new_volume_name: str, source_volume_name: str, cluster_name: st
 
         #check if clone volume already exists 
         try:
-            currentVolume = NetAppVolume.find(name=new_volume_name, svm=targetsvm)        
+            currentVolume = NetAppVolume.find(name=new_volume_name, svm=targetsvm, fields="comment,nas.export_policy.name,snapshot_policy.name")
             if currentVolume and not refresh:
                 if print_output:
                     print("Error: clone:"+new_volume_name+" already exists.")
@@ -485,18 +2138,7 @@ def clone_volume(new_volume_name: str, source_volume_name: str, cluster_name: st
 
         #exists check if snapshot-policy 
         try:
-            snapshotPoliciesDetails  = NetAppSnapshotPolicy.get_collection(**{"name":snapshot_policy})   
-            clusterSnapshotPolicy = False
-            svmSnapshotPolicy = False  
-            for snapshotPolicyDetails in snapshotPoliciesDetails:
-                if str(snapshotPolicyDetails.name) == snapshot_policy:
-                    try:
-                        if str(snapshotPolicyDetails.svm.name) == targetsvm:
-                            svmSnapshotPolicy = True
-                    except:
-                        clusterSnapshotPolicy = True
-
-            if not clusterSnapshotPolicy and not svmSnapshotPolicy:
+            if not _snapshot_policy_exists(snapshot_policy, targetsvm):
                 if print_output:
                     print("Error: snapshot-policy:"+snapshot_policy+" could not be found")
                 raise InvalidVolumeParameterError("snapshot_policy")                
@@ -505,106 +2147,86 @@ def clone_volume(new_volume_name: str, source_volume_name: str, cluster_name: st
                 print("Error: ONTAP Rest API Error: ", err)
             raise APIConnectionError(err)            
 
-        # Create volume
-        if print_output:
-            print("Creating clone volume '" + targetsvm+':'+new_volume_name + "' from source volume '" + sourcesvm+':'+source_volume_name + "'.")
+        phaseTimings["Validation"] = time.perf_counter() - cloneStartTime
 
-        try:
-            # Retrieve source volume
-            sourceVolume = NetAppVolume.find(name=source_volume_name, svm=sourcesvm)
-            if not sourceVolume:
+        #create custom export policy if needed, so that it can be referenced when creating the clone
+        if export_hosts:
+            phaseStartTime = time.perf_counter()
+            try:            
                 if print_output:
-                    print("Error: Invalid source volume name.")
-                raise InvalidVolumeParameterError("name")
+                    print("Creating export-policy:"+export_policy)                  
+                _create_host_export_policy(export_policy, targetsvm, export_hosts)
+            except NetAppRestError as err:
+                if print_output:
+                    print("Error: ONTAP Rest API Error: ", err)
+                raise APIConnectionError(err)
+            phaseTimings["Export Policy Creation"] = time.perf_counter() - phaseStartTime
 
-            # Create option to choose junction path.
-            if junction:
-                junction=junction
-            else:
-                junction = "/"+new_volume_name
-           
+        # Create volume
+        phaseStartTime = time.perf_counter()
+        if print_output:
+            print("Creating clone volume '" + targetsvm+':'+new_volume_name + "' from source volume '" + sourcesvm+':'+source_volume_name + "'.")
 
-            # Construct dict representing new volume
-            newVolumeDict = {
-                "name": new_volume_name,
-                "svm": {"name": targetsvm},
-                "nas": {
-                    "path": junction
-                },
-                "clone": {
-                    "is_flexclone": True,
-                    "parent_svm": {
-                        #"name": sourceVolume.svm.name,
-                        "name": sourcesvm,
-                        #"uuid": sourceVolume.svm.uuid
-                    },
-                    "parent_volume": {
-                        "name": sourceVolume.name,
-                        "uuid": sourceVolume.uuid
-                    }
-                }
-            }
-            
-            if unix_uid != 0:
-                newVolumeDict["nas"]["uid"] = unix_uid
-            else:
-                if print_output:
-                    print("Warning: Cannot apply uid of '0' when creating clone; uid of source volume will be retained.")
-            if unix_gid != 0:
-                newVolumeDict["nas"]["gid"] = unix_gid
-            else:
+        try:
+            # Retrieve source volume
+            sourceVolume = _find_volume(source_volume_name, sourcesvm)
+            if not sourceVolume:
                 if print_output:
-                    print("Warning: Cannot apply gid of '0' when creating clone; gid of source volume will be retained.")
+                    print("Error: Invalid source volume name.")
+                raise InvalidVolumeParameterError("name")
+
+            if unix_uid == 0 and print_output:
+                print("Warning: Cannot apply uid of '0' when creating clone; uid of source volume will be retained.")
+            if unix_gid == 0 and print_output:
+                print("Warning: Cannot apply gid of '0' when creating clone; gid of source volume will be retained.")
 
-            # Add source snapshot details to volume dict if specified
+            # Retrieve source snapshot if specified
+            sourceSnapshot = None
             if source_snapshot_name and not source_snapshot_name.endswith("*"):
-                # Retrieve source snapshot
-                sourceSnapshot = NetAppSnapshot.find(sourceVolume.uuid, name=source_snapshot_name)
+                sourceSnapshot = _find_snapshot(sourceVolume.uuid, source_snapshot_name)
                 if not sourceSnapshot:
                     if print_output:
                         print("Error: Invalid source snapshot name.")
                     raise InvalidSnapshotParameterError("name")
-              
-
-                # Append source snapshot details to volume dict
-                newVolumeDict["clone"]["parent_snapshot"] = {
-                    "name": sourceSnapshot.name,
-                    "uuid": sourceSnapshot.uuid
-                }
             
             if source_snapshot_name and source_snapshot_name.endswith("*"):
                 source_snapshot_prefix = source_snapshot_name[:-1]
-                latest_source_snapshot = None 
-                latest_source_snapshot_uuid = None 
 
-                # Retrieve all source snapshot from last to 1st 
-                for snapshot in NetAppSnapshot.get_collection(sourceVolume.uuid):
-                    snapshot.get()
-                    if snapshot.name.startswith(source_snapshot_prefix):
-                        latest_source_snapshot = snapshot.name
-                        latest_source_snapshot_uuid = snapshot.uuid
+                # Retrieve the most recently created snapshot matching the prefix
+                sourceSnapshot = _resolve_latest_snapshot(sourceVolume.uuid, source_snapshot_prefix)
 
-                if not latest_source_snapshot:
+                if not sourceSnapshot:
                     if print_output:
                         print("Error: Could not find snapshot prefixed by '"+source_snapshot_prefix+"'.")
                     raise InvalidSnapshotParameterError("name")
-                # Append source snapshot details to volume dict
-                newVolumeDict["clone"]["parent_snapshot"] = {
-                    "name": latest_source_snapshot,
-                    "uuid": latest_source_snapshot_uuid
-                }
-                print("Snapshot '" + latest_source_snapshot+ "' will be used to create the clone.")   
+                print("Snapshot '" + sourceSnapshot.name + "' will be used to create the clone.")   
+
+            newVolumeDict = _build_clone_volume_dict(new_volume_name=new_volume_name, target_svm=targetsvm, source_svm=sourcesvm,
+                                                     source_volume=sourceVolume, source_snapshot=sourceSnapshot, junction=junction,
+                                                     unix_uid=unix_uid, unix_gid=unix_gid)
+
+            # Create new volume clone, setting export policy and snapshot policy in the same request
+            policiesApplied = False
+            if _current_cluster() not in _clonePolicyPostUnsupportedClusters:
+                foldedVolumeDict = copy.deepcopy(newVolumeDict)
+                foldedVolumeDict["nas"]["export_policy"] = {"name": export_policy}
+                foldedVolumeDict["snapshot_policy"] = {"name": snapshot_policy}
+                newVolume = NetAppVolume.from_dict(foldedVolumeDict)
+                try:
+                    newVolume.post(poll=True, poll_timeout=120)
+                    policiesApplied = True
+                except NetAppRestError as err:
+                    # The policies were rejected before a clone was created; fall back to setting them after creation
+                    if not _is_clone_policy_rejection(err):
+                        raise
+                    _clonePolicyPostUnsupportedClusters.add(_current_cluster())
 
-            # set clone volume commnet parameter 
-            comment = 'PARENTSVM:'+sourcesvm+',PARENTVOL:'+newVolumeDict["clone"]["parent_volume"]["name"]+',CLONESVM:'+targetsvm+',CLONENAME:'+newVolumeDict["name"]
-            if source_snapshot_name: comment += ' SNAP:'+newVolumeDict["clone"]["parent_snapshot"]["name"] 
-            comment += " netapp-dataops"
-            
-            newVolumeDict["comment"] = comment
+            if not policiesApplied:
+                newVolume = NetAppVolume.from_dict(newVolumeDict)
+                newVolume.post(poll=True, poll_timeout=120)
 
-            # Create new volume clone 
-            newVolume = NetAppVolume.from_dict(newVolumeDict)
-            newVolume.post(poll=True, poll_timeout=120)
+            _invalidate_volume_cache(new_volume_name, targetsvm)
+            _uuidCache.put(("volume", _current_cluster(), targetsvm, new_volume_name), newVolume.uuid)
             if print_output:
                 print("Clone volume created successfully.")
 
@@ -612,8 +2234,10 @@ def clone_volume(new_volume_name: str, source_volume_name: str, cluster_name: st
             if print_output:
                 print("Error: ONTAP Rest API Error: ", err)
             raise APIConnectionError(err)
+        phaseTimings["Clone Creation"] = time.perf_counter() - phaseStartTime
 
         if svm_dr_unprotect:
+            phaseStartTime = time.perf_counter()
             try:
                 if print_output:
                     print("Disabling svm-dr protection")                 
@@ -626,54 +2250,34 @@ def clone_volume(new_volume_name: str, source_volume_name: str, cluster_name: st
                     if print_output:
                         print("Error: ONTAP Rest API Error: ", err)                    
                     raise APIConnectionError(err)                
+            phaseTimings["SVM-DR Unprotect"] = time.perf_counter() - phaseStartTime
 
-        #create custom export policy if needed 
-        if export_hosts:
-            try:            
+        #set export policy and snapshot policy if they could not be set when creating the clone
+        if not policiesApplied:
+            phaseStartTime = time.perf_counter()
+            try:
                 if print_output:
-                    print("Creating export-policy:"+export_policy)                  
-                # Construct dict representing new export policy    
-                newExportPolicyDict = {
-                    "name" : export_policy,
-                    "svm": {"name": targetsvm},
-                    "rules": []
-                }
-                for client in export_hosts.split(":"):
-                    newExportPolicyDict['rules'].append({ "clients": [{"match": client }], "ro_rule": ["sys"], "rw_rule": ["sys"], "superuser": ["sys"]})
-
-                # Create new export policy                
-                newExportPolicy = NetAppExportPolicy.from_dict(newExportPolicyDict)
-                newExportPolicy.post(poll=True, poll_timeout=120)
-              
+                    print("Setting export-policy:"+export_policy+ " snapshot-policy:"+snapshot_policy) 
+                updatedVolumeDetails = NetAppVolume(uuid=newVolume.uuid)
+                updatedVolumeDetails.nas = {"export_policy": {"name": export_policy}}
+                updatedVolumeDetails.snapshot_policy = {"name": snapshot_policy}
+                updatedVolumeDetails.patch(poll=True, poll_timeout=120) 
             except NetAppRestError as err:
                 if print_output:
                     print("Error: ONTAP Rest API Error: ", err)
-                raise APIConnectionError(err)
-
-        #set export policy and snapshot policy 
-        try:
-            if print_output:
-                print("Setting export-policy:"+export_policy+ " snapshot-policy:"+snapshot_policy) 
-            volumeDetails = NetAppVolume.find(name=new_volume_name, svm=targetsvm)   
-            updatedVolumeDetails = NetAppVolume(uuid=volumeDetails.uuid)
-            updatedVolumeDetails.nas = {"export_policy": {"name": export_policy}}
-            updatedVolumeDetails.snapshot_policy = {"name": snapshot_policy}
-            updatedVolumeDetails.patch(poll=True, poll_timeout=120) 
-        except NetAppRestError as err:
-            if print_output:
-                print("Error: ONTAP Rest API Error: ", err)
-            raise APIConnectionError(err)              
+                raise APIConnectionError(err)              
+            phaseTimings["Policy Update"] = time.perf_counter() - phaseStartTime
 
         #split clone 
         try:
             if split: 
+                phaseStartTime = time.perf_counter()
                 if print_output:
                     print("Splitting clone") 
-                volumeDetails = NetAppVolume.find(name=new_volume_name, svm=targetsvm)                    
-                #get volume details 
-                updatedVolumeDetails = NetAppVolume(uuid=volumeDetails.uuid)        
+                updatedVolumeDetails = NetAppVolume(uuid=newVolume.uuid)        
                 updatedVolumeDetails.clone = {"split_initiated": True}
                 updatedVolumeDetails.patch()   
+                phaseTimings["Split Initiation"] = time.perf_counter() - phaseStartTime
 
         except NetAppRestError as err:
             if print_output:
@@ -682,21 +2286,349 @@ def clone_volume(new_volume_name: str, source_volume_name: str, cluster_name: st
 
         # Optionally mount newly created volume
         if mountpoint:
+            phaseStartTime = time.perf_counter()
             try:
-                mount_volume(volume_name=new_volume_name, svm_name=targetsvm, mountpoint=mountpoint, readonly=readonly, print_output=True)
+                mount_volume(volume_name=new_volume_name, svm_name=targetsvm, mountpoint=mountpoint, readonly=readonly, mount_profile=mount_profile,
+                             print_output=True)
             except (InvalidConfigError, APIConnectionError, InvalidVolumeParameterError, MountOperationError):
                 if print_output:
                     print("Error: Error mounting clone volume.")
                 raise
+            phaseTimings["Mount"] = time.perf_counter() - phaseStartTime
+
+        phaseTimings["Total"] = time.perf_counter() - cloneStartTime
+        if print_output:
+            print("Clone timings (seconds): " + ", ".join(phase + ": " + "{:.2f}".format(seconds) for phase, seconds in phaseTimings.items()))
+
+        return {"Volume Name": new_volume_name, "SVM": targetsvm, "UUID": newVolume.uuid, "Timings": phaseTimings}
+
+    else:
+        raise ConnectionTypeError()
+
+
+def clone_volumes(specs: list, cluster_name: str = None, max_workers: int = 8, poll_interval: int = 1, job_timeout: int = 120,
+                  print_output: bool = False) -> list() :
+    # Retrieve config details from config file
+    try:
+        config = _get_client(print_output=print_output).get_config()
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    if cluster_name:
+        config["hostname"] = cluster_name
+
+    if connectionType == "ONTAP":
+        # Validate batch parameters
+        try:
+            max_workers = int(max_workers)
+            if max_workers < 1:
+                raise ValueError()
+        except (TypeError, ValueError):
+            if print_output:
+                print("Error: Invalid max_workers value. Value must be a positive integer.")
+            raise InvalidVolumeParameterError("max_workers")
+
+        # Instantiate connection to ONTAP cluster
+        try:
+            batchConnection = _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+        except InvalidConfigError:
+            raise
+
+        batchStartTime = time.perf_counter()
+        supportedSpecKeys = ("new_volume_name", "source_volume_name", "source_snapshot_name", "source_svm", "target_svm", "export_hosts",
+                             "export_policy", "snapshot_policy", "split", "unix_uid", "unix_gid", "junction", "svm_dr_unprotect",
+                             "mountpoint", "readonly", "mount_profile")
+
+        # Results are returned in the same order as the specs; a failed clone does not abort the batch
+        cloneResults = list()
+        for spec in specs:
+            cloneResults.append({"Volume Name": spec.get("new_volume_name") if isinstance(spec, dict) else None, "SVM": None,
+                                 "UUID": None, "Status": "pending", "Error": None, "Seconds": None})
+
+        def fail(index: int, error):
+            cloneResults[index]["Status"] = "failed"
+            cloneResults[index]["Error"] = str(error)
+            if print_output:
+                print("Error: clone '" + str(cloneResults[index]["Volume Name"]) + "' failed: " + str(error))
+
+        # Apply defaults from config file and validate each spec
+        cloneRequests = dict()
+        for index, spec in enumerate(specs):
+            try:
+                if not isinstance(spec, dict):
+                    raise InvalidVolumeParameterError("spec")
+                unsupportedKeys = set(spec) - set(supportedSpecKeys)
+                if unsupportedKeys:
+                    raise InvalidVolumeParameterError(", ".join(sorted(unsupportedKeys)))
+                if not spec.get("new_volume_name") or not spec.get("source_volume_name"):
+                    raise InvalidVolumeParameterError("new_volume_name/source_volume_name")
+                if spec.get("export_hosts") and spec.get("export_policy"):
+                    raise InvalidVolumeParameterError("export_hosts/export_policy")
+
+                cloneRequest = dict(spec)
+                cloneRequest["source_svm"] = spec.get("source_svm") or config["svm"]
+                cloneRequest["target_svm"] = spec.get("target_svm") or cloneRequest["source_svm"]
+                cloneRequest["unix_uid"] = int(spec.get("unix_uid") or config["defaultUnixUID"])
+                cloneRequest["unix_gid"] = int(spec.get("unix_gid") or config["defaultUnixGID"])
+                cloneRequest["snapshot_policy"] = spec.get("snapshot_policy") or config["defaultSnapshotPolicy"]
+                if spec.get("export_hosts"):
+                    cloneRequest["export_policy"] = "netapp_dataops_"+spec["new_volume_name"]
+                else:
+                    cloneRequest["export_policy"] = spec.get("export_policy") or config["defaultExportPolicy"]
+                cloneResults[index]["SVM"] = cloneRequest["target_svm"]
+                cloneRequests[index] = cloneRequest
+            except KeyError as err:
+                fail(index, "value missing from config file: " + str(err))
+            except (TypeError, ValueError):
+                fail(index, "invalid unix uid/gid")
+            except InvalidVolumeParameterError as err:
+                fail(index, "invalid parameter: " + str(err))
+
+        # Validate inputs that are shared between clones only once
+        sourceVolumes = dict()
+        sourceSnapshots = dict()
+        snapshotPolicies = dict()
+        exportPolicies = dict()
+        existingVolumes = dict()
+        try:
+            # Retrieve all existing volumes with the requested names using one collection query per target svm
+            targetVolumeNames = collections.defaultdict(set)
+            for cloneRequest in cloneRequests.values():
+                targetVolumeNames[cloneRequest["target_svm"]].add(cloneRequest["new_volume_name"])
+            for targetsvm, volumeNames in targetVolumeNames.items():
+                existingVolumes[targetsvm] = set(volume.name for volume in NetAppVolume.get_collection(svm=targetsvm, name="|".join(sorted(volumeNames)), fields="name"))
+        except NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+
+        for index, cloneRequest in list(cloneRequests.items()):
+            try:
+                sourcesvm = cloneRequest["source_svm"]
+                targetsvm = cloneRequest["target_svm"]
+                if cloneRequest["new_volume_name"] in existingVolumes[targetsvm]:
+                    raise InvalidVolumeParameterError("volume already exists")
+                if [otherIndex for otherIndex, otherRequest in cloneRequests.items() if otherIndex < index and
+                        (otherRequest["target_svm"], otherRequest["new_volume_name"]) == (targetsvm, cloneRequest["new_volume_name"])]:
+                    raise InvalidVolumeParameterError("volume name specified more than once")
+
+                sourceVolumeKey = (sourcesvm, cloneRequest["source_volume_name"])
+                if sourceVolumeKey not in sourceVolumes:
+                    sourceVolumes[sourceVolumeKey] = _find_volume(cloneRequest["source_volume_name"], sourcesvm)
+                sourceVolume = sourceVolumes[sourceVolumeKey]
+                if not sourceVolume:
+                    raise InvalidVolumeParameterError("invalid source volume name")
+
+                sourceSnapshot = None
+                sourceSnapshotName = cloneRequest.get("source_snapshot_name")
+                if sourceSnapshotName:
+                    sourceSnapshotKey = (sourceVolume.uuid, sourceSnapshotName)
+                    if sourceSnapshotKey not in sourceSnapshots:
+                        if sourceSnapshotName.endswith("*"):
+                            sourceSnapshots[sourceSnapshotKey] = _resolve_latest_snapshot(sourceVolume.uuid, sourceSnapshotName[:-1])
+                        else:
+                            sourceSnapshots[sourceSnapshotKey] = _find_snapshot(sourceVolume.uuid, sourceSnapshotName)
+                    sourceSnapshot = sourceSnapshots[sourceSnapshotKey]
+                    if not sourceSnapshot:
+                        raise InvalidSnapshotParameterError("invalid source snapshot name")
+
+                snapshotPolicyKey = (cloneRequest["snapshot_policy"], targetsvm)
+                if snapshotPolicyKey not in snapshotPolicies:
+                    snapshotPolicies[snapshotPolicyKey] = _snapshot_policy_exists(cloneRequest["snapshot_policy"], targetsvm)
+                if not snapshotPolicies[snapshotPolicyKey]:
+                    raise InvalidVolumeParameterError("snapshot-policy " + cloneRequest["snapshot_policy"] + " could not be found")
+
+                if cloneRequest.get("export_policy") and not cloneRequest.get("export_hosts"):
+                    exportPolicyKey = (cloneRequest["export_policy"], targetsvm)
+                    if exportPolicyKey not in exportPolicies:
+                        exportPolicies[exportPolicyKey] = bool(NetAppExportPolicy.find(name=cloneRequest["export_policy"], svm=targetsvm))
+                    if not exportPolicies[exportPolicyKey]:
+                        raise InvalidVolumeParameterError("export policy " + cloneRequest["export_policy"] + " does not exist")
+
+                cloneRequest["volume_dict"] = _build_clone_volume_dict(new_volume_name=cloneRequest["new_volume_name"], target_svm=targetsvm,
+                                                                       source_svm=sourcesvm, source_volume=sourceVolume,
+                                                                       source_snapshot=sourceSnapshot, junction=cloneRequest.get("junction"),
+                                                                       unix_uid=cloneRequest["unix_uid"], unix_gid=cloneRequest["unix_gid"])
+            except (InvalidVolumeParameterError, InvalidSnapshotParameterError, NetAppRestError) as err:
+                fail(index, err)
+                del cloneRequests[index]
+
+        def submit_clone(index: int) -> str:
+            # Create custom export policy if needed, then submit the clone creation request without waiting for the job to complete
+            cloneRequest = cloneRequests[index]
+            cloneRequest["start_time"] = time.perf_counter()
+            if cloneRequest.get("export_hosts"):
+                existingExportPolicy = NetAppExportPolicy.find(name=cloneRequest["export_policy"], svm=cloneRequest["target_svm"])
+                if existingExportPolicy:
+                    existingExportPolicy.delete()
+                _create_host_export_policy(cloneRequest["export_policy"], cloneRequest["target_svm"], cloneRequest["export_hosts"])
+
+            cloneRequest["policies_applied"] = False
+            if _current_cluster() not in _clonePolicyPostUnsupportedClusters:
+                foldedVolumeDict = copy.deepcopy(cloneRequest["volume_dict"])
+                foldedVolumeDict["nas"]["export_policy"] = {"name": cloneRequest["export_policy"]}
+                foldedVolumeDict["snapshot_policy"] = {"name": cloneRequest["snapshot_policy"]}
+                newVolume = NetAppVolume.from_dict(foldedVolumeDict)
+                try:
+                    response = newVolume.post(poll=False)
+                    cloneRequest["policies_applied"] = True
+                except NetAppRestError as err:
+                    if not _is_clone_policy_rejection(err):
+                        raise
+                    _clonePolicyPostUnsupportedClusters.add(_current_cluster())
+
+            if not cloneRequest["policies_applied"]:
+                newVolume = NetAppVolume.from_dict(cloneRequest["volume_dict"])
+                response = newVolume.post(poll=False)
+
+            cloneResults[index]["UUID"] = newVolume.uuid
+            return _get_job_id(response)
+
+        def finish_clone(index: int):
+            # Apply the settings that cannot be part of the clone creation request
+            cloneRequest = cloneRequests[index]
+            volumeUuid = cloneResults[index]["UUID"]
+            _invalidate_volume_cache(cloneRequest["new_volume_name"], cloneRequest["target_svm"])
+            _uuidCache.put(("volume", _current_cluster(), cloneRequest["target_svm"], cloneRequest["new_volume_name"]), volumeUuid)
+
+            if not cloneRequest["policies_applied"]:
+                updatedVolumeDetails = NetAppVolume(uuid=volumeUuid)
+                updatedVolumeDetails.nas = {"export_policy": {"name": cloneRequest["export_policy"]}}
+                updatedVolumeDetails.snapshot_policy = {"name": cloneRequest["snapshot_policy"]}
+                updatedVolumeDetails.patch(poll=True, poll_timeout=job_timeout)
+
+            if cloneRequest.get("svm_dr_unprotect"):
+                try:
+                    NetAppCLI().execute("volume modify", vserver=cloneRequest["target_svm"], volume=cloneRequest["new_volume_name"], body={"vserver_dr_protection": "unprotected"})
+                except NetAppRestError as err:
+                    if not "volume is not part of a Vserver DR configuration" in str(err):
+                        raise
+
+            if cloneRequest.get("split"):
+                updatedVolumeDetails = NetAppVolume(uuid=volumeUuid)
+                updatedVolumeDetails.clone = {"split_initiated": True}
+                updatedVolumeDetails.patch()
+
+            if cloneRequest.get("mountpoint"):
+                mount_volume(volume_name=cloneRequest["new_volume_name"], cluster_name=cluster_name, svm_name=cloneRequest["target_svm"], mountpoint=cloneRequest["mountpoint"],
+                             readonly=bool(cloneRequest.get("readonly")), mount_profile=cloneRequest.get("mount_profile"), print_output=print_output)
+
+        def complete(index: int, error=None):
+            cloneResults[index]["Seconds"] = round(time.perf_counter() - cloneRequests[index]["start_time"], 2)
+            if error:
+                fail(index, error)
+            else:
+                cloneResults[index]["Status"] = "created"
+                if print_output:
+                    print("Clone '" + cloneRequests[index]["new_volume_name"] + "' created successfully.")
+
+        if print_output:
+            print("Creating " + str(len(cloneRequests)) + " clone volume(s) with up to " + str(max_workers) + " concurrent clone jobs.")
+
+        # Keep up to max_workers clone jobs outstanding, polling all outstanding jobs with a single request per interval
+        pendingIndexes = collections.deque(sorted(cloneRequests))
+        outstandingJobs = dict()
+        finishFutures = dict()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pendingIndexes or outstandingJobs:
+                submitIndexes = list()
+                while pendingIndexes and len(outstandingJobs) + len(submitIndexes) < max_workers:
+                    submitIndexes.append(pendingIndexes.popleft())
+                submitFutures = {executor.submit(_bind_to_current_context(submit_clone), index): index for index in submitIndexes}
+                for future in as_completed(submitFutures):
+                    index = submitFutures[future]
+                    try:
+                        jobId = future.result()
+                    except (NetAppRestError, InvalidVolumeParameterError) as err:
+                        complete(index, err)
+                        continue
+                    if jobId:
+                        outstandingJobs[jobId] = (index, time.monotonic())
+                    else:
+                        finishFutures[executor.submit(_bind_to_current_context(finish_clone), index)] = index
+
+                if not outstandingJobs:
+                    continue
+
+                time.sleep(poll_interval)
+                try:
+                    finishedJobs = _get_finished_jobs(list(outstandingJobs), connection=batchConnection)
+                except NetAppRestError as err:
+                    if print_output:
+                        print("Error: ONTAP Rest API Error: ", err)
+                    raise APIConnectionError(err)
+
+                for jobId, (index, submitTime) in list(outstandingJobs.items()):
+                    job = finishedJobs.get(jobId)
+                    if job:
+                        del outstandingJobs[jobId]
+                        if job.state == "success":
+                            finishFutures[executor.submit(_bind_to_current_context(finish_clone), index)] = index
+                        else:
+                            complete(index, "clone job failed: " + str(getattr(job, "message", "")))
+                    elif time.monotonic() - submitTime > job_timeout:
+                        del outstandingJobs[jobId]
+                        complete(index, "timed out waiting for clone job " + jobId)
+
+            for future in as_completed(finishFutures):
+                index = finishFutures[future]
+                try:
+                    future.result()
+                    complete(index)
+                except (NetAppRestError, InvalidConfigError, APIConnectionError, InvalidVolumeParameterError, MountOperationError) as err:
+                    complete(index, err)
+
+        # Print summary
+        if print_output:
+            succeeded = len([cloneResult for cloneResult in cloneResults if cloneResult["Status"] == "created"])
+            print("Created " + str(succeeded) + " of " + str(len(cloneResults)) + " clone volume(s) in " +
+                  "{:.2f}".format(time.perf_counter() - batchStartTime) + " seconds.")
+            cloneResultsDF = pd.DataFrame.from_dict(cloneResults, dtype="string").fillna("")
+            print(tabulate(cloneResultsDF, showindex=False, headers=cloneResultsDF.columns))
+
+        return cloneResults
 
     else:
         raise ConnectionTypeError()
 
 
-def create_snapshot(volume_name: str, cluster_name: str = None, svm_name: str = None, snapshot_name: str = None, retention_count: int = 0, retention_days: bool = False, snapmirror_label: str = None, print_output: bool = False):
+def configure_uuid_cache(enabled: bool = True, max_entries: int = 1024, ttl: int = 300, print_output: bool = False):
+    # Validate parameters
+    try:
+        max_entries = int(max_entries)
+        ttl = int(ttl)
+        if max_entries < 1 or ttl < 0:
+            raise ValueError()
+    except (TypeError, ValueError):
+        if print_output:
+            print("Error: Invalid cache parameters. max_entries must be a positive integer and ttl must be a non-negative integer.")
+        raise InvalidConfigError()
+
+    # Apply settings to the name to UUID cache and the latest snapshot cache, discarding any cached entries
+    for cache in (_uuidCache, _latestSnapshotCache):
+        cache.clear()
+        cache.enabled = enabled
+    _uuidCache.max_entries = max_entries
+    _uuidCache.ttl = ttl
+    _latestSnapshotCache.ttl = min(ttl, 60)
+
+    if print_output:
+        if enabled:
+            print("UUID cache enabled (max entries: " + str(max_entries) + ", TTL: " + str(ttl) + " seconds).")
+        else:
+            print("UUID cache disabled.")
+
+
+def create_snapshot(volume_name: str, cluster_name: str = None, svm_name: str = None, snapshot_name: str = None, retention_count: int = 0, retention_days: bool = False, snapmirror_label: str = None, wait: bool = True, print_output: bool = False):
     # Retrieve config details from config file
     try:
-        config = _retrieve_config(print_output=print_output)
+        config = _get_client(print_output=print_output).get_config()
     except InvalidConfigError:
         raise
     try:
@@ -740,7 +2672,7 @@ def create_snapshot(volume_name: str, cluster_name: str = None, svm_name: str =
 
         try:
             # Retrieve volume
-            volume = NetAppVolume.find(name=volume_name, svm=svm)
+            volume = _find_volume(volume_name, svm)
             if not volume:
                 if print_output:
                     print("Error: Invalid volume name.")
@@ -758,61 +2690,40 @@ def create_snapshot(volume_name: str, cluster_name: str = None, svm_name: str =
 
             # Create snapshot
             snapshot = NetAppSnapshot.from_dict(snapshotDict)
-            snapshot.post(poll=True)
-
-            if print_output:
-                print("Snapshot created successfully.")
+            response = snapshot.post(poll=wait)
 
         except NetAppRestError as err:
             if print_output:
                 print("Error: ONTAP Rest API Error: ", err)
             raise APIConnectionError(err)
 
-        #delete snapshots exceeding retention count if provided
-        retention_count = int(retention_count)  
-        if retention_count > 0:
-            try:  
-                # Retrieve all source snapshot from last to 1st 
-                # Retrieve volume
-                volume = NetAppVolume.find(name=volume_name, svm=svm)
-                if not volume:
+        def finish_create_snapshot():
+            _invalidate_snapshot_cache(volume.uuid, snapshot_name)
+            if print_output:
+                print("Snapshot created successfully.")
+
+            #delete snapshots exceeding retention count if provided
+            if int(retention_count) > 0:
+                try:  
+                    retentionSummary = _apply_snapshot_retention(volume=volume, snapshot_name_prefix=snapshot_name_original,
+                                                                 retention_count=int(retention_count), retention_days=retention_days,
+                                                                 print_output=print_output)
+
+                except NetAppRestError as err:
                     if print_output:
-                        print("Error: Invalid volume name.")
-                    raise InvalidVolumeParameterError("name")    
-
-                if retention_days:
-                    retention_date = datetime.datetime.today() - datetime.timedelta(days=retention_count)
-                
-                last_snapshot_list = []          
-                snapshot_list = []
-                for snapshot in NetAppSnapshot.get_collection(volume.uuid):
-                    snapshot.get()
-                    if snapshot.name.startswith(snapshot_name_original+'.'):
-                        if not retention_days:
-                            snapshot_list.append(snapshot.name)   
-                            last_snapshot_list.append(snapshot.name)
-                            if len(last_snapshot_list) > retention_count:
-                                last_snapshot_list.pop(0)
-                        else:
-                            rx = r'^{0}\.(.+)$'.format(snapshot_name_original)
-                            matchObj = re.match(rx,snapshot.name)
-                            if matchObj:
-                                snapshot_date = matchObj.group(1)
-                                snapshot_date_obj = datetime.datetime.strptime(snapshot_date, "%Y-%m-%d_%H%M%S")
-                                snapshot_list.append(snapshot.name)   
-                                last_snapshot_list.append(snapshot.name)
-                                if snapshot_date_obj < retention_date:
-                                    last_snapshot_list.pop(0)
-                
-                #delete snapshots not in retention 
-                for snap in snapshot_list:
-                    if snap not in last_snapshot_list:
-                        delete_snapshot(volume_name=volume_name, svm_name = svm, snapshot_name=snap, skip_owned=True, print_output=True)
+                        print("Error: ONTAP Rest API Error: ", err)
+                    raise APIConnectionError(err)                                   
 
-            except NetAppRestError as err:
-                if print_output:
-                    print("Error: ONTAP Rest API Error: ", err)
-                raise APIConnectionError(err)                                   
+                # The new snapshot was created, but snapshots that exceed retention were left behind
+                if retentionSummary["Failed"]:
+                    if print_output:
+                        print("Error: " + str(len(retentionSummary["Failed"])) + " snapshot(s) exceeding retention could not be deleted.")
+                    raise APIConnectionError("Snapshot(s) exceeding retention could not be deleted: " + ", ".join(sorted(retentionSummary["Failed"])),
+                                             retentionSummary)
+
+        if not wait:
+            return _submit_job(response, "create snapshot " + volume_name + "@" + snapshot_name, on_success=finish_create_snapshot)
+        finish_create_snapshot()
     else:
         raise ConnectionTypeError()
 
@@ -821,10 +2732,10 @@ def create_volume(volume_name: str, volume_size: str, guarantee_space: bool = Fa
                   volume_type: str = "flexvol", unix_permissions: str = "0777",
                   unix_uid: str = "0", unix_gid: str = "0", export_policy: str = "default",
                   snapshot_policy: str = None, aggregate: str = None, mountpoint: str = None, junction: str = None, readonly: bool = False,
-                  print_output: bool = False, tiering_policy: str = None, vol_dp: bool = False):
+                  print_output: bool = False, tiering_policy: str = None, vol_dp: bool = False, wait: bool = True, mount_profile: str = None):
     # Retrieve config details from config file
     try:
-        config = _retrieve_config(print_output=print_output)
+        config = _get_client(print_output=print_output).get_config()
     except InvalidConfigError:
         raise
     try:
@@ -977,31 +2888,39 @@ def create_volume(volume_name: str, volume_size: str, guarantee_space: bool = Fa
             print("Creating volume '" + volume_name + "' on svm '" + svm + "'")
         try:
             volume = NetAppVolume.from_dict(volumeDict)
-            volume.post(poll=True)
-            if print_output:
-                print("Volume created successfully.")
+            response = volume.post(poll=wait)
         except NetAppRestError as err:
             if print_output:
                 print("Error: ONTAP Rest API Error: ", err)
             raise APIConnectionError(err)
 
-        # Optionally mount newly created volume
-        if mountpoint:
-            try:
-                mount_volume(volume_name=volume_name, svm_name=svm, mountpoint=mountpoint, readonly=readonly, print_output=True)
-            except (InvalidConfigError, APIConnectionError, InvalidVolumeParameterError, MountOperationError):
-                if print_output:
-                    print("Error: Error mounting volume.")
-                raise
+        def finish_create_volume():
+            _invalidate_volume_cache(volume_name, svm)
+            if print_output:
+                print("Volume created successfully.")
+
+            # Optionally mount newly created volume
+            if mountpoint:
+                try:
+                    mount_volume(volume_name=volume_name, cluster_name=cluster_name, svm_name=svm, mountpoint=mountpoint, readonly=readonly,
+                                 mount_profile=mount_profile, print_output=True)
+                except (InvalidConfigError, APIConnectionError, InvalidVolumeParameterError, MountOperationError):
+                    if print_output:
+                        print("Error: Error mounting volume.")
+                    raise
+
+        if not wait:
+            return _submit_job(response, "create volume " + svm + ":" + volume_name, on_success=finish_create_volume)
+        finish_create_volume()
 
     else:
         raise ConnectionTypeError()
 
 
-def delete_snapshot(volume_name: str, snapshot_name: str, cluster_name: str = None, svm_name: str = None, skip_owned: bool = False, print_output: bool = False):
+def delete_snapshot(volume_name: str, snapshot_name: str, cluster_name: str = None, svm_name: str = None, skip_owned: bool = False, wait: bool = True, print_output: bool = False):
     # Retrieve config details from config file
     try:
-        config = _retrieve_config(print_output=print_output)
+        config = _get_client(print_output=print_output).get_config()
     except InvalidConfigError:
         raise
     try:
@@ -1036,7 +2955,7 @@ def delete_snapshot(volume_name: str, snapshot_name: str, cluster_name: str = No
 
         try:
             # Retrieve volume
-            volume = NetAppVolume.find(name=volume_name, svm=svm)
+            volume = _find_volume(volume_name, svm)
             if not volume:
                 if print_output:
                     print("Error: Invalid volume name.")
@@ -1060,28 +2979,36 @@ def delete_snapshot(volume_name: str, snapshot_name: str, cluster_name: str = No
                 else:
                     if print_output:
                         print('Warning: Snapshot cannot be deleted since it has owners:'+','.join(snapshot.owners))
+                    if not wait:
+                        return _completed_job("delete snapshot " + volume_name + "@" + snapshot_name)
                     return
 
             # Delete snapshot
-            snapshot.delete(poll=True)
-
-            if print_output:
-                print("Snapshot deleted successfully.")
+            response = snapshot.delete(poll=wait)
 
         except NetAppRestError as err :
             if print_output:
                 print("Error: ONTAP Rest API Error: ", err)
             raise APIConnectionError(err)
 
+        def finish_delete_snapshot():
+            _invalidate_snapshot_cache(volume.uuid, snapshot_name)
+            if print_output:
+                print("Snapshot deleted successfully.")
+
+        if not wait:
+            return _submit_job(response, "delete snapshot " + volume_name + "@" + snapshot_name, on_success=finish_delete_snapshot)
+        finish_delete_snapshot()
+
     else:
         raise ConnectionTypeError()
 
 
 def delete_volume(volume_name: str, cluster_name: str = None, svm_name: str = None, delete_mirror: bool = False, 
-                delete_non_clone: bool = False, print_output: bool = False):
+                delete_non_clone: bool = False, wait: bool = True, print_output: bool = False):
     # Retrieve config details from config file
     try:
-        config = _retrieve_config(print_output=print_output)
+        config = _get_client(print_output=print_output).get_config()
     except InvalidConfigError:
         raise
     try:
@@ -1172,10 +3099,7 @@ def delete_volume(volume_name: str, cluster_name: str = None, svm_name: str = No
             if print_output:
                 print("Deleting volume '" + svm+':'+volume_name + "'.")
             # Delete volume
-            volume.delete(poll=True)
-
-            if print_output:
-                print("Volume deleted successfully.")
+            response = volume.delete(poll=wait)
 
         except NetAppRestError as err:
             if print_output:
@@ -1187,10 +3111,51 @@ def delete_volume(volume_name: str, cluster_name: str = None, svm_name: str = No
                     print("Error: ONTAP Rest API Error: ", err)
             raise APIConnectionError(err)
 
+        def finish_delete_volume():
+            _invalidate_volume_cache(volume_name, svm, volume.uuid)
+            if print_output:
+                print("Volume deleted successfully.")
+
+        if not wait:
+            return _submit_job(response, "delete volume " + svm + ":" + volume_name, on_success=finish_delete_volume)
+        finish_delete_volume()
+
     else:
         raise ConnectionTypeError()
 
 
+def iter_s3_objects(s3_bucket: str, s3_object_key_prefix: str = "", max_workers: int = None, max_buffer_size="256MB", ordered: bool = False,
+                    print_output: bool = False):
+    # Retrieve S3 access details from existing config file
+    try:
+        s3Endpoint, s3AccessKeyId, s3SecretAccessKey, s3VerifySSLCert, s3CACertBundle = _retrieve_s3_access_details(print_output=print_output)
+    except InvalidConfigError:
+        raise
+
+    if not max_workers:
+        max_workers = _s3_default_max_workers()
+    try:
+        maxBufferSize = _convert_pretty_size_to_bytes(max_buffer_size)
+        if max_workers < 1 or maxBufferSize < 1:
+            raise ValueError()
+    except (ValueError, TypeError):
+        if print_output:
+            print("Error: max_workers and max_buffer_size must be positive.")
+        raise InvalidConfigError()
+
+    # Instantiate S3 client
+    try:
+        s3Client = _instantiate_s3_client(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, max_workers=max_workers, print_output=print_output)
+    except Exception as err:
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+
+    # The config is resolved above, when the function is called; objects are only listed and downloaded once iteration starts
+    return _iter_s3_objects(s3Client, s3Bucket=s3_bucket, s3ObjectKeyPrefix=s3_object_key_prefix, max_workers=max_workers,
+                            maxBufferSize=maxBufferSize, ordered=ordered, print_output=print_output)
+
+
 def list_cloud_sync_relationships(print_output: bool = False) -> list():
     # Step 1: Obtain access token and account ID for accessing Cloud Sync API
 
@@ -1200,24 +3165,14 @@ def list_cloud_sync_relationships(print_output: bool = False) -> list():
     except InvalidConfigError:
         raise
 
-    # Obtain access token and account ID
-    try:
-        accessToken, accountId = _get_cloud_sync_access_parameters(refreshToken=refreshToken, print_output=print_output)
-    except APIConnectionError:
-        raise
-
     # Step 2: Retrieve list of relationships
 
-    # Define parameters for API call
+    # Call API to retrieve list of relationships; the access token and account ID are cached between calls
     url = "https://cloudsync.netapp.com/api/relationships-v2"
-    headers = {
-        "Accept": "application/json",
-        "x-account-id": accountId,
-        "Authorization": "Bearer " + accessToken
-    }
-
-    # Call API to retrieve list of relationships
-    response = requests.get(url = url, headers = headers)
+    try:
+        response = _call_cloud_sync_api("GET", url=url, refreshToken=refreshToken, print_output=print_output)
+    except APIConnectionError:
+        raise
 
     # Check for API response status code of 200; if not 200, raise error
     if response.status_code != 200:
@@ -1239,15 +3194,240 @@ def list_cloud_sync_relationships(print_output: bool = False) -> list():
 
     # Print list of relationships
     if print_output:
-        print(yaml.dump(relationshipsList))
+        print(yaml.dump(relationshipsList))
+
+    return relationshipsList
+
+
+def generate_automount_map(map_path: str, mount_root: str = None, map_format: str = "autofs", cluster_name: str = None, svm_name: str = None,
+                           name_pattern: str = None, comment_tag: str = None, clone_parent: str = None, mount_profile: str = None,
+                           lif_selection: str = None, readonly: bool = False, timeout: int = 600, master_map_file: str = None,
+                           reload: bool = False, print_output: bool = False) -> dict:
+    # Retrieve config details from config file
+    try:
+        config = _get_client(print_output=print_output).get_config()
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+        svm = config["svm"]
+        if svm_name:
+            svm = svm_name
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    if cluster_name:
+        config["hostname"] = cluster_name
+
+    if connectionType != "ONTAP":
+        raise ConnectionTypeError()
+
+    # Validate parameters
+    if map_format not in ("autofs", "systemd"):
+        if print_output:
+            print("Error: Invalid map format '" + str(map_format) + "'. Must be 'autofs' or 'systemd'.")
+        raise InvalidVolumeParameterError("map_format")
+    if mount_root:
+        mount_root = os.path.normpath(os.path.abspath(os.path.expanduser(mount_root)))
+    if not mount_root and (map_format == "systemd" or master_map_file):
+        if print_output:
+            print("Error: A mount root must be specified when generating systemd units or an autofs master map entry.")
+        raise InvalidVolumeParameterError("mount_root")
+    try:
+        timeout = int(timeout)
+        if timeout < 0:
+            raise ValueError()
+    except (TypeError, ValueError):
+        if print_output:
+            print("Error: Invalid timeout value. Value must be a non-negative integer.")
+        raise InvalidVolumeParameterError("timeout")
+    try:
+        lifSelection = _get_lif_selection(config, lifSelection=lif_selection, print_output=print_output)
+    except (InvalidConfigError, InvalidVolumeParameterError):
+        raise
+
+    # Translate the mount profile (if any) into mount options, after checking that the running kernel supports them
+    mountOptions = list()
+    if not mount_profile:
+        mount_profile = config.get("defaultMountProfile")
+    if mount_profile:
+        try:
+            mountOptions = _get_nfs_mount_options(mount_profile, config=config, print_output=print_output)
+        except (InvalidConfigError, MountOperationError):
+            raise
+    if readonly:
+        mountOptions.append("ro")
+
+    # Instantiate connection to ONTAP cluster
+    try:
+        _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+    except InvalidConfigError:
+        raise
+
+    # Retrieve the matching volumes with a single collection query; name and clone parent filters are applied by ONTAP
+    dataLifs, aggregateNodes = list(), dict()
+    try:
+        if lifSelection == "locality":
+            dataLifs, aggregateNodes = _get_svm_data_lifs(svm, print_output=print_output)
+        query = {"svm": svm, "fields": "nas.path,comment" + (",aggregates.name" if dataLifs else "")}
+        if name_pattern:
+            query["name"] = name_pattern
+        if clone_parent:
+            query["clone.parent_volume.name"] = clone_parent
+        if comment_tag:
+            query["comment"] = "*" + comment_tag + "*"
+        volumes = list(NetAppVolume.get_collection(**query))
+    except NetAppRestError as err:
+        if print_output:
+            print("Error: ONTAP Rest API Error: ", err)
+        raise APIConnectionError(err)
+
+    # Construct map entries; tags must match a whole word of the volume's comment. Volumes that are not exported are skipped.
+    mapEntries = dict()
+    for volume in volumes:
+        exportPath = getattr(getattr(volume, "nas", None), "path", None)
+        if exportPath in (None, "/"):
+            continue
+        if comment_tag and comment_tag not in re.split(r"[\s,;]+", getattr(volume, "comment", None) or ""):
+            continue
+        dataLifAddress, _ = _select_data_lif(dataLifs, aggregateNodes, volume)
+        mapEntries[volume.name] = _get_nfs_mount_target(config, svm, exportPath, dataLifAddress=dataLifAddress)
+
+    # Compare with the installed map, and only rewrite what has changed
+    added, removed, changed = list(), list(), list()
+    filesInstalled = False
+    if map_format == "autofs":
+        installedEntries = _read_autofs_map(map_path)
+        newEntries = dict()
+        for key, nfsMountTarget in sorted(mapEntries.items()):
+            newEntries[key] = key + "\t-fstype=nfs" + "".join("," + option for option in mountOptions) + "\t" + nfsMountTarget
+        added = sorted(set(newEntries) - set(installedEntries))
+        removed = sorted(set(installedEntries) - set(newEntries))
+        changed = sorted(key for key in set(newEntries) & set(installedEntries) if newEntries[key] != installedEntries[key])
+        if added or removed or changed or not os.path.exists(map_path):
+            try:
+                _install_file_atomically(map_path, _automountMapHeader + "\n" + "".join(newEntries[key] + "\n" for key in sorted(newEntries)))
+                filesInstalled = True
+            except OSError as err:
+                if print_output:
+                    print("Error: Error writing automount map: ", err)
+                raise MountOperationError(err)
+
+        if master_map_file:
+            masterMapEntry = mount_root + "\t" + os.path.abspath(map_path) + "\t--timeout=" + str(timeout) + "\n"
+            try:
+                with open(master_map_file) as masterMapFileObj:
+                    installedMasterMap = masterMapFileObj.read()
+            except FileNotFoundError:
+                installedMasterMap = None
+            try:
+                if installedMasterMap != _automountMapHeader + "\n" + masterMapEntry:
+                    _install_file_atomically(master_map_file, _automountMapHeader + "\n" + masterMapEntry)
+                    filesInstalled = True
+            except OSError as err:
+                if print_output:
+                    print("Error: Error writing automount master map: ", err)
+                raise MountOperationError(err)
+
+    else:
+        installedUnits = _read_systemd_automount_units(map_path, mount_root)
+        newUnits = dict()
+        for key, nfsMountTarget in sorted(mapEntries.items()):
+            mountpoint = os.path.join(mount_root, key)
+            unitName = _escape_systemd_path(mountpoint)
+            newUnits[key] = {
+                unitName + ".mount": _automountMapHeader + "\n[Unit]\nDescription=NetApp DataOps Toolkit volume " + svm + ":" + key +
+                                     "\nAfter=network-online.target\nWants=network-online.target\n\n[Mount]\nWhat=" + nfsMountTarget +
+                                     "\nWhere=" + mountpoint + "\nType=nfs\n" + ("Options=" + ",".join(mountOptions) + "\n" if mountOptions else ""),
+                unitName + ".automount": _automountMapHeader + "\n[Unit]\nDescription=Automount NetApp DataOps Toolkit volume " + svm + ":" + key +
+                                         "\n\n[Automount]\nWhere=" + mountpoint + "\nTimeoutIdleSec=" + str(timeout) +
+                                         "\n\n[Install]\nWantedBy=remote-fs.target\n"
+            }
+        added = sorted(set(newUnits) - set(installedUnits))
+        removed = sorted(set(installedUnits) - set(newUnits))
+        changed = sorted(key for key in set(newUnits) & set(installedUnits) if newUnits[key] != installedUnits[key])
+        try:
+            # Stop the automounts of removed volumes before their units are deleted
+            if reload and removed:
+                subprocess.check_call(['systemctl', 'disable', '--now'] + [unitFilename for key in removed for unitFilename in installedUnits[key]
+                                                                           if unitFilename.endswith(".automount")])
+            for key in removed:
+                for unitFilename in installedUnits[key]:
+                    os.remove(os.path.join(map_path, unitFilename))
+            for key in added + changed:
+                for unitFilename, content in newUnits[key].items():
+                    _install_file_atomically(os.path.join(map_path, unitFilename), content)
+        except (OSError, subprocess.CalledProcessError) as err:
+            if print_output:
+                print("Error: Error updating systemd automount units: ", err)
+            raise MountOperationError(err)
+
+    # Have automount or systemd pick up the changes
+    updated = bool(added or removed or changed or filesInstalled)
+    if reload and updated:
+        try:
+            if map_format == "autofs":
+                subprocess.check_call(['systemctl', 'reload', 'autofs'])
+            else:
+                subprocess.check_call(['systemctl', 'daemon-reload'])
+                automountUnits = [unitFilename for key in added + changed for unitFilename in newUnits[key] if unitFilename.endswith(".automount")]
+                if automountUnits:
+                    subprocess.check_call(['systemctl', 'enable', '--now'] + automountUnits)
+        except (OSError, subprocess.CalledProcessError) as err:
+            if print_output:
+                print("Error: Error reloading automount configuration: ", err)
+            raise MountOperationError(err)
+
+    automountMap = {"Map Path": map_path, "Format": map_format, "Mount Root": mount_root, "Entries": len(mapEntries),
+                    "Added": added, "Removed": removed, "Changed": changed, "Updated": updated}
+
+    if print_output:
+        if updated:
+            print("Automount map '" + map_path + "' updated: " + str(len(added)) + " added, " + str(len(removed)) + " removed, " +
+                  str(len(changed)) + " changed (" + str(len(mapEntries)) + " volume(s)).")
+        else:
+            print("Automount map '" + map_path + "' is up to date (" + str(len(mapEntries)) + " volume(s)).")
+
+    return automountMap
+
+
+def list_mount_profiles(print_output: bool = False) -> list():
+    # Retrieve config details from config file
+    try:
+        config = _get_client(print_output=print_output).get_config()
+    except InvalidConfigError:
+        raise
+
+    # Construct list of mount profiles, including the mount options that they translate to and whether the running kernel supports them
+    configProfiles = config.get("mountProfiles") or dict()
+    mountProfilesList = list()
+    for profileName, options in sorted(_get_nfs_mount_profiles(config).items()):
+        if not isinstance(options, dict):
+            options = dict()
+        errors = _validate_nfs_mount_options(options)
+        mountProfilesList.append({
+            "Profile Name": profileName,
+            "Source": "config file" if profileName in configProfiles else "built-in",
+            "Default": "yes" if profileName == config.get("defaultMountProfile") else "no",
+            "Mount Options": ",".join(option if value is True else option + "=" + str(value) for option, value in options.items()
+                                     if value is not False and value is not None),
+            "Supported": "no (" + "; ".join(errors) + ")" if errors else "yes"
+        })
+
+    # Print list of mount profiles
+    if print_output:
+        mountProfilesDF = pd.DataFrame.from_dict(mountProfilesList, dtype="string")
+        print(tabulate(mountProfilesDF, showindex=False, headers=mountProfilesDF.columns))
 
-    return relationshipsList
+    return mountProfilesList
 
 
 def list_snap_mirror_relationships(print_output: bool = False, cluster_name: str = None) -> list():
     # Retrieve config details from config file
     try:
-        config = _retrieve_config(print_output=print_output)
+        config = _get_client(print_output=print_output).get_config()
     except InvalidConfigError:
         raise
     try:
@@ -1340,10 +3520,11 @@ def list_snap_mirror_relationships(print_output: bool = False, cluster_name: str
         raise ConnectionTypeError()
 
 
-def list_snapshots(volume_name: str, cluster_name: str = None, svm_name: str = None, print_output: bool = False) -> list():
+def list_snapshots(volume_name: str, cluster_name: str = None, svm_name: str = None, name_pattern: str = None, order_by: str = None,
+                   include_size_details: bool = False, print_output: bool = False) -> list():
     # Retrieve config details from config file
     try:
-        config = _retrieve_config(print_output=print_output)
+        config = _get_client(print_output=print_output).get_config()
     except InvalidConfigError:
         raise
     try:
@@ -1376,20 +3557,40 @@ def list_snapshots(volume_name: str, cluster_name: str = None, svm_name: str = N
         # Retrieve snapshots
         try:
             # Retrieve volume
-            volume = NetAppVolume.find(name=volume_name, svm=svm)
+            volume = _find_volume(volume_name, svm)
             if not volume:
                 if print_output:
                     print("Error: Invalid volume name.")
                 raise InvalidVolumeParameterError("name")
 
+            # Retrieve all snapshots, including all required fields, in a single collection query
+            if include_size_details:
+                # Fall back to a field set without reclaimable space for ONTAP versions that do not support it
+                snapshotFieldSets = ["name,create_time,size,reclaimable_space", "name,create_time,size"]
+            else:
+                snapshotFieldSets = ["name,create_time"]
+            for snapshotFields in snapshotFieldSets:
+                try:
+                    snapshots = list(_get_snapshot_collection(volume.uuid, fields=snapshotFields, name_pattern=name_pattern, order_by=order_by))
+                    break
+                except NetAppRestError:
+                    if snapshotFields == snapshotFieldSets[-1]:
+                        raise
+
             # Construct list of snapshots
             snapshotsList = list()
-            for snapshot in NetAppSnapshot.get_collection(volume.uuid):
-                # Retrieve snapshot
-                snapshot.get()
-
+            for snapshot in snapshots:
                 # Construct dict of snapshot details
                 snapshotDict = {"Snapshot Name": snapshot.name, "Create Time": snapshot.create_time}
+                if include_size_details:
+                    try:
+                        snapshotDict["Size"] = _convert_bytes_to_pretty_size(size_in_bytes=snapshot.size)
+                    except:
+                        snapshotDict["Size"] = "Unknown"
+                    try:
+                        snapshotDict["Reclaimable Space"] = _convert_bytes_to_pretty_size(size_in_bytes=snapshot.reclaimable_space)
+                    except:
+                        snapshotDict["Reclaimable Space"] = "Unknown"
 
                 # Append dict to list of snapshots
                 snapshotsList.append(snapshotDict)
@@ -1411,10 +3612,11 @@ def list_snapshots(volume_name: str, cluster_name: str = None, svm_name: str = N
         raise ConnectionTypeError()
 
 
-def list_volumes(check_local_mounts: bool = False, include_space_usage_details: bool = False, print_output: bool = False, cluster_name: str = None, svm_name: str = None) -> list():
+def list_volumes(check_local_mounts: bool = False, include_space_usage_details: bool = False, print_output: bool = False, cluster_name: str = None, svm_name: str = None,
+                 page_size: int = 1000, lif_selection: str = None) -> list():
     # Retrieve config details from config file
     try:
-        config = _retrieve_config(print_output=print_output)
+        config = _get_client(print_output=print_output).get_config()
     except InvalidConfigError:
         raise
     try:
@@ -1425,6 +3627,10 @@ def list_volumes(check_local_mounts: bool = False, include_space_usage_details:
         raise InvalidConfigError()
     if cluster_name:
         config["hostname"] = cluster_name 
+    try:
+        lifSelection = _get_lif_selection(config, lifSelection=lif_selection, print_output=print_output)
+    except (InvalidConfigError, InvalidVolumeParameterError):
+        raise
 
     if connectionType == "ONTAP":
         # Instantiate connection to ONTAP cluster
@@ -1438,28 +3644,41 @@ def list_volumes(check_local_mounts: bool = False, include_space_usage_details:
             if svm_name:
                 svmname = svm_name 
 
-            # Retrieve all volumes for SVM
-            volumes = NetAppVolume.get_collection(svm=svmname)
+            # Retrieve the SVM's data LIFs once, to select the LIF that is local to each volume
+            dataLifs, aggregateNodes = list(), dict()
+            if lifSelection == "locality":
+                dataLifs, aggregateNodes = _get_svm_data_lifs(svmname, print_output=print_output)
+
+            # Retrieve all volumes for SVM, including all required fields, in a single paginated collection query
+            baseVolumeFields = "nas.path,size,style,clone,flexcache_endpoint_type"
+            if dataLifs:
+                baseVolumeFields += ",aggregates.name"
+            if include_space_usage_details :
+                # Fall back to a field set without constituents for ONTAP versions that do not support it
+                volumeFieldSets = [baseVolumeFields + ",space,constituents", baseVolumeFields + ",space"]
+            else :
+                volumeFieldSets = [baseVolumeFields]
+            for volumeFields in volumeFieldSets :
+                try :
+                    volumes = list(NetAppVolume.get_collection(svm=svmname, fields=volumeFields, max_records=page_size))
+                    break
+                except NetAppRestError :
+                    if volumeFields == volumeFieldSets[-1] :
+                        raise
 
-            # Retrieve local mounts if desired
+            # Retrieve local mounts if desired; volumes may be mounted through any of the SVM's data LIFs, so also index them by export path
             if check_local_mounts :
-                mounts = subprocess.check_output(['mount']).decode()
+                mountpointsBySource, _ = _get_local_mounts()
+                svmHosts = {config.get("dataLif"), svmname} | {address for address, _ in dataLifs} | {"[" + address + "]" for address, _ in dataLifs}
+                mountpointsByExportPath = dict()
+                for source, mountpoint in mountpointsBySource.items():
+                    host, separator, exportPath = source.partition(":/")
+                    if separator and host in svmHosts:
+                        mountpointsByExportPath.setdefault("/" + exportPath, mountpoint)
 
             # Construct list of volumes; do not include SVM root volume
             volumesList = list()
             for volume in volumes:
-                baseVolumeFields = "nas.path,size,style,clone,flexcache_endpoint_type"
-                try :
-                    volumeFields = baseVolumeFields
-                    if include_space_usage_details :
-                        volumeFields += ",space,constituents"
-                    volume.get(fields=volumeFields)
-                except NetAppRestError as err :
-                    volumeFields = baseVolumeFields
-                    if include_space_usage_details :
-                        volumeFields += ",space"
-                    volume.get(fields=volumeFields)
-
                 # Retrieve volume export path; handle case where volume is not exported
                 if hasattr(volume, "nas"):
                     volumeExportPath = volume.nas.path
@@ -1472,13 +3691,8 @@ def list_volumes(check_local_mounts: bool = False, include_space_usage_details:
                     type = volume.style
 
                     # Construct NFS mount target
-                    if not volumeExportPath :
-                        nfsMountTarget = None
-                    else :
-                        nfsMountTarget = config["dataLif"]+":"+volume.nas.path
-                        if svmname != config["svm"]:
-                            nfsMountTarget = svmname+":"+volume.nas.path
-
+                    dataLifAddress, _ = _select_data_lif(dataLifs, aggregateNodes, volume)
+                    nfsMountTarget = _get_nfs_mount_target(config, svmname, volumeExportPath, dataLifAddress=dataLifAddress)
 
                     # Construct clone source
                     clone = "no"
@@ -1537,12 +3751,7 @@ def list_volumes(check_local_mounts: bool = False, include_space_usage_details:
                     volumeDict["Type"] = volume.style
                     volumeDict["NFS Mount Target"] = nfsMountTarget
                     if check_local_mounts:
-                        localMountpoint = ""
-                        for mount in mounts.split("\n") :
-                            mountDetails = mount.split(" ")
-                            if mountDetails[0] == nfsMountTarget :
-                                localMountpoint = mountDetails[2]
-                        volumeDict["Local Mountpoint"] = localMountpoint
+                        volumeDict["Local Mountpoint"] = mountpointsBySource.get(nfsMountTarget) or mountpointsByExportPath.get(volumeExportPath, "")
                     volumeDict["FlexCache"] = flexcache
                     volumeDict["Clone"] = clone
                     volumeDict["Source SVM"] = cloneParentSvm
@@ -1569,12 +3778,13 @@ def list_volumes(check_local_mounts: bool = False, include_space_usage_details:
         raise ConnectionTypeError()
 
 
-def mount_volume(volume_name: str, mountpoint: str, cluster_name: str = None, svm_name: str = None, lif_name: str = None, readonly: bool = False, print_output: bool = False):
+def mount_volume(volume_name: str, mountpoint: str, cluster_name: str = None, svm_name: str = None, lif_name: str = None, readonly: bool = False,
+                 mount_profile: str = None, lif_selection: str = None, print_output: bool = False):
     nfsMountTarget = None
     
     svm = None
     try:
-        config = _retrieve_config(print_output=print_output)
+        config = _get_client(print_output=print_output).get_config()
     except InvalidConfigError:
         raise
     try:
@@ -1589,31 +3799,62 @@ def mount_volume(volume_name: str, mountpoint: str, cluster_name: str = None, sv
     if cluster_name:
         config["hostname"] = cluster_name 
 
-    # Retrieve list of volumes
     try:
-        volumes = list_volumes(check_local_mounts=True, svm_name = svm)
-    except (InvalidConfigError, APIConnectionError):
+        connectionType = config["connectionType"]
+    except:
         if print_output:
-            print("Error: Error retrieving NFS mount target for volume.")
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+    if connectionType != "ONTAP":
+        raise ConnectionTypeError()
+    try:
+        lifSelection = _get_lif_selection(config, lifSelection=lif_selection, print_output=print_output)
+    except (InvalidConfigError, InvalidVolumeParameterError):
         raise
 
-    # Retrieve NFS mount target for volume, and check that no volume is currently mounted at specified mountpoint
-    for volume in volumes:
-        # Check mountpoint
-        if mountpoint == volume["Local Mountpoint"]:
-            if print_output:
-                print("Error: Volume '" + volume["Volume Name"] + "' is already mounted at '" + mountpoint + "'.")
-            raise MountOperationError("Another volume mounted at mountpoint")
+    # Instantiate connection to ONTAP cluster
+    try:
+        _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+    except InvalidConfigError:
+        raise
 
-        if volume_name == volume["Volume Name"]:
-            # Retrieve NFS mount target
-            nfsMountTarget = volume["NFS Mount Target"]
+    # Retrieve the junction path of the volume only, rather than listing all volumes, and the SVM's data LIFs if the LIF that is local to
+    # the volume is to be selected
+    dataLifs, aggregateNodes = list(), dict()
+    try:
+        if lifSelection == "locality" and not lif_name:
+            dataLifs, aggregateNodes = _get_svm_data_lifs(svm, print_output=print_output)
+        volume = NetAppVolume.find(name=volume_name, svm=svm, fields="nas.path,aggregates.name" if dataLifs else "nas.path")
+    except NetAppRestError as err:
+        if print_output:
+            print("Error: Error retrieving NFS mount target for volume.")
+        raise APIConnectionError(err)
+    if volume and hasattr(volume, "nas") and getattr(volume.nas, "path", None) not in (None, "/"):
+        dataLifAddress, dataLifNode = _select_data_lif(dataLifs, aggregateNodes, volume)
+        if print_output and dataLifAddress:
+            print("Selected data LIF '" + dataLifAddress + "' on node '" + dataLifNode + "', which hosts the volume's data.")
+        elif print_output and dataLifs:
+            print("Warning: No data LIF found on the nodes that own volume '" + volume_name + "'; using data LIF from config file.")
+        nfsMountTarget = _get_nfs_mount_target(config, svm, volume.nas.path, dataLifAddress=dataLifAddress)
 
     # Raise error if invalid volume name was entered
     if not nfsMountTarget:
         if print_output:
             print("Error: Invalid volume name specified.")
         raise InvalidVolumeParameterError("name")
+
+    # Check that no volume is currently mounted at specified mountpoint
+    try:
+        _, sourcesByMountpoint = _get_local_mounts()
+    except (OSError, subprocess.CalledProcessError) as err:
+        if print_output:
+            print("Error: Error retrieving local mounts: ", err)
+        raise MountOperationError(err)
+    mountedSource = sourcesByMountpoint.get(os.path.abspath(os.path.expanduser(mountpoint)))
+    if mountedSource:
+        if print_output:
+            print("Error: '" + mountedSource + "' is already mounted at '" + mountpoint + "'.")
+        raise MountOperationError("Another volume mounted at mountpoint")
     
     try:
         if lif_name:
@@ -1623,39 +3864,245 @@ def mount_volume(volume_name: str, mountpoint: str, cluster_name: str = None, sv
             print("Error: Error retrieving NFS mount target for volume.")
         raise
 
+    # Translate the mount profile (if any) into mount options, after checking that the running kernel supports them
+    mountOptions = list()
+    if not mount_profile:
+        mount_profile = config.get("defaultMountProfile")
+    if mount_profile:
+        try:
+            mountOptions = _get_nfs_mount_options(mount_profile, config=config, print_output=print_output)
+        except (InvalidConfigError, MountOperationError):
+            raise
+    if readonly:
+        mountOptions.append("ro")
+
     # Print message describing action to be understaken
     if print_output:
+        message = "Mounting volume '" + svm+':'+volume_name + "' as '"+nfsMountTarget+"' at '" + mountpoint + "'"
+        if mount_profile:
+            message += " with mount profile '" + mount_profile + "'"
         if readonly:
-            print("Mounting volume '" + svm+':'+volume_name + "' as '"+nfsMountTarget+"' at '" + mountpoint + "' as read-only.")
-        else:
-            print("Mounting volume '" + svm+':'+volume_name + "' as '"+nfsMountTarget+"' at '" + mountpoint + "'.")
+            message += " as read-only"
+        print(message + ".")
 
-    # Create mountpoint if it doesn't already exist
+    # Mount volume, creating mountpoint if it doesn't already exist
     mountpoint = os.path.expanduser(mountpoint)
     try:
-        os.mkdir(mountpoint)
-    except FileExistsError:
-        pass
+        _mount_nfs_export(nfsMountTarget, mountpoint, mountOptions=mountOptions)
+        if print_output:
+            print("Volume mounted successfully.")
+    except subprocess.CalledProcessError as err:
+        if print_output:
+            print("Error: Error running mount command: ", err)
+        raise MountOperationError(err)
 
-    # Mount volume
-    if readonly:
-        try:
-            subprocess.check_call(['mount', '-o', 'ro', nfsMountTarget, mountpoint])
+
+def mount_volumes(mounts: list, cluster_name: str = None, svm_name: str = None, max_workers: int = 8, readonly: bool = False,
+                  mount_profile: str = None, lif_selection: str = None, rollback: bool = True, print_output: bool = False) -> list():
+    # Retrieve config details from config file
+    try:
+        config = _get_client(print_output=print_output).get_config()
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+        svm = config["svm"]
+        if svm_name:
+            svm = svm_name
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    if cluster_name:
+        config["hostname"] = cluster_name
+
+    if connectionType != "ONTAP":
+        raise ConnectionTypeError()
+
+    # Validate batch parameters
+    try:
+        max_workers = int(max_workers)
+        if max_workers < 1:
+            raise ValueError()
+    except (TypeError, ValueError):
+        if print_output:
+            print("Error: Invalid max_workers value. Value must be a positive integer.")
+        raise InvalidVolumeParameterError("max_workers")
+    try:
+        lifSelection = _get_lif_selection(config, lifSelection=lif_selection, print_output=print_output)
+    except (InvalidConfigError, InvalidVolumeParameterError):
+        raise
+
+    # Validate each mount request; the batch is only started if all of them are valid
+    supportedMountKeys = ("volume_name", "mountpoint", "svm_name", "lif_name", "readonly", "mount_profile")
+    mountRequests = list()
+    mountpointIndexes = dict()
+    for mount in mounts:
+        if not isinstance(mount, dict) or not mount.get("volume_name") or not mount.get("mountpoint"):
             if print_output:
-                print("Volume mounted successfully.")
-        except subprocess.CalledProcessError as err:
+                print("Error: Each mount must specify 'volume_name' and 'mountpoint'.")
+            raise InvalidVolumeParameterError("volume_name/mountpoint")
+        unsupportedKeys = set(mount) - set(supportedMountKeys)
+        if unsupportedKeys:
             if print_output:
-                print("Error: Error running mount command: ", err)
-            raise MountOperationError(err)
-    else:
-        try:
-            subprocess.check_call(['mount', nfsMountTarget, mountpoint])
+                print("Error: Unsupported mount parameter(s): " + ", ".join(sorted(unsupportedKeys)))
+            raise InvalidVolumeParameterError(", ".join(sorted(unsupportedKeys)))
+        mountRequest = dict(mount)
+        mountRequest["svm_name"] = mount.get("svm_name") or svm
+        mountRequest["mountpoint"] = os.path.abspath(os.path.expanduser(mount["mountpoint"]))
+        mountRequest["readonly"] = bool(mount.get("readonly", readonly))
+        mountRequest["mount_profile"] = mount.get("mount_profile") or mount_profile or config.get("defaultMountProfile")
+        if mountRequest["mountpoint"] in mountpointIndexes:
             if print_output:
-                print("Volume mounted successfully.")
-        except subprocess.CalledProcessError as err:
+                print("Error: Mountpoint '" + mountRequest["mountpoint"] + "' specified more than once.")
+            raise InvalidVolumeParameterError("mountpoint")
+        mountpointIndexes[mountRequest["mountpoint"]] = len(mountRequests)
+        mountRequests.append(mountRequest)
+
+    # Translate each mount profile into mount options once, after checking that the running kernel supports them
+    profileMountOptions = dict()
+    for mountRequest in mountRequests:
+        profileName = mountRequest["mount_profile"]
+        if profileName and profileName not in profileMountOptions:
+            try:
+                profileMountOptions[profileName] = _get_nfs_mount_options(profileName, config=config, print_output=print_output)
+            except (InvalidConfigError, MountOperationError):
+                raise
+
+    # Check that no volume is currently mounted at any of the specified mountpoints
+    try:
+        _, sourcesByMountpoint = _get_local_mounts()
+    except (OSError, subprocess.CalledProcessError) as err:
+        if print_output:
+            print("Error: Error retrieving local mounts: ", err)
+        raise MountOperationError(err)
+    for mountRequest in mountRequests:
+        mountedSource = sourcesByMountpoint.get(mountRequest["mountpoint"])
+        if mountedSource:
             if print_output:
-                print("Error: Error running mount command: ", err)
-            raise MountOperationError(err)
+                print("Error: '" + mountedSource + "' is already mounted at '" + mountRequest["mountpoint"] + "'.")
+            raise MountOperationError("Another volume mounted at mountpoint")
+
+    # Instantiate connection to ONTAP cluster
+    try:
+        _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+    except InvalidConfigError:
+        raise
+
+    # Resolve all NFS mount targets with one volume listing (and at most one data LIF lookup) per SVM
+    volumeNamesBySvm = collections.defaultdict(set)
+    for mountRequest in mountRequests:
+        volumeNamesBySvm[mountRequest["svm_name"]].add(mountRequest["volume_name"])
+    volumesBySvm = dict()
+    dataLifsBySvm = dict()
+    try:
+        for svmname, volumeNames in volumeNamesBySvm.items():
+            dataLifsBySvm[svmname] = (list(), dict())
+            if lifSelection == "locality":
+                dataLifsBySvm[svmname] = _get_svm_data_lifs(svmname, print_output=print_output)
+            volumeFields = "nas.path,aggregates.name" if dataLifsBySvm[svmname][0] else "nas.path"
+            volumesBySvm[svmname] = {volume.name: volume for volume in
+                                     NetAppVolume.get_collection(svm=svmname, name="|".join(sorted(volumeNames)), fields=volumeFields)}
+    except NetAppRestError as err:
+        if print_output:
+            print("Error: Error retrieving NFS mount targets for volumes: ", err)
+        raise APIConnectionError(err)
+
+    mountResults = list()
+    for mountRequest in mountRequests:
+        svmname = mountRequest["svm_name"]
+        volume = volumesBySvm[svmname].get(mountRequest["volume_name"])
+        if not volume or getattr(getattr(volume, "nas", None), "path", None) in (None, "/"):
+            if print_output:
+                print("Error: Invalid volume name specified: '" + svmname + ":" + mountRequest["volume_name"] + "'.")
+            raise InvalidVolumeParameterError("name")
+        if mountRequest.get("lif_name"):
+            nfsMountTarget = mountRequest["lif_name"] + ":" + volume.nas.path
+        else:
+            dataLifAddress, _ = _select_data_lif(dataLifsBySvm[svmname][0], dataLifsBySvm[svmname][1], volume)
+            nfsMountTarget = _get_nfs_mount_target(config, svmname, volume.nas.path, dataLifAddress=dataLifAddress)
+        mountRequest["mount_options"] = list(profileMountOptions.get(mountRequest["mount_profile"], list()))
+        if mountRequest["readonly"]:
+            mountRequest["mount_options"].append("ro")
+        mountResults.append({"Volume Name": mountRequest["volume_name"], "SVM": svmname, "NFS Mount Target": nfsMountTarget,
+                             "Mountpoint": mountRequest["mountpoint"], "Status": "pending", "Error": None, "Seconds": None})
+
+    def mount(index: int):
+        startTime = time.perf_counter()
+        try:
+            mountRequests[index]["mountpoint_created"] = _mount_nfs_export(mountResults[index]["NFS Mount Target"], mountResults[index]["Mountpoint"],
+                                                                           mountOptions=mountRequests[index]["mount_options"])
+        finally:
+            mountResults[index]["Seconds"] = round(time.perf_counter() - startTime, 2)
+
+    if print_output:
+        print("Mounting " + str(len(mountRequests)) + " volume(s) with up to " + str(max_workers) + " concurrent mounts.")
+
+    # Mount volumes concurrently; volumes whose mountpoints are nested inside other mountpoints are mounted after the enclosing ones.
+    # After a failure, no further mounts are started.
+    batchStartTime = time.perf_counter()
+    mountError = None
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for wave in _group_mountpoints_by_depth({index: mountResult["Mountpoint"] for index, mountResult in enumerate(mountResults)}):
+            if mountError:
+                break
+            mountFutures = {executor.submit(mount, index): index for index in wave}
+            for future in as_completed(mountFutures):
+                index = mountFutures[future]
+                try:
+                    future.result()
+                    mountResults[index]["Status"] = "mounted"
+                    if print_output:
+                        print("Volume '" + mountResults[index]["Volume Name"] + "' mounted at '" + mountResults[index]["Mountpoint"] + "' in " +
+                              "{:.2f}".format(mountResults[index]["Seconds"]) + " seconds.")
+                except (OSError, subprocess.CalledProcessError) as err:
+                    mountResults[index]["Status"] = "failed"
+                    mountResults[index]["Error"] = str(err)
+                    if print_output:
+                        print("Error: Error mounting volume '" + mountResults[index]["Volume Name"] + "': ", err)
+                    if not mountError:
+                        mountError = err
+                        for otherFuture in mountFutures:
+                            otherFuture.cancel()
+                except CancelledError:
+                    pass
+
+        # Roll back the mounts that succeeded, innermost first, so that the batch either mounts all volumes or none of them
+        if mountError and rollback:
+            mountedIndexes = {index: mountResult["Mountpoint"] for index, mountResult in enumerate(mountResults) if mountResult["Status"] == "mounted"}
+            if mountedIndexes and print_output:
+                print("Rolling back " + str(len(mountedIndexes)) + " successful mount(s).")
+            for wave in reversed(_group_mountpoints_by_depth(mountedIndexes)):
+                unmountFutures = {executor.submit(subprocess.check_call, ['umount', mountResults[index]["Mountpoint"]]): index for index in wave}
+                for future in as_completed(unmountFutures):
+                    index = unmountFutures[future]
+                    try:
+                        future.result()
+                        mountResults[index]["Status"] = "rolled back"
+                        if mountRequests[index].get("mountpoint_created"):
+                            os.rmdir(mountResults[index]["Mountpoint"])
+                    except (OSError, subprocess.CalledProcessError) as err:
+                        mountResults[index]["Error"] = "rollback failed: " + str(err)
+                        if print_output:
+                            print("Error: Error unmounting '" + mountResults[index]["Mountpoint"] + "' during rollback: ", err)
+
+    for mountResult in mountResults:
+        if mountResult["Status"] == "pending":
+            mountResult["Status"] = "not attempted"
+
+    # Print summary
+    if print_output:
+        succeeded = len([mountResult for mountResult in mountResults if mountResult["Status"] == "mounted"])
+        print("Mounted " + str(succeeded) + " of " + str(len(mountResults)) + " volume(s) in " +
+              "{:.2f}".format(time.perf_counter() - batchStartTime) + " seconds.")
+        mountResultsDF = pd.DataFrame.from_dict(mountResults, dtype="string").fillna("")
+        print(tabulate(mountResultsDF, showindex=False, headers=mountResultsDF.columns))
+
+    if mountError:
+        raise MountOperationError(mountError, mountResults)
+
+    return mountResults
 
 
 
@@ -1676,10 +4123,65 @@ def unmount_volume(mountpoint: str, print_output: bool = False):
         raise MountOperationError(err)
 
 
+def unmount_volumes(mountpoints: list, max_workers: int = 8, print_output: bool = False) -> list():
+    # Validate batch parameters
+    try:
+        max_workers = int(max_workers)
+        if max_workers < 1:
+            raise ValueError()
+    except (TypeError, ValueError):
+        if print_output:
+            print("Error: Invalid max_workers value. Value must be a positive integer.")
+        raise InvalidVolumeParameterError("max_workers")
+
+    unmountResults = [{"Mountpoint": mountpoint, "Status": "pending", "Error": None, "Seconds": None} for mountpoint in mountpoints]
+
+    def unmount(index: int):
+        startTime = time.perf_counter()
+        try:
+            subprocess.check_call(['umount', os.path.expanduser(unmountResults[index]["Mountpoint"])])
+        finally:
+            unmountResults[index]["Seconds"] = round(time.perf_counter() - startTime, 2)
+
+    if print_output:
+        print("Unmounting " + str(len(unmountResults)) + " volume(s) with up to " + str(max_workers) + " concurrent unmounts.")
+
+    # Unmount volumes concurrently, innermost mountpoints first; a failed unmount does not abort the batch
+    batchStartTime = time.perf_counter()
+    mountpointsByIndex = {index: os.path.abspath(os.path.expanduser(mountpoint)) for index, mountpoint in enumerate(mountpoints)}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for wave in reversed(_group_mountpoints_by_depth(mountpointsByIndex)):
+            unmountFutures = {executor.submit(unmount, index): index for index in wave}
+            for future in as_completed(unmountFutures):
+                index = unmountFutures[future]
+                try:
+                    future.result()
+                    unmountResults[index]["Status"] = "unmounted"
+                except (OSError, subprocess.CalledProcessError) as err:
+                    unmountResults[index]["Status"] = "failed"
+                    unmountResults[index]["Error"] = str(err)
+                    if print_output:
+                        print("Error: Error unmounting '" + unmountResults[index]["Mountpoint"] + "': ", err)
+
+    # Print summary
+    if print_output:
+        succeeded = len([unmountResult for unmountResult in unmountResults if unmountResult["Status"] == "unmounted"])
+        print("Unmounted " + str(succeeded) + " of " + str(len(unmountResults)) + " volume(s) in " +
+              "{:.2f}".format(time.perf_counter() - batchStartTime) + " seconds.")
+        unmountResultsDF = pd.DataFrame.from_dict(unmountResults, dtype="string").fillna("")
+        print(tabulate(unmountResultsDF, showindex=False, headers=unmountResultsDF.columns))
+
+    failedResults = [unmountResult for unmountResult in unmountResults if unmountResult["Status"] == "failed"]
+    if failedResults:
+        raise MountOperationError(failedResults[0]["Error"], unmountResults)
+
+    return unmountResults
+
+
 def prepopulate_flex_cache(volume_name: str, paths: list, print_output: bool = False):
     # Retrieve config details from config file
     try:
-        config = _retrieve_config(print_output=print_output)
+        config = _get_client(print_output=print_output).get_config()
     except InvalidConfigError:
         raise
     try:
@@ -1731,43 +4233,271 @@ def prepopulate_flex_cache(volume_name: str, paths: list, print_output: bool = F
         raise ConnectionTypeError()
 
 
-def pull_bucket_from_s3(s3_bucket: str, local_directory: str, s3_object_key_prefix: str = "", print_output: bool = False):
+def prune_snapshots(volume_names: list, snapshot_name: str, retention_count: int, retention_days: bool = False, cluster_name: str = None,
+                    svm_name: str = None, max_workers: int = 8, print_output: bool = False) -> list():
+    # Retrieve config details from config file
+    try:
+        config = _get_client(print_output=print_output).get_config()
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    if cluster_name:
+        config["hostname"] = cluster_name
+
+    if connectionType == "ONTAP":
+        # Instantiate connection to ONTAP cluster
+        try:
+            _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+        except InvalidConfigError:
+            raise
+
+        # Retrieve svm from config file
+        try:
+            svm = config["svm"]
+            if svm_name:
+                svm = svm_name
+        except:
+            if print_output:
+                _print_invalid_config_error()
+            raise InvalidConfigError()
+
+        # Check retention count for validity
+        try:
+            retention_count = int(retention_count)
+            if retention_count < 1:
+                raise ValueError()
+        except ValueError:
+            if print_output:
+                print("Error: Invalid retention specified. Value must be a positive integer.")
+            raise InvalidSnapshotParameterError("retention")
+
+        try:
+            # Retrieve all volumes before deleting anything
+            volumes = list()
+            for volume_name in volume_names:
+                volume = _find_volume(volume_name, svm)
+                if not volume:
+                    if print_output:
+                        print("Error: Invalid volume name: " + volume_name)
+                    raise InvalidVolumeParameterError("name")
+                volumes.append(volume)
+
+            # Apply retention to each volume
+            pruneSummaryList = list()
+            for volume in volumes:
+                pruneSummary = _apply_snapshot_retention(volume=volume, snapshot_name_prefix=snapshot_name, retention_count=retention_count,
+                                                         retention_days=retention_days, max_workers=max_workers, print_output=print_output)
+                pruneSummaryList.append(pruneSummary)
+
+        except NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+
+        # Print summary
+        if print_output:
+            summaryTable = [{"Volume Name": pruneSummary["Volume Name"], "Kept": pruneSummary["Kept"], "Deleted": len(pruneSummary["Deleted"]),
+                             "Skipped (Owned)": len(pruneSummary["Skipped (Owned)"]), "Failed": len(pruneSummary["Failed"])}
+                            for pruneSummary in pruneSummaryList]
+            summaryDF = pd.DataFrame.from_dict(summaryTable, dtype="string")
+            print(tabulate(summaryDF, showindex=False, headers=summaryDF.columns))
+
+        return pruneSummaryList
+
+    else:
+        raise ConnectionTypeError()
+
+
+def pull_bucket_from_s3(s3_bucket: str, local_directory: str, s3_object_key_prefix: str = "", max_workers: int = None,
+                        queue_depth: int = 1000, partition_prefixes: list = None, discover_partitions: bool = False, list_workers: int = 8,
+                        sync: bool = False, delete: bool = False, compare_checksums: bool = False, multipart_chunksize: int = None,
+                        max_concurrency: int = None, multipart_threshold: int = None, unpack_shards: bool = False, resume: bool = False,
+                        report_file: str = None, state_directory: str = None, print_output: bool = False) -> dict:
+    startTime = time.time()
+
     # Retrieve S3 access details from existing config file
     try:
         s3Endpoint, s3AccessKeyId, s3SecretAccessKey, s3VerifySSLCert, s3CACertBundle = _retrieve_s3_access_details(print_output=print_output)
+        transferConfig = _retrieve_s3_transfer_config(multipart_chunksize=multipart_chunksize, max_concurrency=max_concurrency,
+                                                      multipart_threshold=multipart_threshold, print_output=print_output)
     except InvalidConfigError:
         raise
 
+    if not max_workers:
+        max_workers = _s3_default_max_workers()
+    if max_workers < 1 or queue_depth < 1 or list_workers < 1:
+        if print_output:
+            print("Error: max_workers, queue_depth and list_workers must be positive integers.")
+        raise InvalidConfigError()
+    if delete and not sync:
+        if print_output:
+            print("Error: delete can only be specified in sync mode.")
+        raise InvalidConfigError()
+    if unpack_shards and sync:
+        if print_output:
+            print("Error: Shards cannot be unpacked in sync mode.")
+        raise InvalidConfigError()
+
     # Add slash to end of local directory path if not present
     if not local_directory.endswith(os.sep):
         local_directory += os.sep
+    os.makedirs(local_directory, exist_ok=True)
+
+    # In a resumable run, every object that is downloaded is recorded in the journal, so that the run can be resumed if it is interrupted
+    report = _new_s3_transfer_report("pull", s3Bucket=s3_bucket, s3ObjectKeyPrefix=s3_object_key_prefix, localDirectory=local_directory)
+    reportLock = threading.Lock()
+    journalScope = "pull|" + str(s3Endpoint) + "|" + s3_bucket + "|" + s3_object_key_prefix
+    journalPath = _get_s3_state_path(_s3TransferJournalNameFormat, journalScope, local_directory, stateDirectory=state_directory)
+    try:
+        journal = _S3TransferJournal(journalPath, journalScope, resume=resume, print_output=print_output)
+    except InvalidConfigError:
+        raise
+
+    # In sync mode, only new and changed objects are downloaded
+    manifest = None
+    listedKeys = set()
+    if sync:
+        manifestScope = "pull|" + str(s3Endpoint) + "|" + s3_bucket + "|" + s3_object_key_prefix
+        manifestPath = _get_s3_state_path(_s3SyncManifestNameFormat, manifestScope, local_directory, stateDirectory=state_directory)
+        manifest = _S3SyncManifest(manifestPath, manifestScope, print_output=print_output)
+
+    try:
+        # Instantiate S3 client; all workers share a single client
+        s3Client = _instantiate_s3_client(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, max_workers=max_workers, transferConfig=transferConfig, print_output=print_output)
+
+        # List the objects with prefix in bucket page by page (optionally partitioned); objects are handed to the download workers as they are listed
+        s3Objects = _list_s3_objects(s3Client, s3Bucket=s3_bucket, s3ObjectKeyPrefix=s3_object_key_prefix, partition_prefixes=partition_prefixes,
+                                     discover_partitions=discover_partitions, list_workers=list_workers, queue_depth=queue_depth,
+                                     print_output=print_output)
+        if delete:
+            def record_listed_keys(s3Objects):
+                for obj in s3Objects:
+                    listedKeys.add(obj["Key"])
+                    yield obj
+            s3Objects = record_listed_keys(s3Objects)
+
+        def download_object(obj: dict):
+            s3ObjectKey = obj["Key"]
+            localFile = local_directory + s3ObjectKey
+
+            # In packing mode, only the shards are downloaded (not their indexes or any other objects)
+            if unpack_shards and not _s3ShardNameRegex.search(s3ObjectKey):
+                return
+
+            # When resuming, objects that were downloaded by the previous run and have not changed since are skipped
+            journalEntry = journal.completed(s3ObjectKey)
+            if journalEntry and journalEntry["etag"] == obj["ETag"] and journalEntry["size"] == obj["Size"]:
+                try:
+                    if unpack_shards or os.path.getsize(localFile) == obj["Size"]:
+                        with reportLock:
+                            report["Skipped"] += 1
+                        return
+                except OSError:
+                    pass
+
+            try:
+                if sync:
+                    try:
+                        localStat = os.stat(localFile)
+                    except FileNotFoundError:
+                        localStat = None
+
+                    # Files that have not changed since they were last synced are skipped without hashing them
+                    manifestEntry = manifest.get(s3ObjectKey)
+                    if localStat and manifestEntry and manifestEntry["etag"] == obj["ETag"] and manifestEntry["size"] == localStat.st_size and manifestEntry["mtime"] == localStat.st_mtime_ns:
+                        unchanged, md5 = True, manifestEntry["md5"]
+                    else:
+                        unchanged, md5 = _s3_object_unchanged(localFile, localStat, obj, localIsSource=False, compare_checksums=compare_checksums)
+                    if unchanged:
+                        manifest.set(s3ObjectKey, localStat, etag=obj["ETag"], md5=md5)
+                        journal.record_done(s3ObjectKey, size=obj["Size"], etag=obj["ETag"])
+                        with reportLock:
+                            report["Skipped"] += 1
+                        return
+
+                if unpack_shards:
+                    _unpack_s3_shard(s3Client, s3Bucket=s3_bucket, s3ObjectKey=s3ObjectKey, localDirectory=local_directory, print_output=print_output)
+                else:
+                    _download_from_s3(s3Client=s3Client, s3Bucket=s3_bucket, s3ObjectKey=s3ObjectKey, localFile=localFile, transferConfig=transferConfig,
+                                      objectSize=obj["Size"], etag=obj["ETag"], print_output=print_output)
+
+                if sync:
+                    # Apply the object's modification time to the local copy, so that later runs can compare them
+                    lastModified = obj["LastModified"].timestamp()
+                    os.utime(localFile, (lastModified, lastModified))
+                    manifest.set(s3ObjectKey, os.stat(localFile), etag=obj["ETag"])
+            except Exception as err:
+                journal.record_failed(s3ObjectKey, err)
+                with reportLock:
+                    # The journal holds every failure; the report is kept to a manageable size
+                    if len(report["Failures"]) < 1000:
+                        report["Failures"].append({"Key": s3ObjectKey, "Error": str(err)})
+                raise
+
+            journal.record_done(s3ObjectKey, size=obj["Size"], etag=obj["ETag"])
+            with reportLock:
+                report["Succeeded"] += 1
+                report["Bytes Transferred"] += obj["Size"]
 
-    # Multithread the download operation
-    with ThreadPoolExecutor() as executor:
+        # Download objects concurrently
         try:
-            # Instantiate S3 session
-            s3 = _instantiate_s3_session(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, print_output=print_output)
+            numProcessed, numFailed, firstError = _run_bounded_pipeline(s3Objects, download_object, max_workers=max_workers, queue_depth=queue_depth)
+        finally:
+            if manifest:
+                manifest.save()
+            journal.close()
+
+    except Exception as err:
+        if print_output:
+            print("Error: S3 API error: ", err)
+        _finish_s3_transfer_report(report, startTime, reportFile=report_file, print_output=print_output)
+        raise APIConnectionError(err, report)
 
-            # Loop through all objects with prefix in bucket and download
-            bucket = s3.Bucket(s3_bucket)
-            for obj in bucket.objects.filter(Prefix=s3_object_key_prefix):
-                executor.submit(_download_from_s3, s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, s3Bucket=s3_bucket, s3ObjectKey=obj.key, localFile=local_directory+obj.key, print_output=print_output)
+    report["Failed"] = numFailed
+    if numFailed:
+        if print_output:
+            print("Error: " + str(numFailed) + " of " + str(numProcessed) + " object(s) could not be downloaded.")
+        _finish_s3_transfer_report(report, startTime, reportFile=report_file, print_output=print_output)
+        raise APIConnectionError(firstError, report)
 
-        except APIConnectionError:
-            raise
+    # Delete local files that no longer exist in the bucket
+    if delete:
+        for dirpath, dirnames, filenames in os.walk(local_directory):
+            for filename in filenames:
+                localFile = os.path.join(dirpath, filename)
+                s3ObjectKey = localFile[len(local_directory):]
+                if localFile in (manifestPath, manifestPath + ".tmp", journalPath) or not s3ObjectKey.startswith(s3_object_key_prefix) or s3ObjectKey in listedKeys:
+                    continue
+                if print_output:
+                    print("Deleting local file '" + localFile + "', which does not exist in bucket '" + s3_bucket + "'.")
+                os.remove(localFile)
+                manifest.remove(s3ObjectKey)
+                report["Deleted"] += 1
+        manifest.save()
 
-        except Exception as err:
-            if print_output:
-                print("Error: S3 API error: ", err)
-            raise APIConnectionError(err)
+    if sync and print_output:
+        print("Sync complete: " + str(report["Succeeded"]) + " object(s) downloaded, " + str(report["Skipped"]) +
+              " unchanged, " + str(report["Deleted"]) + " local file(s) deleted.")
 
+    _finish_s3_transfer_report(report, startTime, reportFile=report_file, print_output=print_output)
     print("Download complete.")
 
+    return report
 
-def pull_object_from_s3(s3_bucket: str, s3_object_key: str, local_file: str = None, print_output: bool = False):
+
+def pull_object_from_s3(s3_bucket: str, s3_object_key: str, local_file: str = None, multipart_chunksize: int = None, max_concurrency: int = None,
+                        multipart_threshold: int = None, print_output: bool = False):
     # Retrieve S3 access details from existing config file
     try:
         s3Endpoint, s3AccessKeyId, s3SecretAccessKey, s3VerifySSLCert, s3CACertBundle = _retrieve_s3_access_details(print_output=print_output)
+        transferConfig = _retrieve_s3_transfer_config(multipart_chunksize=multipart_chunksize, max_concurrency=max_concurrency,
+                                                      multipart_threshold=multipart_threshold, print_output=print_output)
     except InvalidConfigError:
         raise
 
@@ -1775,25 +4505,118 @@ def pull_object_from_s3(s3_bucket: str, s3_object_key: str, local_file: str = No
     if not local_file:
         local_file = s3_object_key
 
-    # Upload file
+    # Instantiate S3 client
+    try:
+        s3Client = _instantiate_s3_client(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, transferConfig=transferConfig, print_output=print_output)
+    except Exception as err:
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+
+    # Retrieve size of object, which determines whether or not it is downloaded in parts
+    try:
+        remoteObject = _head_s3_object(s3Client, s3Bucket=s3_bucket, s3ObjectKey=s3_object_key)
+    except Exception as err:
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+    if not remoteObject:
+        if print_output:
+            print("Error: Object '" + s3_object_key + "' does not exist in bucket '" + s3_bucket + "'.")
+        raise APIConnectionError("Object '" + s3_object_key + "' does not exist in bucket '" + s3_bucket + "'.")
+
+    # Download file
     try:
-        _download_from_s3(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, s3Bucket=s3_bucket, s3ObjectKey=s3_object_key, localFile=local_file, print_output=print_output)
+        _download_from_s3(s3Client=s3Client, s3Bucket=s3_bucket, s3ObjectKey=s3_object_key, localFile=local_file, transferConfig=transferConfig,
+                          objectSize=remoteObject["Size"], etag=remoteObject["ETag"], print_output=print_output)
     except APIConnectionError:
         raise
 
     print("Download complete.")
 
 
-def push_directory_to_s3(s3_bucket: str, local_directory: str, s3_object_key_prefix: str = "",
-                         s3_extra_args: str = None, print_output: bool = False):
-    # Retrieve S3 access details from existing config file
+def push_directory_to_s3(s3_bucket: str, local_directory: str, s3_object_key_prefix: str = "",
+                         s3_extra_args: str = None, max_workers: int = None, queue_depth: int = 1000, sync: bool = False,
+                         delete: bool = False, compare_checksums: bool = False, multipart_chunksize: int = None, max_concurrency: int = None,
+                         multipart_threshold: int = None, shard_size=None, staging_directory: str = None, resume: bool = False,
+                         report_file: str = None, state_directory: str = None, print_output: bool = False) -> dict:
+    startTime = time.time()
+
+    # Retrieve S3 access details from existing config file
+    try:
+        s3Endpoint, s3AccessKeyId, s3SecretAccessKey, s3VerifySSLCert, s3CACertBundle = _retrieve_s3_access_details(print_output=print_output)
+        transferConfig = _retrieve_s3_transfer_config(multipart_chunksize=multipart_chunksize, max_concurrency=max_concurrency,
+                                                      multipart_threshold=multipart_threshold, print_output=print_output)
+    except InvalidConfigError:
+        raise
+
+    # In packing mode, files are packed into tar shards of the given size, fewer of which are uploaded concurrently by default
+    shardSize = None
+    if shard_size:
+        try:
+            shardSize = _convert_pretty_size_to_bytes(shard_size)
+            if shardSize < 1:
+                raise ValueError()
+        except (ValueError, TypeError):
+            if print_output:
+                print("Error: Invalid shard size: " + str(shard_size))
+            raise InvalidConfigError()
+        if sync:
+            if print_output:
+                print("Error: Files cannot be packed into shards in sync mode.")
+            raise InvalidConfigError()
+
+    if not max_workers:
+        max_workers = 4 if shardSize else _s3_default_max_workers()
+    if max_workers < 1 or queue_depth < 1:
+        if print_output:
+            print("Error: max_workers and queue_depth must be positive integers.")
+        raise InvalidConfigError()
+    if delete and not sync:
+        if print_output:
+            print("Error: delete can only be specified in sync mode.")
+        raise InvalidConfigError()
+
+    # Instantiate S3 client
+    try:
+        s3Client = _instantiate_s3_client(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, max_workers=max_workers, transferConfig=transferConfig, print_output=print_output)
+    except Exception as err:
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+
+    # In a resumable run, every file that is uploaded, and the upload ID of every multipart upload that is started, is recorded in the
+    # journal, so that the run can be resumed if it is interrupted. Multipart uploads that were left behind by a previous resumable run
+    # are aborted unless it is resumed.
+    report = _new_s3_transfer_report("push", s3Bucket=s3_bucket, s3ObjectKeyPrefix=s3_object_key_prefix, localDirectory=local_directory)
+    reportLock = threading.Lock()
+    journalScope = "push|" + str(s3Endpoint) + "|" + s3_bucket + "|" + s3_object_key_prefix
+    journalPath = _get_s3_state_path(_s3TransferJournalNameFormat, journalScope, local_directory, stateDirectory=state_directory)
     try:
-        s3Endpoint, s3AccessKeyId, s3SecretAccessKey, s3VerifySSLCert, s3CACertBundle = _retrieve_s3_access_details(print_output=print_output)
+        journal = _S3TransferJournal(journalPath, journalScope, resume=resume, s3Client=s3Client, s3Bucket=s3_bucket, print_output=print_output)
     except InvalidConfigError:
         raise
 
-    # Multithread the upload operation
-    with ThreadPoolExecutor() as executor:
+    # In sync mode, only new and changed files are uploaded. Files that have not changed since they were last synced are skipped
+    # without calling the S3 API. Other files are compared to the objects in a single listing of the prefix if there is no manifest
+    # yet (i.e. on the first sync) or if extraneous objects are to be deleted, and to the object retrieved with a HEAD request otherwise.
+    manifest = None
+    remoteObjects = None
+    localKeys = set()
+    if sync:
+        manifestScope = "push|" + str(s3Endpoint) + "|" + s3_bucket + "|" + s3_object_key_prefix
+        manifestPath = _get_s3_state_path(_s3SyncManifestNameFormat, manifestScope, local_directory, stateDirectory=state_directory)
+        manifest = _S3SyncManifest(manifestPath, manifestScope, print_output=print_output)
+        if delete or not len(manifest):
+            try:
+                remoteObjects = {obj["Key"]: obj for obj in _list_s3_objects(s3Client, s3Bucket=s3_bucket, s3ObjectKeyPrefix=s3_object_key_prefix)}
+            except Exception as err:
+                journal.close()
+                if print_output:
+                    print("Error: S3 API error: ", err)
+                raise APIConnectionError(err)
+
+    def list_local_files():
         # Loop through all files in directory
         for dirpath, dirnames, filenames in os.walk(local_directory):
             # Exclude hidden files and directories
@@ -1817,20 +4640,131 @@ def push_directory_to_s3(s3_bucket: str, local_directory: str, s3_object_key_pre
                 # Set S3 object details
                 s3ObjectKey = s3_object_key_prefix + filepath
                 localFile = dirpath + os.sep + filename
+                localStat = os.stat(localFile)
+                if delete:
+                    localKeys.add(s3ObjectKey)
+
+                # Files that were uploaded by the previous run (when resuming) or that have not changed since they were last synced are skipped
+                journalEntry = journal.completed(s3ObjectKey)
+                manifestEntry = manifest.get(s3ObjectKey) if sync else None
+                if any(entry and entry["size"] == localStat.st_size and entry["mtime"] == localStat.st_mtime_ns for entry in (journalEntry, manifestEntry)):
+                    with reportLock:
+                        report["Skipped"] += 1
+                    continue
+
+                yield localFile, s3ObjectKey, localStat
+
+    def upload_file(item: tuple):
+        localFile, s3ObjectKey, localStat = item
+        md5 = None
+        try:
+            if sync:
+                if remoteObjects is not None:
+                    remoteObject = remoteObjects.get(s3ObjectKey)
+                else:
+                    remoteObject = _head_s3_object(s3Client, s3Bucket=s3_bucket, s3ObjectKey=s3ObjectKey)
+                unchanged, md5 = _s3_object_unchanged(localFile, localStat, remoteObject, localIsSource=True, compare_checksums=compare_checksums)
+                if unchanged:
+                    manifest.set(s3ObjectKey, localStat, etag=remoteObject["ETag"], md5=md5)
+                    journal.record_done(s3ObjectKey, size=localStat.st_size, mtime=localStat.st_mtime_ns, etag=remoteObject["ETag"])
+                    with reportLock:
+                        report["Skipped"] += 1
+                    return
 
-                # Upload file
-                try:
-                    executor.submit(_upload_to_s3, s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, s3Bucket=s3_bucket, localFile=localFile, s3ObjectKey=s3ObjectKey, s3ExtraArgs=s3_extra_args, print_output=print_output)
-                except APIConnectionError:
-                    raise
+            # Large files are uploaded in parts that are tracked in the journal, so that an interrupted upload can be continued
+            if localStat.st_size >= transferConfig.multipart_threshold:
+                bytesUploaded = _upload_to_s3_multipart(s3Client=s3Client, s3Bucket=s3_bucket, localFile=localFile, s3ObjectKey=s3ObjectKey,
+                                                        localStat=localStat, s3ExtraArgs=s3_extra_args, transferConfig=transferConfig,
+                                                        journal=journal, print_output=print_output)
+            else:
+                _upload_to_s3(s3Client=s3Client, s3Bucket=s3_bucket, localFile=localFile, s3ObjectKey=s3ObjectKey, s3ExtraArgs=s3_extra_args,
+                              transferConfig=transferConfig, print_output=print_output)
+                bytesUploaded = localStat.st_size
+
+            if sync:
+                manifest.set(s3ObjectKey, localStat, md5=md5)
+        except Exception as err:
+            journal.record_failed(s3ObjectKey, err)
+            with reportLock:
+                # The journal holds every failure; the report is kept to a manageable size
+                if len(report["Failures"]) < 1000:
+                    report["Failures"].append({"Key": s3ObjectKey, "Error": str(err)})
+            raise
+
+        journal.record_done(s3ObjectKey, size=localStat.st_size, mtime=localStat.st_mtime_ns)
+        with reportLock:
+            report["Succeeded"] += 1
+            report["Bytes Transferred"] += bytesUploaded
+
+    # Upload files (or shards) concurrently; all workers share a single S3 client
+    try:
+        if shardSize:
+            numProcessed, numFailed, firstError = _push_directory_to_s3_as_shards(s3Client, s3Bucket=s3_bucket, localDirectory=local_directory,
+                                                                                  s3ObjectKeyPrefix=s3_object_key_prefix, shardSize=shardSize,
+                                                                                  s3ExtraArgs=s3_extra_args, transferConfig=transferConfig,
+                                                                                  journal=journal, report=report, reportLock=reportLock,
+                                                                                  max_workers=max_workers, stagingDirectory=staging_directory,
+                                                                                  print_output=print_output)
+        else:
+            numProcessed, numFailed, firstError = _run_bounded_pipeline(list_local_files(), upload_file, max_workers=max_workers, queue_depth=queue_depth)
+    except Exception as err:
+        # E.g. a file could not be read while the directory was being walked or a shard was being built
+        if print_output:
+            print("Error: ", err)
+        _finish_s3_transfer_report(report, startTime, reportFile=report_file, print_output=print_output)
+        raise APIConnectionError(err, report)
+    finally:
+        if manifest:
+            manifest.save()
+        journal.close()
+
+    report["Failed"] = numFailed
+    if numFailed:
+        if print_output:
+            print("Error: " + str(numFailed) + " of " + str(numProcessed) + " file(s) could not be uploaded.")
+        _finish_s3_transfer_report(report, startTime, reportFile=report_file, print_output=print_output)
+        raise APIConnectionError(firstError, report)
+
+    # Delete objects that no longer exist in the local directory, up to 1000 per request
+    if delete:
+        extraneousKeys = sorted(set(remoteObjects) - localKeys)
+        try:
+            for i in range(0, len(extraneousKeys), 1000):
+                batch = extraneousKeys[i:i+1000]
+                if print_output:
+                    for s3ObjectKey in batch:
+                        print("Deleting object '" + s3ObjectKey + "' from bucket '" + s3_bucket + "', which does not exist in local directory.")
+                response = s3Client.delete_objects(Bucket=s3_bucket, Delete={"Objects": [{"Key": s3ObjectKey} for s3ObjectKey in batch], "Quiet": True})
+                if response.get("Errors"):
+                    raise APIConnectionError(response["Errors"])
+                for s3ObjectKey in batch:
+                    manifest.remove(s3ObjectKey)
+                report["Deleted"] += len(batch)
+        except Exception as err:
+            if print_output:
+                print("Error: S3 API error: ", err)
+            _finish_s3_transfer_report(report, startTime, reportFile=report_file, print_output=print_output)
+            raise APIConnectionError(err, report)
+        finally:
+            manifest.save()
+
+    if sync and print_output:
+        print("Sync complete: " + str(report["Succeeded"]) + " file(s) uploaded, " + str(report["Skipped"]) +
+              " unchanged, " + str(report["Deleted"]) + " object(s) deleted.")
 
+    _finish_s3_transfer_report(report, startTime, reportFile=report_file, print_output=print_output)
     print("Upload complete.")
 
+    return report
 
-def push_file_to_s3(s3_bucket: str, local_file: str, s3_object_key: str = None, s3_extra_args: str = None, print_output: bool = False):
+
+def push_file_to_s3(s3_bucket: str, local_file: str, s3_object_key: str = None, s3_extra_args: str = None, multipart_chunksize: int = None,
+                    max_concurrency: int = None, multipart_threshold: int = None, print_output: bool = False):
     # Retrieve S3 access details from existing config file
     try:
         s3Endpoint, s3AccessKeyId, s3SecretAccessKey, s3VerifySSLCert, s3CACertBundle = _retrieve_s3_access_details(print_output=print_output)
+        transferConfig = _retrieve_s3_transfer_config(multipart_chunksize=multipart_chunksize, max_concurrency=max_concurrency,
+                                                      multipart_threshold=multipart_threshold, print_output=print_output)
     except InvalidConfigError:
         raise
 
@@ -1838,19 +4772,28 @@ def push_file_to_s3(s3_bucket: str, local_file: str, s3_object_key: str = None,
     if not s3_object_key:
         s3_object_key = local_file
 
+    # Instantiate S3 client
+    try:
+        s3Client = _instantiate_s3_client(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, transferConfig=transferConfig, print_output=print_output)
+    except Exception as err:
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+
     # Upload file
     try:
-        _upload_to_s3(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, s3Bucket=s3_bucket, localFile=local_file, s3ObjectKey=s3_object_key, s3ExtraArgs=s3_extra_args, print_output=print_output)
+        _upload_to_s3(s3Client=s3Client, s3Bucket=s3_bucket, localFile=local_file, s3ObjectKey=s3_object_key, s3ExtraArgs=s3_extra_args,
+                      transferConfig=transferConfig, print_output=print_output)
     except APIConnectionError:
         raise
 
     print("Upload complete.")
 
 
-def restore_snapshot(volume_name: str, snapshot_name: str, cluster_name: str = None, svm_name : str = None, print_output: bool = False):
+def restore_snapshot(volume_name: str, snapshot_name: str, cluster_name: str = None, svm_name : str = None, wait: bool = True, print_output: bool = False):
     # Retrieve config details from config file
     try:
-        config = _retrieve_config(print_output=print_output)
+        config = _get_client(print_output=print_output).get_config()
     except InvalidConfigError:
         raise
     try:
@@ -1885,29 +4828,37 @@ def restore_snapshot(volume_name: str, snapshot_name: str, cluster_name: str = N
 
         try:
             # Retrieve volume
-            volume = NetAppVolume.find(name=volume_name, svm=svm)
+            volume = _find_volume(volume_name, svm)
             if not volume:
                 if print_output:
                     print("Error: Invalid volume name.")
                 raise InvalidVolumeParameterError("name")
 
             # Retrieve snapshot
-            snapshot = NetAppSnapshot.find(volume.uuid, name=snapshot_name)
+            snapshot = _find_snapshot(volume.uuid, snapshot_name)
             if not snapshot:
                 if print_output:
                     print("Error: Invalid snapshot name.")
                 raise InvalidSnapshotParameterError("name")
 
             # Restore snapshot
-            volume.patch(volume.uuid, **{"restore_to.snapshot.name": snapshot.name, "restore_to.snapshot.uuid": snapshot.uuid}, poll=True)
-            if print_output:
-                print("Snapshot restored successfully.")
+            response = volume.patch(volume.uuid, **{"restore_to.snapshot.name": snapshot.name, "restore_to.snapshot.uuid": snapshot.uuid}, poll=wait)
 
         except NetAppRestError as err:
             if print_output:
                 print("Error: ONTAP Rest API Error: ", err)
             raise APIConnectionError(err)
 
+        def finish_restore_snapshot():
+            # Restoring a snapshot deletes all subsequent snapshots
+            _invalidate_snapshot_cache(volume.uuid)
+            if print_output:
+                print("Snapshot restored successfully.")
+
+        if not wait:
+            return _submit_job(response, "restore snapshot " + volume_name + "@" + snapshot_name, on_success=finish_restore_snapshot)
+        finish_restore_snapshot()
+
     else:
         raise ConnectionTypeError()
 
@@ -1921,27 +4872,21 @@ def sync_cloud_sync_relationship(relationship_id: str, wait_until_complete: bool
     except InvalidConfigError:
         raise
 
-    # Obtain access token and account ID
-    try:
-        accessToken, accountId = _get_cloud_sync_access_parameters(refreshToken=refreshToken, print_output=print_output)
-    except APIConnectionError:
-        raise
-
     # Step 2: Trigger Cloud Sync sync
 
-    # Define parameters for API call
+    # Define parameters for API call; the access token and account ID are cached between calls
     url = "https://cloudsync.netapp.com/api/relationships/%s/sync" % relationship_id
     headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "x-account-id": accountId,
-        "Authorization": "Bearer " + accessToken
+        "Content-Type": "application/json"
     }
 
     # Call API to trigger sync
     if print_output:
         print("Triggering sync operation for Cloud Sync relationship (ID = " + relationship_id + ").")
-    response = requests.put(url = url, headers = headers)
+    try:
+        response = _call_cloud_sync_api("PUT", url=url, refreshToken=refreshToken, headers=headers, print_output=print_output)
+    except APIConnectionError:
+        raise
 
     # Check for API response status code of 202; if not 202, raise error
     if response.status_code != 202:
@@ -1958,16 +4903,12 @@ def sync_cloud_sync_relationship(relationship_id: str, wait_until_complete: bool
 
     if wait_until_complete:
         while True:
-            # Define parameters for API call
-            url = "https://cloudsync.netapp.com/api/relationships-v2/%s" % relationship_id
-            headers = {
-                "Accept": "application/json",
-                "x-account-id": accountId,
-                "Authorization": "Bearer " + accessToken
-            }
-
             # Call API to obtain status of sync operation
-            response = requests.get(url = url, headers = headers)
+            url = "https://cloudsync.netapp.com/api/relationships-v2/%s" % relationship_id
+            try:
+                response = _call_cloud_sync_api("GET", url=url, refreshToken=refreshToken, print_output=print_output)
+            except APIConnectionError:
+                raise
 
             # Parse response to retrieve status of sync operation
             try:
@@ -2006,11 +4947,80 @@ def sync_cloud_sync_relationship(relationship_id: str, wait_until_complete: bool
             # Sleep for 60 seconds before checking progress again
             time.sleep(60)
 
+
+def sync_cloud_sync_relationships(relationship_ids: list, wait_until_complete: bool = True, max_workers: int = 8, min_interval: int = 10,
+                                  max_interval: int = 60, timeout: int = None, print_output: bool = False) -> list():
+    # Retrieve refresh token
+    try:
+        refreshToken = _retrieve_cloud_central_refresh_token(print_output=print_output)
+    except InvalidConfigError:
+        raise
+
+    syncResults = collections.OrderedDict()
+    for relationshipId in relationship_ids:
+        syncResults[relationshipId] = _new_cloud_sync_sync_result(relationshipId)
+
+    # Record the latest activity of each relationship so that the triggered operations can be told apart from previous ones
+    previousActivities = dict()
+    if wait_until_complete and syncResults:
+        try:
+            previousActivities = _get_cloud_sync_activities(refreshToken=refreshToken, print_output=print_output)
+        except APIConnectionError:
+            raise
+
+    # Trigger all sync operations concurrently
+    if print_output:
+        print("Triggering sync operation for " + str(len(syncResults)) + " Cloud Sync relationship(s).")
+
+    def trigger_sync(relationshipId: str):
+        url = "https://cloudsync.netapp.com/api/relationships/%s/sync" % relationshipId
+        headers = {
+            "Content-Type": "application/json"
+        }
+        response = _call_cloud_sync_api("PUT", url=url, refreshToken=refreshToken, headers=headers)
+        if response.status_code != 202:
+            raise APIConnectionError("Error calling Cloud Sync API to trigger sync operation.", response)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_bind_to_current_context(trigger_sync), relationshipId): relationshipId for relationshipId in syncResults}
+        for future in as_completed(futures):
+            relationshipId = futures[future]
+            try:
+                future.result()
+            except APIConnectionError as err:
+                syncResults[relationshipId]["Status"] = "failed"
+                syncResults[relationshipId]["Error"] = err.args[0]
+                if len(err.args) > 1 and err.args[1] is not None:
+                    syncResults[relationshipId]["Error"] += " (HTTP " + str(err.args[1].status_code) + ": " + err.args[1].text + ")"
+                if print_output:
+                    print("Error: could not trigger sync operation for Cloud Sync relationship " + relationshipId + ": " + syncResults[relationshipId]["Error"])
+
+    if wait_until_complete:
+        if print_output:
+            print("Waiting for sync operations to complete.")
+        try:
+            _watch_cloud_sync_operations(syncResults, previousActivities, refreshToken=refreshToken, min_interval=min_interval,
+                                         max_interval=max_interval, timeout=timeout, print_output=print_output)
+        except APIConnectionError:
+            raise
+    else:
+        for syncResult in syncResults.values():
+            if syncResult["Status"] == "running":
+                syncResult["Status"] = "triggered"
+
+    # Print summary
+    if print_output:
+        syncResultsDF = pd.DataFrame.from_dict(list(syncResults.values()), dtype="string").fillna("")
+        print(tabulate(syncResultsDF, showindex=False, headers=syncResultsDF.columns))
+
+    return list(syncResults.values())
+
+
 def create_snap_mirror_relationship(source_svm: str, source_vol: str, target_vol: str, target_svm: str = None, cluster_name: str = None, 
-        schedule: str = '', policy: str = 'MirrorAllSnapshots', action: str = None, print_output: bool = False):
+        schedule: str = '', policy: str = 'MirrorAllSnapshots', action: str = None, wait: bool = True, print_output: bool = False):
     # Retrieve config details from config file
     try:
-        config = _retrieve_config(print_output=print_output)
+        config = _get_client(print_output=print_output).get_config()
     except InvalidConfigError:
         raise
     try:
@@ -2073,59 +5083,71 @@ def create_snap_mirror_relationship(source_svm: str, source_vol: str, target_vol
             if print_output:
                 print("Creating snapmirror relationship: "+source_svm+":"+source_vol+" -> "+target_svm+":"+target_vol)
             newRelationship = NetAppSnapmirrorRelationship.from_dict(newRelationDict)
-            newRelationship.post(poll=True, poll_timeout=120)
+            response = newRelationship.post(poll=wait, poll_timeout=120)
         except NetAppRestError as err:
             if print_output:
                 print("Error: ONTAP Rest API Error: ", err)
             raise APIConnectionError(err)
 
-        try:
-            if print_output:
-                print("Setting snapmirror policy as: "+policy+" schedule:"+schedule)
-                response = NetAppCLI().execute("snapmirror modify",destination_path=target_svm+":"+target_vol,body={"policy": policy, "schedule":schedule})
-        except NetAppRestError as err:
-            if print_output:
-                print("Error: ONTAP Rest API Error: ", err)
-            raise APIConnectionError(err)            
+        def finish_create_snap_mirror_relationship():
+            try:
+                if print_output:
+                    print("Setting snapmirror policy as: "+policy+" schedule:"+schedule)
+                    response = NetAppCLI().execute("snapmirror modify",destination_path=target_svm+":"+target_vol,body={"policy": policy, "schedule":schedule})
+            except NetAppRestError as err:
+                if print_output:
+                    print("Error: ONTAP Rest API Error: ", err)
+                raise APIConnectionError(err)            
 
-        try: 
-            uuid = None
-            relation = None
-            snapmirror_relationship = NetAppSnapmirrorRelationship.get_collection(**{"destination.path": target_svm+":"+target_vol})
-            for relation in snapmirror_relationship:
-                # Retrieve relationship details
+            try: 
+                uuid = None
+                relation = None
+                snapmirror_relationship = NetAppSnapmirrorRelationship.get_collection(**{"destination.path": target_svm+":"+target_vol})
+                for relation in snapmirror_relationship:
+                    # Retrieve relationship details
+                    try:
+                        relation.get()
+                        uuid = relation.uuid
+                    except NetAppRestError as err:
+                        if print_output:
+                            print("Error: ONTAP Rest API Error: ", err)
+                        raise APIConnectionError(err)
+                if not uuid:
+                    if print_output:
+                        print("Error: relationship was not created: "+target_svm+":"+target_vol)
+                    raise InvalidConfigError()
+            except NetAppRestError as err:
+                if print_output:
+                    print("Error: ONTAP Rest API Error: ", err)
+                raise APIConnectionError(err)
+
+            if action in ["resync","initialize"]:
                 try:
-                    relation.get()
-                    uuid = relation.uuid
+                    if print_output:
+                        print("Setting state to snapmirrored, action:"+action)
+                    patchRelation = NetAppSnapmirrorRelationship(uuid=uuid)
+                    patchRelation.state = "snapmirrored"
+                    patchRelation.patch(poll=True, poll_timeout=120)
                 except NetAppRestError as err:
                     if print_output:
                         print("Error: ONTAP Rest API Error: ", err)
-                    raise APIConnectionError(err)
-            if not uuid:
-                if print_output:
-                    print("Error: relationship was not created: "+target_svm+":"+target_vol)
-                raise InvalidConfigError()
-        except NetAppRestError as err:
-            if print_output:
-                print("Error: ONTAP Rest API Error: ", err)
-            raise APIConnectionError(err)
+                    raise APIConnectionError(err)                
+
+            return uuid
+
+        if not wait:
+            return _submit_job(response, "create snapmirror relationship " + source_svm+":"+source_vol+" -> "+target_svm+":"+target_vol,
+                               on_success=finish_create_snap_mirror_relationship)
+        finish_create_snap_mirror_relationship()
+
+    else:
+        raise ConnectionTypeError()
 
-        if action in ["resync","initialize"]:
-            try:
-                if print_output:
-                    print("Setting state to snapmirrored, action:"+action)
-                patchRelation = NetAppSnapmirrorRelationship(uuid=uuid)
-                patchRelation.state = "snapmirrored"
-                patchRelation.patch(poll=True, poll_timeout=120)
-            except NetAppRestError as err:
-                if print_output:
-                    print("Error: ONTAP Rest API Error: ", err)
-                raise APIConnectionError(err)                
 
 def sync_snap_mirror_relationship(uuid: str = None, svm_name: str = None, volume_name: str = None, cluster_name: str = None, wait_until_complete: bool = False, print_output: bool = False):
     # Retrieve config details from config file
     try:
-        config = _retrieve_config(print_output=print_output)
+        config = _get_client(print_output=print_output).get_config()
     except InvalidConfigError:
         raise
     try:
@@ -2193,49 +5215,408 @@ def sync_snap_mirror_relationship(uuid: str = None, svm_name: str = None, volume
             print("Sync operation successfully triggered.")
 
         if wait_until_complete:
-            # Wait to perform initial check
-            print("Waiting for sync operation to complete.")
-            print("Status check will be performed in 10 seconds...")
-            time.sleep(10)
-
-            while True:
-                # Retrieve relationship
-                relationship = NetAppSnapmirrorRelationship.find(uuid=uuid)
-                relationship.get()
+            if print_output:
+                print("Waiting for sync operation to complete.")
 
-                # Check status of sync operation
-                if hasattr(relationship, "transfer"):
-                    transferState = relationship.transfer.state
-                else:
-                    transferState = None
+            syncResults = {uuid: _new_snap_mirror_sync_result(uuid)}
+            try:
+                _watch_snap_mirror_transfers(syncResults, min_interval=10, max_interval=10, print_output=print_output)
+            except NetAppRestError as err:
+                if print_output:
+                    print("Error: ONTAP Rest API Error: ", err)
+                raise APIConnectionError(err)
 
-                # if transfer is complete, end execution
-                if (not transferState) or (transferState == "success"):
-                    healthy = relationship.healthy
-                    if healthy:
-                        if print_output:
-                            print("Success: Sync operation is complete.")
-                        break
+            syncResult = syncResults[uuid]
+            if syncResult["Status"] != "success":
+                if print_output:
+                    if syncResult["Error"] == "not healthy":
+                        print("Error: Relationship is not healthy. Access ONTAP System Manager for details.")
                     else:
+                        print("Error: Unknown sync operation status (" + syncResult["Error"] + ") returned by ONTAP API.")
+                raise SnapMirrorSyncOperationError(syncResult["Error"])
+            if print_output:
+                print("Success: Sync operation is complete.")
+
+    else:
+        raise ConnectionTypeError()
+
+
+def sync_snap_mirror_relationships(uuids: list = None, volume_names: list = None, svm_name: str = None, cluster_name: str = None,
+                                   wait_until_complete: bool = True, max_workers: int = 8, min_interval: int = 2, max_interval: int = 30,
+                                   timeout: int = None, print_output: bool = False) -> list():
+    # Retrieve config details from config file
+    try:
+        config = _get_client(print_output=print_output).get_config()
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+    except:
+        if print_output :
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    if cluster_name:
+        config["hostname"] = cluster_name 
+
+    if connectionType == "ONTAP":
+        # Instantiate connection to ONTAP cluster
+        try:
+            _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+        except InvalidConfigError:
+            raise
+
+        if not uuids and not volume_names:
+            if print_output:
+                print("Error: at least one relationship uuid or volume name must be specified.")
+            raise InvalidSnapMirrorParameterError("uuids/volume_names")
+
+        syncResults = collections.OrderedDict()
+        for uuid in (uuids or list()):
+            syncResults[uuid] = _new_snap_mirror_sync_result(uuid)
+
+        # Resolve destination volumes to relationships using a single collection query
+        if volume_names:
+            svm = config["svm"]
+            if svm_name:
+                svm = svm_name
+
+            try:
+                destinationPaths = [svm+":"+volume_name for volume_name in volume_names]
+                relationshipsByPath = dict()
+                for relationship in NetAppSnapmirrorRelationship.get_collection(fields="destination.path", **{"destination.path": "|".join(destinationPaths)}):
+                    relationshipsByPath[relationship.destination.path] = relationship.uuid
+
+                # Volumes without a relationship of their own may be protected by an svm-dr relationship
+                unresolvedPaths = set(destinationPaths) - set(relationshipsByPath)
+                if unresolvedPaths:
+                    for relationship in NetAppSnapmirrorRelationship.get_collection(fields="destination.path", **{"destination.path": svm+":"}):
                         if print_output:
-                            print("Error: Relationship is not healthy. Access ONTAP System Manager for details.")
-                        raise SnapMirrorSyncOperationError("not healthy")
-                elif transferState != "transferring":
+                            print("volume(s) " + ",".join(sorted(unresolvedPaths)) + " are part of svm-dr relationship: "+svm+":")
+                        for destinationPath in unresolvedPaths:
+                            relationshipsByPath[destinationPath] = relationship.uuid
+            except NetAppRestError as err:
+                if print_output:
+                    print("Error: ONTAP Rest API Error: ", err)
+                raise APIConnectionError(err)
+
+            for destinationPath in destinationPaths:
+                uuid = relationshipsByPath.get(destinationPath)
+                if not uuid:
                     if print_output:
-                        print ("Error: Unknown sync operation status (" + transferState + ") returned by ONTAP API.")
-                    raise SnapMirrorSyncOperationError(transferState)
-                else:
-                    # Print message re: progress
+                        print("Error: relationship could not be found for " + destinationPath + ".")
+                    raise SnapMirrorSyncOperationError("not found")
+                if uuid not in syncResults:
+                    syncResults[uuid] = _new_snap_mirror_sync_result(uuid, destinationPath)
+
+        # Trigger all sync operations concurrently
+        if print_output:
+            print("Triggering sync operation for " + str(len(syncResults)) + " SnapMirror relationship(s).")
+
+        def trigger_transfer(uuid: str):
+            transfer = NetAppSnapmirrorTransfer(uuid)
+            transfer.post(poll=True)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_bind_to_current_context(trigger_transfer), uuid): uuid for uuid in syncResults}
+            for future in as_completed(futures):
+                uuid = futures[future]
+                try:
+                    future.result()
+                except NetAppRestError as err:
+                    syncResults[uuid]["Status"] = "failed"
+                    syncResults[uuid]["Error"] = str(err)
                     if print_output:
-                        print("Sync operation is not yet complete. Status:", transferState)
-                        print("Checking again in 10 seconds...")
+                        print("Error: could not trigger sync operation for relationship " + uuid + ": ", err)
+
+        if wait_until_complete:
+            if print_output:
+                print("Waiting for sync operations to complete.")
+            try:
+                _watch_snap_mirror_transfers(syncResults, min_interval=min_interval, max_interval=max_interval, timeout=timeout, print_output=print_output)
+            except NetAppRestError as err:
+                if print_output:
+                    print("Error: ONTAP Rest API Error: ", err)
+                raise APIConnectionError(err)
+        else:
+            for syncResult in syncResults.values():
+                if syncResult["Status"] == "transferring":
+                    syncResult["Status"] = "triggered"
+
+        # Print summary
+        if print_output:
+            syncResultsDF = pd.DataFrame.from_dict(list(syncResults.values()), dtype="string").fillna("")
+            print(tabulate(syncResultsDF, showindex=False, headers=syncResultsDF.columns))
 
-                # Sleep for 10 seconds before checking progress again
-                time.sleep(10)
+        return list(syncResults.values())
 
     else:
         raise ConnectionTypeError()
 
+
+#
+# Asynchronous ONTAP jobs
+#
+
+
+class OntapJob(Future):
+    """Handle for an ONTAP operation submitted with wait=False; a concurrent.futures.Future that completes when the ONTAP job finishes"""
+
+    def __init__(self, job_id: str, description: str, connection: NetAppHostConnection = None, on_success=None):
+        super().__init__()
+        self.job_id = job_id
+        self.description = description
+        self.state = None
+        self.message = None
+        self._connection = connection
+        self._on_success = on_success
+        self.set_running_or_notify_cancel()
+
+    def __repr__(self):
+        return "<OntapJob " + str(self.description) + " job_id=" + str(self.job_id) + " state=" + str(self.state) + ">"
+
+
+class _JobPoller:
+    """Single background poller that tracks all outstanding OntapJob handles"""
+
+    def __init__(self, return_timeout: int = 15, shared_return_timeout: int = 2, max_poll_errors: int = 3):
+        self.return_timeout = return_timeout
+        self.shared_return_timeout = shared_return_timeout
+        self.max_poll_errors = max_poll_errors
+        self._jobs = collections.OrderedDict()
+        self._jobsRegistered = False
+        self._pollErrors = collections.Counter()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._finalizers = ThreadPoolExecutor(max_workers=4, thread_name_prefix="netapp_dataops_job")
+
+    def register(self, job: OntapJob):
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._jobsRegistered = True
+            if not self._thread:
+                self._thread = threading.Thread(target=self._run, name="netapp_dataops_job_poller", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._jobs:
+                    # Exit when there is nothing left to track; register() starts a new thread when needed
+                    self._thread = None
+                    return
+                jobsByConnection = collections.defaultdict(list)
+                for job in self._jobs.values():
+                    jobsByConnection[job._connection].append(job)
+                jobsRegistered, self._jobsRegistered = self._jobsRegistered, False
+
+            # Retrieve the state of all outstanding jobs with one collection query per cluster
+            anyFinished = False
+            for connection, jobs in jobsByConnection.items():
+                try:
+                    finishedJobs = _get_finished_jobs([job.job_id for job in jobs], connection=connection)
+                    self._pollErrors[connection] = 0
+                except NetAppRestError as err:
+                    self._pollErrors[connection] += 1
+                    if self._pollErrors[connection] >= self.max_poll_errors:
+                        for job in jobs:
+                            self._complete(job, error=APIConnectionError(err))
+                        anyFinished = True
+                    continue
+                for job in jobs:
+                    if job.job_id in finishedJobs:
+                        finishedJob = finishedJobs[job.job_id]
+                        job.state = finishedJob.state
+                        job.message = getattr(finishedJob, "message", None)
+                        if finishedJob.state == "success":
+                            self._complete(job)
+                        else:
+                            self._complete(job, error=APIConnectionError(job.message))
+                        anyFinished = True
+
+            if anyFinished:
+                continue
+
+            # Nothing finished yet; long-poll the oldest outstanding job rather than sleeping for a fixed interval. The long-poll only returns
+            # early when that job finishes, so it is kept short while other jobs (possibly on other clusters) are outstanding as well, and
+            # right after jobs were registered, since further jobs are often submitted in quick succession.
+            oldestJob = next(iter(jobsByConnection.values()))[0]
+            if jobsRegistered or sum(len(jobs) for jobs in jobsByConnection.values()) > 1:
+                returnTimeout = self.shared_return_timeout
+            else:
+                returnTimeout = self.return_timeout
+            try:
+                NetAppJob(uuid=oldestJob.job_id).get(connection=oldestJob._connection, fields="state", return_timeout=returnTimeout)
+            except NetAppRestError:
+                time.sleep(1)
+
+    def _complete(self, job: OntapJob, error: Exception = None):
+        with self._lock:
+            self._jobs.pop(job.job_id, None)
+        if error:
+            job.state = job.state or "failure"
+            job.set_exception(error)
+        elif job._on_success:
+            # Follow-up steps may issue further API calls; run them off the poller thread
+            self._finalizers.submit(_finish_job, job)
+        else:
+            job.set_result(None)
+
+
+def _finish_job(job: OntapJob):
+    try:
+        job.set_result(job._on_success())
+    except Exception as err:
+        job.set_exception(err)
+
+
+_jobPoller = _JobPoller()
+
+
+def _submit_job(response, description: str, on_success=None) -> OntapJob:
+    # Track the job referenced by a response to a request that was sent with poll=False
+    connection = NetAppHostConnection.get_host_context() or netappConfig.CONNECTION
+    job = OntapJob(job_id=_get_job_id(response), description=description, connection=connection,
+                   on_success=_bind_to_current_context(on_success) if on_success else None)
+    if job.job_id:
+        _jobPoller.register(job)
+    else:
+        # The operation completed synchronously
+        job.state = "success"
+        if on_success:
+            _finish_job(job)
+        else:
+            job.set_result(None)
+    return job
+
+
+def _completed_job(description: str, result=None) -> OntapJob:
+    # Handle for an operation that did not need to submit an ONTAP job
+    job = OntapJob(job_id=None, description=description)
+    job.state = "success"
+    job.set_result(result)
+    return job
+
+
+#
+# Reusable client session
+#
+
+
+def _bind_to_client(func):
+    # Expose a module-level function as a DataOpsClient method that runs against that client
+    @functools.wraps(func)
+    def client_method(self, *args, **kwargs):
+        with self:
+            return func(*args, **kwargs)
+    return client_method
+
+
+class DataOpsClient:
+    """Session object that loads the config file once and keeps ONTAP connections alive across calls"""
+
+    def __init__(self, config: dict = None, config_dir_path: str = "~/.netapp_dataops", config_filename: str = "config.json",
+                 pool_size: int = 10, print_output: bool = False):
+        self.pool_size = pool_size
+        self._configFilePath = os.path.join(os.path.expanduser(config_dir_path), config_filename)
+        self._config = config
+        self._configMtime = None
+        self._connections = dict()
+        self._lock = threading.RLock()
+        self._previousClients = threading.local()
+
+        # Load config file up front so that an invalid config is reported immediately
+        if self._config is None:
+            self._load_config(print_output=print_output)
+
+    def __enter__(self):
+        # Bind client to the current thread so that module-level functions run against it
+        if not hasattr(self._previousClients, "stack"):
+            self._previousClients.stack = list()
+        self._previousClients.stack.append((getattr(_clientContext, "client", None), NetAppHostConnection.get_host_context()))
+        _clientContext.client = self
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        # Restore the ONTAP connection that was bound to the current thread when the context was entered
+        _clientContext.client, previousConnection = self._previousClients.stack.pop()
+        _set_host_context(previousConnection)
+
+    def _load_config(self, print_output: bool = False):
+        try:
+            configMtime = os.path.getmtime(self._configFilePath)
+        except OSError:
+            configMtime = None
+
+        # Re-read config file only if it has changed since it was last loaded
+        if self._config is None or configMtime != self._configMtime:
+            configDirPath, configFilename = os.path.split(self._configFilePath)
+            self._config = _retrieve_config(configDirPath=configDirPath, configFilename=configFilename, print_output=print_output)
+            self._configMtime = configMtime
+
+    def get_config(self, print_output: bool = False) -> dict:
+        with self._lock:
+            if self._configMtime is not None:
+                self._load_config(print_output=print_output)
+            # Callers are free to modify the returned config (e.g. to override the hostname)
+            return copy.deepcopy(self._config)
+
+    def get_connection(self, config: dict = None, cluster_name: str = None, print_output: bool = False) -> NetAppHostConnection:
+        if not config:
+            config = self.get_config(print_output=print_output)
+        if cluster_name:
+            config["hostname"] = cluster_name
+
+        # Connections are keyed by host and credentials so that cluster_name overrides get their own connection
+        try:
+            connectionKey = (config["hostname"], config["username"], config["password"], config["verifySSLCert"])
+        except:
+            if print_output:
+                _print_invalid_config_error()
+            raise InvalidConfigError()
+
+        with self._lock:
+            if connectionKey not in self._connections:
+                self._connections[connectionKey] = _create_ontap_connection(config=config, pool_size=self.pool_size, print_output=print_output)
+            return self._connections[connectionKey]
+
+    def close(self):
+        with self._lock:
+            for connection in self._connections.values():
+                connection.session.close()
+            self._connections.clear()
+
+    clone_volume = _bind_to_client(clone_volume)
+    clone_volumes = _bind_to_client(clone_volumes)
+    create_snapshot = _bind_to_client(create_snapshot)
+    create_volume = _bind_to_client(create_volume)
+    delete_snapshot = _bind_to_client(delete_snapshot)
+    delete_volume = _bind_to_client(delete_volume)
+    iter_s3_objects = _bind_to_client(iter_s3_objects)
+    list_cloud_sync_relationships = _bind_to_client(list_cloud_sync_relationships)
+    generate_automount_map = _bind_to_client(generate_automount_map)
+    list_mount_profiles = _bind_to_client(list_mount_profiles)
+    list_snap_mirror_relationships = _bind_to_client(list_snap_mirror_relationships)
+    list_snapshots = _bind_to_client(list_snapshots)
+    list_volumes = _bind_to_client(list_volumes)
+    mount_volume = _bind_to_client(mount_volume)
+    mount_volumes = _bind_to_client(mount_volumes)
+    unmount_volume = _bind_to_client(unmount_volume)
+    unmount_volumes = _bind_to_client(unmount_volumes)
+    prepopulate_flex_cache = _bind_to_client(prepopulate_flex_cache)
+    prune_snapshots = _bind_to_client(prune_snapshots)
+    pull_bucket_from_s3 = _bind_to_client(pull_bucket_from_s3)
+    pull_object_from_s3 = _bind_to_client(pull_object_from_s3)
+    push_directory_to_s3 = _bind_to_client(push_directory_to_s3)
+    push_file_to_s3 = _bind_to_client(push_file_to_s3)
+    restore_snapshot = _bind_to_client(restore_snapshot)
+    sync_cloud_sync_relationship = _bind_to_client(sync_cloud_sync_relationship)
+    sync_cloud_sync_relationships = _bind_to_client(sync_cloud_sync_relationships)
+    create_snap_mirror_relationship = _bind_to_client(create_snap_mirror_relationship)
+    sync_snap_mirror_relationship = _bind_to_client(sync_snap_mirror_relationship)
+    sync_snap_mirror_relationships = _bind_to_client(sync_snap_mirror_relationships)
+
+
 #
 # Deprecated function names
 #